@@ -0,0 +1,433 @@
+﻿from urllib.parse import urlencode
+from typing import AsyncIterator, List, Sequence, Tuple, Union, \
+    Optional
+
+import httpx
+
+from .api import SEARCH_ITEM_TYPE, SpotifyAPI
+from .authentication.authorization_code_flow_pkce import PKCE
+from .batching import AsyncItemBatcher, async_get_in_batches
+from .cache import CacheEntry, EntityCache, ResponseCache
+from .coalescing import SingleFlight
+from .numeric import AUDIO_FEATURE_COLUMNS, FeatureMatrix, \
+    async_get_audio_features_matrix
+from .object_library import SpotifyObject, AlbumObject, ErrorObject, \
+    PagingObject, CursorPagingObject, SimplifiedTrackObject, ArtistObject, \
+    TrackObject, SimplifiedAlbumObject, CategoryObject, \
+    SimplifiedPlaylistObject, \
+    RecommendationsObject, EpisodeObject, SavedAlbumObject, ImageObject, \
+    SimplifiedShowObject, SimplifiedEpisodeObject, AudioFeaturesObject, \
+    SavedShowObject, SavedEpisodeObject, SavedTrackObject, PlayHistoryObject, \
+    PlaylistObject, ShowObject, AudioAnalysisObject, UserObject, \
+    PlaylistTrackObject, get_union_parser
+from .pagination import async_fetch_all, async_iter_items, \
+    async_iter_pages
+from .playlist import AsyncPlaylistWriter
+from .playlist_sync import PlaylistDiff, async_sync_playlist
+from .saved_items import SAVED_ITEMS_METHODS, SavedItemsIndex, \
+    async_refresh_saved_items
+from .scheduler import RequestScheduler
+from .utilities import requires, cache_entity, cache_entities, \
+    hash_request, json_loads
+
+
+class AsyncSpotifyAPI:
+    """Asyncio version of SpotifyAPI. Every endpoint method is a coroutine
+    and all of them share one pooled httpx.AsyncClient, so thousands of
+    calls can be awaited concurrently without a thread per request.
+
+    Args:
+        client: Optional; The httpx.AsyncClient to send requests through. A
+            pooled client is created when it is not given.
+        max_connections: The maximum number of concurrent connections of the
+            created client.
+        max_keepalive_connections: The maximum number of idle connections
+            the created client keeps alive.
+        timeout: The number of seconds to wait for the server before giving
+            up on a request.
+        cache: Optional; The cache of GET responses.
+        entity_cache: Optional; The in-memory cache of decoded objects.
+        scheduler: Optional; The scheduler pacing the requests. It can be
+            shared with a SpotifyAPI client using the same token. The
+            default one retries rate limited requests without pacing them.
+        coalesce: Whether identical GET requests awaited while one is in
+            flight share its response.
+        saved_index: Optional; The index of the user's saved items, which
+            answers the checks of its loaded types without a request.
+    """
+    _headers = {'Accept': ''}
+
+    def __init__(self,
+                 client: Optional[httpx.AsyncClient] = None,
+                 max_connections: int = 100,
+                 max_keepalive_connections: int = 20,
+                 timeout: Optional[float] = 10.0,
+                 cache: Optional[ResponseCache] = None,
+                 entity_cache: Optional[EntityCache] = None,
+                 scheduler: Optional[RequestScheduler] = None,
+                 coalesce: bool = True,
+                 saved_index: Optional[SavedItemsIndex] = None):
+        self._flow = PKCE()
+        self._credentials: dict = self._flow.get_credentials()
+        self._access_token: str = self._credentials['access_token']
+        self._scopes: str = self._credentials['scope']
+        self._headers = {
+            'Accept': 'application/json',
+            'Content-Type': 'application/json',
+            'Authorization': f'Bearer {self._access_token}'
+        }
+        self._client = client or httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections),
+            timeout=timeout)
+        self._cache = cache
+        self._entity_cache = entity_cache
+        self._scheduler = scheduler or RequestScheduler()
+        self._single_flight = SingleFlight() if coalesce else None
+        self._saved_index = saved_index
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    @property
+    def credentials(self):
+        """Return the credentials TODO: Explain"""
+        return self._credentials
+
+    @property
+    def access_token(self):
+        """Return the access_token TODO: Explain"""
+        return self._access_token
+
+    @property
+    def scopes(self):
+        """Return the scopes TODO: Explain"""
+        return self._scopes
+
+    @property
+    def headers(self):
+        """Return the headers TODO: Explain"""
+        return self._headers
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Return the async client every request is sent through."""
+        return self._client
+
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        """Return the cache of GET responses, if the client has one."""
+        return self._cache
+
+    @property
+    def entity_cache(self) -> Optional[EntityCache]:
+        """Return the in-memory cache of decoded objects, if the client has
+        one."""
+        return self._entity_cache
+
+    @property
+    def scheduler(self) -> RequestScheduler:
+        """Return the scheduler pacing every request of this client."""
+        return self._scheduler
+
+    @property
+    def single_flight(self) -> Optional[SingleFlight]:
+        """Return the coalescer of identical in-flight GET requests, unless
+        coalescing is turned off."""
+        return self._single_flight
+
+    @property
+    def saved_index(self) -> Optional[SavedItemsIndex]:
+        """Return the index of the user's saved items, if the client has
+        one."""
+        return self._saved_index
+
+    async def aclose(self) -> None:
+        """Close the async client and its pooled connections."""
+        await self._client.aclose()
+
+    async def _request(self, http_method: str, url: str, query_params: dict,
+                       json_body: dict) -> Tuple[dict, bool]:
+        """Send the request through the shared async client and decode the
+        json response. The saved items index, if the client has one, answers
+        the checks of its loaded types and records the saves and removals.
+
+        Returns:
+            The decoded json (or the error dictionary) and whether the
+            response is an error.
+        """
+        params = self._convert_query_params(query_params)
+        json_body = self._convert_json_body(json_body)
+        if self._saved_index is not None:
+            saved = self._saved_index.lookup(http_method, url, params)
+            if saved is not None:
+                return saved, False
+        cache_key, cached, headers = self._check_cache(http_method, url,
+                                                       params)
+        if cached and cached.fresh:
+            return self._project(params, json_loads(cached.body)), False
+
+        def fetch():
+            return self._fetch(http_method, url, params, json_body, headers,
+                               cache_key, cached)
+
+        try:
+            if http_method == 'GET' and self._single_flight is not None:
+                response, cached_body = await self._single_flight.async_do(
+                    hash_request(url, params), fetch)
+            else:
+                response, cached_body = await fetch()
+        except httpx.HTTPError as e:
+            return {'status': 'ConnectionError', 'message': str(e)}, True
+        if cached_body is not None:
+            return self._project(params, json_loads(cached_body)), False
+        json_dict, error = self._decode_response(http_method, response)
+        if error:
+            return json_dict, error
+        if self._saved_index is not None:
+            self._saved_index.record(http_method, url, params)
+        return self._project(params, json_dict), error
+
+    async def _fetch(self, http_method: str, url: str, params: dict,
+                     json_body: dict, headers: dict, cache_key: Optional[str],
+                     cached: Optional[CacheEntry]
+                     ) -> Tuple[httpx.Response, Optional[bytes]]:
+        """Send the request through the scheduler and the async client and
+        store the response in the cache. See SpotifyAPI._fetch."""
+        response = await self._scheduler.async_send(
+            lambda: self._client.request(http_method,
+                                         url,
+                                         params=params or None,
+                                         json=json_body or None,
+                                         headers=headers),
+            http_method)
+        if cache_key and self._update_cache(cache_key, cached, url, response):
+            return response, cached.body
+        return response, None
+
+    async def _get(self, url, query_params, json_body) -> Tuple[dict, bool]:
+        return await self._request('GET', url, query_params, json_body)
+
+    async def _put(self, url, query_params, json_body) -> Tuple[dict, bool]:
+        return await self._request('PUT', url, query_params, json_body)
+
+    async def _post(self, url, query_params, json_body) -> Tuple[dict, bool]:
+        return await self._request('POST', url, query_params, json_body)
+
+    async def _delete(self, url, query_params,
+                      json_body) -> Tuple[dict, bool]:
+        return await self._request('DELETE', url, query_params, json_body)
+
+    _check_cache = SpotifyAPI._check_cache
+    _update_cache = SpotifyAPI._update_cache
+    _project = staticmethod(SpotifyAPI._project)
+    _decode_response = staticmethod(SpotifyAPI._decode_response)
+    _convert_query_params = staticmethod(SpotifyAPI._convert_query_params)
+    _convert_json_body = staticmethod(SpotifyAPI._convert_json_body)
+    _convert_array_to_list = staticmethod(SpotifyAPI._convert_array_to_list)
+
+    async def get_in_batches(self, method_name: str, ids: List[str],
+                             max_concurrency: Optional[int] = None,
+                             **kwargs) -> List[Optional[SpotifyObject]]:
+        """
+        Call a bulk method such as get_several_tracks with any number of
+        ids. The ids are split into chunks of the endpoint's maximum size,
+        the chunks are requested concurrently and the results are merged
+        back into the order of the ids.
+
+        Args:
+            method_name: The name of the bulk method, e.g.
+                'get_several_tracks'.
+            ids: The Spotify IDs to request.
+            max_concurrency: Optional; The maximum number of chunks requested
+                at once.
+            **kwargs: Extra arguments passed to every request, e.g. market.
+        """
+        return await async_get_in_batches(self, method_name, ids,
+                                          max_concurrency, **kwargs)
+
+    def item_batcher(self, method_name: str, max_delay: float = 0.01,
+                     **kwargs) -> AsyncItemBatcher:
+        """
+        Create an AsyncItemBatcher which merges concurrent calls of a
+        single-item getter such as get_a_track into bulk requests.
+
+        Args:
+            method_name: The single-item getter to merge, e.g. 'get_a_track'.
+            max_delay: The number of seconds to wait for more ids before a
+                partial batch is sent.
+            **kwargs: Extra arguments passed to every bulk request.
+        """
+        return AsyncItemBatcher(self, method_name, max_delay, **kwargs)
+
+    def playlist_writer(self, playlist_id: str,
+                        snapshot_id: Optional[str] = None
+                        ) -> AsyncPlaylistWriter:
+        """
+        Create an AsyncPlaylistWriter which adds, replaces and removes any
+        number of items of the playlist in requests of at most 100 items,
+        chaining the snapshot id of each write into the next one.
+
+        Args:
+            playlist_id: The Spotify ID of the playlist.
+            snapshot_id: Optional; The snapshot id of the playlist the first
+                write is sent against.
+        """
+        return AsyncPlaylistWriter(self, playlist_id, snapshot_id)
+
+    async def sync_playlist(self, playlist_id: str, uris: Sequence[str]
+                            ) -> Tuple[PlaylistDiff, Optional[str]]:
+        """
+        Bring the playlist to the target uris with the fewest removals,
+        range moves and insertions, applied in chunks chained by snapshot id.
+
+        Args:
+            playlist_id: The Spotify ID of the playlist.
+            uris: The target uris, in order.
+
+        Returns:
+            The applied diff and the snapshot id of the synced playlist.
+        """
+        return await async_sync_playlist(self, playlist_id, uris)
+
+    async def refresh_saved_items(
+            self, item_types: Optional[Sequence[str]] = None) -> None:
+        """
+        Load the user's saved items of each type into the saved_index, or
+        add the items saved since the previous refresh.
+
+        Args:
+            item_types: The types to refresh among 'tracks', 'albums',
+                'episodes' and 'shows'. Defaults to all of them.
+        """
+        for item_type in item_types or SAVED_ITEMS_METHODS:
+            await async_refresh_saved_items(self, item_type)
+
+    def iter_pages(self, method_name: str, *args, prefetch: int = 0,
+                   max_items: Optional[int] = None,
+                   **kwargs) -> AsyncIterator[Union[PagingObject,
+                                                    CursorPagingObject]]:
+        """
+        Lazily yield every page of a method returning a PagingObject or a
+        CursorPagingObject, following each page's next url on demand.
+
+        Args:
+            method_name: The name of the method, e.g. 'get_a_playlists_items'.
+            *args: The arguments of the method.
+            prefetch: The number of pages requested ahead in a background
+                task while the current page is processed.
+            max_items: Optional; Stop once this many items have been yielded.
+            **kwargs: The keyword arguments of the method.
+        """
+        return async_iter_pages(self, method_name, *args, prefetch=prefetch,
+                                max_items=max_items, **kwargs)
+
+    def iter_items(self, method_name: str, *args, prefetch: int = 0,
+                   max_items: Optional[int] = None,
+                   **kwargs) -> AsyncIterator[SpotifyObject]:
+        """
+        Lazily yield every item of every page of a method returning a
+        PagingObject or a CursorPagingObject. Takes the same arguments as
+        iter_pages.
+        """
+        return async_iter_items(self, method_name, *args, prefetch=prefetch,
+                                max_items=max_items, **kwargs)
+
+    async def fetch_all(self, method_name: str, *args,
+                        max_concurrency: int = 8, **kwargs) -> list:
+        """
+        Request the first page of an offset based method such as
+        get_a_playlists_items, then request every remaining page at once
+        using the first page's total and return all the items in order.
+        search_for_an_item returns one list of items per searched type.
+
+        Args:
+            method_name: The name of the method, e.g. 'get_a_playlists_items'.
+            *args: The arguments of the method.
+            max_concurrency: The maximum number of pages requested at once.
+            **kwargs: The keyword arguments of the method. The limit of the
+                first page is used for every page.
+        """
+        return await async_fetch_all(self, method_name, *args,
+                                     max_concurrency=max_concurrency,
+                                     **kwargs)
+
+    async def get_audio_features_matrix(
+            self, ids: List[str], max_concurrency: Optional[int] = None,
+            columns: Sequence[str] = AUDIO_FEATURE_COLUMNS,
+            dtype: str = 'float32') -> FeatureMatrix:
+        """
+        Columnar version of get_audio_features_for_several_tracks. Requests
+        any number of IDs, 100 per request, and decodes the features
+        straight into a matrix, float32 unless another dtype is given,
+        without creating an AudioFeaturesObject per track. Requires numpy.
+
+        Args:
+            ids: The Spotify IDs of the tracks.
+            max_concurrency: Optional; The maximum number of chunks requested
+                at once. All chunks are requested at once if omitted.
+            columns: The features to keep, in column order.
+            dtype: The dtype of the matrix. 'float64' keeps duration_ms
+                exact.
+        """
+        return await async_get_audio_features_matrix(self, ids,
+                                                     max_concurrency, columns,
+                                                     dtype)
+
+    async def search_for_an_item(
+            self,
+            q: str,
+            type_: List[str],
+            market: str = None,
+            limit: int = None,
+            offset: int = None,
+            include_external: str = None
+    ) -> Union[List[PagingObject[Union[ArtistObject, SimplifiedAlbumObject,
+                                       SimplifiedPlaylistObject,
+                                       TrackObject, SimplifiedShowObject,
+                                       SimplifiedEpisodeObject]]],
+               ErrorObject]:
+        """
+        Get Spotify Catalog information about albums, artists, playlists,
+        tracks, shows or episodes that match a keyword string.
+
+        Args:
+            q: Search query keywords and optional field filters and operators
+            type_: A list of strings of the item types to search across. Valid
+                types are: 'album', 'artist', 'playlist', 'track', 'show' and
+                'episode'.
+            market: Optional; An ISO 3166-1 alpha-2 country code or the string
+                'from_token'.
+            limit: Optional; Maximum number of results to return. Default: 20.
+                Minimum: 1. Maximum: 50. Note: The limit is applied within each
+                type, not the total response. For example, if the limit value
+                is 3 and the type is ['artist', 'album'], the response contains
+                3 artists and 3 albums.
+            offset: Optional; The index of the first result to return. Default:
+                0. Maximum: 1,000. Use with limit to get the next page of
+                search results.
+            include_external: Optional; Possible values: 'audio'. If 'audio' is
+                specified the response will include any relevant audio content
+                that is hosted externally. By default external content is
+                filtered out from responses.
+        """
+
+        url = f'https://api.spotify.com/v1/search?'
+        path_params = dict(q=q, type=','.join(type_), market=market,
+                           limit=limit, offset=offset,
+                           include_external=include_external)
+        active_path_params = {key: value for key, value in path_params.items()
+                              if value is not None}
+        url += urlencode(active_path_params)
+        query_params = {}
+        json_body = {}
+        response, error = await self._get(url, query_params, json_body)
+        if error:
+            return ErrorObject(response)
+        return [PagingObject(value, SEARCH_ITEM_TYPE)
+                for value in response.values()]
+
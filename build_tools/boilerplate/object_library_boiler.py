@@ -2,28 +2,78 @@
 
 from collections.abc import Sequence
 from datetime import datetime
-import json
-from typing import Dict, List, Optional, Type, TypeVar, Union, Generic
+from functools import lru_cache
+from typing import List, Optional, Tuple, Type, TypeVar, Union, Generic, \
+    TYPE_CHECKING
 
-# from .utilities import cached_static_property
+from .utilities import json_dumps, json_loads, memoized_property
+
+if TYPE_CHECKING:
+    import numpy as np
 
 T = TypeVar('T')
 
 
-def union_parser(classes: List[Type[T]], value: Dict[str, str]) -> Union[T]:
-    ...
+class UnionParser:
+    """Wraps each value in the class of a Union whose object type matches
+    the value's 'type' field. Values without a type field get the first
+    class and values of an unknown type a plain SpotifyObject. Projections
+    always request the type of a Union, so their values are dispatched too.
+    Use get_union_parser so each Union builds its dispatch table once.
+
+    Args:
+        *classes: The classes of the Union. None allows null values.
+    """
+    __slots__ = ('classes', 'dispatch', '__name__')
+
+    def __init__(self, *classes: Optional[Type[T]]):
+        self.classes = tuple(cls for cls in classes if cls is not None)
+        self.dispatch = {OBJECT_TYPES[cls]: cls for cls in self.classes
+                         if cls in OBJECT_TYPES}
+        names = ', '.join(cls.__name__ for cls in self.classes)
+        self.__name__ = f'Union[{names}]'
+
+    def __call__(self, value: Optional[dict]) -> Optional[T]:
+        if value is None:
+            return None
+        if 'type' not in value:
+            return self.classes[0](value)
+        return self.dispatch.get(value['type'], SpotifyObject)(value)
+
+    def __reduce__(self):
+        return get_union_parser, self.classes
+
+    def __repr__(self):
+        return self.__name__
+
+
+@lru_cache(maxsize=None)
+def get_union_parser(*classes: Optional[Type[T]]) -> UnionParser:
+    """Return the shared UnionParser of the classes."""
+    return UnionParser(*classes)
+
+
+def union_parser(classes: Tuple[Optional[Type[T]], ...],
+                 value: Optional[dict]) -> Optional[T]:
+    """Wrap the value in the class of the Union matching its 'type'
+    field. See UnionParser."""
+    return get_union_parser(*classes)(value)
 
 
 class SpotifyObject:
-    """Baby cat."""
+    """Baby cat.
+
+    Only the decoded json dictionary is stored and the classes use
+    __slots__, so an instance carries no __dict__ and holds its payload
+    once. Nested objects are wrapped on first access and memoized in the
+    _memo slot.
+    """
+    __slots__ = ('_json_dict', '_memo')
 
-    def __init__(self, json_object: Optional[str, dict]):
-        if isinstance(json_object, dict):
-            self._json_string = json.dumps(json_object)
-            self._json_dict = json_object
-        elif isinstance(json_object, str):
-            self._json_string = json_object
-            self._json_dict = json.loads(json_object)
+    def __init__(self, json_object: Optional[str, bytes, dict]):
+        if isinstance(json_object, (str, bytes)):
+            json_object = json_loads(json_object)
+        self._json_dict = json_object
 
         # TODO: What is this?
         # self._set_attributes(self._json_dict)
@@ -34,6 +84,16 @@ class SpotifyObject:
     def __str__(self):
         return str(self._json_dict)
 
+    def __reduce__(self):
+        # Pickle the decoded json only. The memoized nested objects are
+        # rebuilt lazily on the other side.
+        return self.__class__, (self._json_dict,)
+
+    @property
+    def _json_string(self) -> str:
+        """The json of the object, encoded only when it is asked for."""
+        return json_dumps(self._json_dict)
+
     def _set_attributes(self, json_dict: dict):
         ...
 
@@ -41,24 +101,53 @@ class SpotifyObject:
 class PagingObject(Sequence, Generic[T], SpotifyObject):
     """
     PagingObject doc string...
+
+    The items are wrapped in item_type lazily, one index at a time on first
+    access, and the wrapped items are kept. Iterating, indexing, slicing and
+    len therefore cost O(1) per item however often the page is used.
     """
+    __slots__ = ('item_type', '_items')
 
-    def __init__(self, json_object: Optional[str, dict], item_type: Type[T]):
-        json_dict = json_object
-        print(json_dict.keys())
-        if len(json_dict.keys()) < 3:
-            json_object = list(json_dict.values())[-1]
+    def __init__(self, json_object: Optional[str, bytes, dict],
+                 item_type: Type[T] = SpotifyObject):
+        if isinstance(json_object, (str, bytes)):
+            json_object = json_loads(json_object)
+        if len(json_object) < 3:
+            json_object = list(json_object.values())[-1]
         super().__init__(json_object)
         self.item_type = item_type
+        self._items: List[Optional[T]] = [None] * len(json_object['items'])
 
     def __getitem__(self, i):
-        return self.items[i]
+        if isinstance(i, slice):
+            return [self._get_item(j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('PagingObject index out of range')
+        return self._get_item(i)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._get_item(i)
 
     def __len__(self):
-        return len(self.items)
+        return len(self._items)
 
     def __repr__(self):
-        return f'<PagingObject items={self.items}>'
+        return f'<{self.__class__.__name__} items={self.items}>'
+
+    def __reduce__(self):
+        return _restore_page, (self.__class__, self._json_dict,
+                               self.item_type)
+
+    def _get_item(self, i: int) -> T:
+        """Return the item at index i, wrapping it on first access."""
+        item = self._items[i]
+        if item is None:
+            item = self._items[i] = self.item_type(
+                self._json_dict['items'][i])
+        return item
 
     @property
     def href(self) -> str:
@@ -73,7 +162,7 @@ class PagingObject(Sequence, Generic[T], SpotifyObject):
         """
         The requested data.
         """
-        return [self.item_type(item) for item in self._json_dict['items']]
+        return self[:]
 
     @property
     def limit(self) -> int:
@@ -116,3 +205,109 @@ class PagingObject(Sequence, Generic[T], SpotifyObject):
         return int(self._json_dict['total'])
 
 
+def _restore_page(cls: Type[PagingObject], json_dict: dict,
+                  item_type: Type[T]) -> PagingObject[T]:
+    """Rebuild a pickled page from its stored json without unwrapping it
+    again."""
+    page = cls.__new__(cls)
+    SpotifyObject.__init__(page, json_dict)
+    page.item_type = item_type
+    page._items = [None] * len(json_dict['items'])
+    return page
+
+
+class CursorPagingObject(PagingObject[T]):
+    """
+    CursorPagingObject doc string...
+
+    Cursor based pages have no offset or previous url. The next page is
+    found with the cursors instead.
+    """
+    __slots__ = ()
+
+    @property
+    def cursors(self) -> CursorObject:
+        """
+        The cursors used to find the next set of items.
+        """
+        return CursorObject(self._json_dict['cursors'])
+
+
+class AudioAnalysisObject(SpotifyObject):
+    """
+    Audio Analysis Object docstring...
+
+    The bars, beats, tatums, sections and segments are NumPy structured
+    arrays, built once per object on first access. Requires numpy.
+    """
+    __slots__ = ()
+
+    def __repr__(self):
+        return f'<AudioAnalysisObject ' \
+               f'sections={len(self._json_dict.get("sections", []))}, ' \
+               f'segments={len(self._json_dict.get("segments", []))}>'
+
+    @property
+    def data(self) -> dict:
+        """
+        The raw json of the analysis. It is not copied.
+        """
+        return self._json_dict
+
+    @memoized_property
+    def bars(self) -> np.ndarray:
+        """
+        The start, duration and confidence of each bar.
+        """
+        return self._analysis_array('bars', 'INTERVAL_FIELDS')
+
+    @memoized_property
+    def beats(self) -> np.ndarray:
+        """
+        The start, duration and confidence of each beat.
+        """
+        return self._analysis_array('beats', 'INTERVAL_FIELDS')
+
+    @memoized_property
+    def tatums(self) -> np.ndarray:
+        """
+        The start, duration and confidence of each tatum.
+        """
+        return self._analysis_array('tatums', 'INTERVAL_FIELDS')
+
+    @memoized_property
+    def sections(self) -> np.ndarray:
+        """
+        The timing, loudness, tempo, key, mode and time signature of each
+        section.
+        """
+        return self._analysis_array('sections', 'SECTION_FIELDS')
+
+    @memoized_property
+    def segments(self) -> np.ndarray:
+        """
+        The timing, loudness, pitches and timbre of each segment.
+        """
+        return self._analysis_array('segments', 'SEGMENT_FIELDS')
+
+    @property
+    def pitches(self) -> np.ndarray:
+        """
+        The (n_segments, 12) float32 pitches of the segments, as a view.
+        """
+        return self.segments['pitches']
+
+    @property
+    def timbre(self) -> np.ndarray:
+        """
+        The (n_segments, 12) float32 timbre of the segments, as a view.
+        """
+        return self.segments['timbre']
+
+    def _analysis_array(self, key: str, fields_name: str) -> np.ndarray:
+        """Build the structured array of the intervals under key."""
+        from . import numeric
+        return numeric.analysis_array(self._json_dict.get(key, []),
+                                      getattr(numeric, fields_name))
+
+
@@ -1,38 +1,75 @@
-﻿import json
-from urllib.parse import urlencode
-from typing import List, Tuple, Union, Optional
+﻿from urllib.parse import urlencode
+from typing import Iterator, List, Sequence, Tuple, Union, Optional
 
-import requests
+from requests.exceptions import RequestException
 
+from .adaptive import AdaptiveProjector
 from .authentication.authorization_code_flow_pkce import PKCE
+from .batching import ItemBatcher, get_in_batches
+from .cache import CacheEntry, EntityCache, ResponseCache
+from .coalescing import SingleFlight
+from .library import LibraryQueue
+from .numeric import AUDIO_FEATURE_COLUMNS, FeatureMatrix, \
+    get_audio_features_matrix
 from .object_library import SpotifyObject, AlbumObject, ErrorObject, \
-    PagingObject, SimplifiedTrackObject, ArtistObject, TrackObject, \
-    SimplifiedAlbumObject, CategoryObject, SimplifiedPlaylistObject, \
+    PagingObject, CursorPagingObject, SimplifiedTrackObject, ArtistObject, \
+    TrackObject, SimplifiedAlbumObject, CategoryObject, \
+    SimplifiedPlaylistObject, \
     RecommendationsObject, EpisodeObject, SavedAlbumObject, ImageObject, \
     SimplifiedShowObject, SimplifiedEpisodeObject, AudioFeaturesObject, \
     SavedShowObject, SavedEpisodeObject, SavedTrackObject, PlayHistoryObject, \
-    PlaylistObject, ShowObject, AudioAnalysisObject, UserObject
-from .utilities import requires, CustomResponse
+    PlaylistObject, ShowObject, AudioAnalysisObject, UserObject, \
+    PlaylistTrackObject, get_union_parser
+from .pagination import fetch_all, iter_items, iter_pages
+from .playlist import PlaylistWriter
+from .playlist_sync import PlaylistDiff, sync_playlist
+from .projection import Projection
+from .saved_items import SAVED_ITEMS_METHODS, SavedItemsIndex, \
+    refresh_saved_items
+from .scheduler import RequestScheduler
+from .streaming import stream_audio_analysis, stream_items
+from .transport import HTTPTransport
+from .utilities import requires, cache_entity, cache_entities, \
+    hash_request, json_loads
 
-QUERY_DICT = {'albums': SimplifiedAlbumObject,
-              'artists': ArtistObject,
-              'playlists': PlaylistObject,
-              'tracks': TrackObject,
-              'shows': SimplifiedShowObject,
-              'episodes': SimplifiedEpisodeObject}
+# The items of every searched type are wrapped in their class by their
+# 'type' field.
+SEARCH_ITEM_TYPE = get_union_parser(ArtistObject, SimplifiedAlbumObject,
+                                    SimplifiedPlaylistObject, TrackObject,
+                                    SimplifiedShowObject,
+                                    SimplifiedEpisodeObject)
+
+
+def _decode_error(status: int, body: bytes) -> dict:
+    """Return the error dictionary of an error response: the 'error'
+    object of a regular error, or the status and a message built from a
+    body which is empty, not json or an authentication error."""
+    try:
+        decoded = json_loads(body) if body else None
+    except ValueError:
+        decoded = None
+    error = decoded.get('error') if isinstance(decoded, dict) else None
+    if isinstance(error, dict) and 'message' in error:
+        return dict(error, status=error.get('status', status))
+    if isinstance(error, str):
+        message = decoded.get('error_description', error)
+    else:
+        message = f'The server responded with status {status}.'
+    return {'status': status, 'message': message}
 
 
 class SpotifyAPI:
     """Hello World!"""
-    HTTP_METHODS = {
-        'POST': requests.post,
-        'GET': requests.get,
-        'PUT': requests.put
-    }
-
     _headers = {'Accept': ''}
 
-    def __init__(self):
+    def __init__(self,
+                 transport: Optional[HTTPTransport] = None,
+                 cache: Optional[ResponseCache] = None,
+                 entity_cache: Optional[EntityCache] = None,
+                 scheduler: Optional[RequestScheduler] = None,
+                 projector: Optional[AdaptiveProjector] = None,
+                 coalesce: bool = True,
+                 saved_index: Optional[SavedItemsIndex] = None):
         self._flow = PKCE()
         self._credentials: dict = self._flow.get_credentials()
         self._access_token: str = self._credentials['access_token']
@@ -42,6 +79,19 @@ class SpotifyAPI:
             'Content-Type': 'application/json',
             'Authorization': f'Bearer {self._access_token}'
         }
+        self._transport = transport or HTTPTransport()
+        self._cache = cache
+        self._entity_cache = entity_cache
+        self._scheduler = scheduler or RequestScheduler()
+        self._projector = projector
+        self._single_flight = SingleFlight() if coalesce else None
+        self._saved_index = saved_index
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     @property
     def credentials(self):
@@ -63,42 +113,205 @@ class SpotifyAPI:
         """Return the headers TODO: Explain"""
         return self._headers
 
-    # TODO: Add type hints
-    def _get(self, url, query_params, json_body) -> Tuple[dict, bool]:
+    @property
+    def transport(self) -> HTTPTransport:
+        """Return the transport every request of this client is sent
+        through."""
+        return self._transport
+
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        """Return the cache of GET responses, if the client has one."""
+        return self._cache
+
+    @property
+    def entity_cache(self) -> Optional[EntityCache]:
+        """Return the in-memory cache of decoded objects, if the client has
+        one."""
+        return self._entity_cache
+
+    @property
+    def scheduler(self) -> RequestScheduler:
+        """Return the scheduler pacing every request of this client."""
+        return self._scheduler
+
+    @property
+    def projector(self) -> Optional[AdaptiveProjector]:
+        """Return the adaptive projector of the playlist endpoints, if the
+        client has one."""
+        return self._projector
+
+    @property
+    def single_flight(self) -> Optional[SingleFlight]:
+        """Return the coalescer of identical in-flight GET requests, unless
+        coalescing is turned off."""
+        return self._single_flight
+
+    @property
+    def saved_index(self) -> Optional[SavedItemsIndex]:
+        """Return the index of the user's saved items, if the client has
+        one."""
+        return self._saved_index
+
+    def close(self) -> None:
+        """Close the transport and its pooled connections."""
+        self._transport.close()
+
+    def _request(self, http_method: str, url: str, query_params: dict,
+                 json_body: dict) -> Tuple[dict, bool]:
+        """Send the request through the client's transport and decode the
+        json response. The adaptive projector, if the client has one, adds
+        its learned fields filter and wraps the json. The saved items index,
+        if the client has one, answers the checks of its loaded types and
+        records the saves and removals.
+
+        Returns:
+            The decoded json (or the error dictionary) and whether the
+            response is an error.
+        """
         params = self._convert_query_params(query_params)
-        print('-----------------get---------------------')
-        print(f'{url=}')
-        print(f'{params=}')
-        print(f'{json_body=}')
+        json_body = self._convert_json_body(json_body)
+        if self._saved_index is not None:
+            saved = self._saved_index.lookup(http_method, url, params)
+            if saved is not None:
+                return saved, False
+        if self._projector is not None:
+            self._projector.prepare(http_method, url, params)
+        json_dict, error = self._send_request(http_method, url, params,
+                                              json_body)
+        if error:
+            return json_dict, error
+        if self._saved_index is not None:
+            self._saved_index.record(http_method, url, params)
+        if self._projector is not None:
+            json_dict = self._projector.apply(self, url, params, json_dict)
+        return json_dict, error
+
+    def _send_request(self, http_method: str, url: str, params: dict,
+                      json_body: dict) -> Tuple[dict, bool]:
+        """Send the request with its converted parameters, answering GET
+        requests from the response cache when possible. Identical GET
+        requests sent while one is in flight share its response."""
+        cache_key, cached, headers = self._check_cache(http_method, url,
+                                                       params)
+        if cached and cached.fresh:
+            return self._project(params, json_loads(cached.body)), False
+
+        def fetch():
+            return self._fetch(http_method, url, params, json_body, headers,
+                               cache_key, cached)
+
         try:
-            response = requests.get(url, params=params, headers=self.headers)
-            error = 'error' in response.text[:10]
-            print(f'URL requested: {response.request.url!r}')
-        except ConnectionError as e:
-            # TODO: This seems weird?
-            response = CustomResponse(
-                '{ "error": { "status": "ConnectionError", "message": "' +
-                str(e) + '"}}')
-            error = True
-        if response.status_code == 204:
-            response = CustomResponse(
-                '{ "error": { "status": "204 No Content", "message": "' +
-                'The server successfully responded but didn\'t return '
-                'any content"}}')
-            error = True
+            if http_method == 'GET' and self._single_flight is not None:
+                response, cached_body = self._single_flight.do(
+                    hash_request(url, params), fetch)
+            else:
+                response, cached_body = fetch()
+        except RequestException as e:
+            return {'status': 'ConnectionError', 'message': str(e)}, True
+        if cached_body is not None:
+            return self._project(params, json_loads(cached_body)), False
+        json_dict, error = self._decode_response(http_method, response)
         if error:
-            response = json.loads(response.text)['error']
-        else:
-            response = json.loads(response.text)
-        print(f'get returns type: {type(response)}')
-        print('----------------ENDget--------------------')
-        return response, error
+            return json_dict, error
+        return self._project(params, json_dict), error
+
+    def _fetch(self, http_method: str, url: str, params: dict,
+               json_body: dict, headers: dict, cache_key: Optional[str],
+               cached: Optional[CacheEntry]) -> Tuple[object, Optional[bytes]]:
+        """Send the request through the scheduler and the transport and
+        store the response in the cache.
+
+        Returns:
+            The response and, if the server answered that the cached entry
+            is unchanged, the cached body.
+        """
+        response = self._scheduler.send(
+            lambda: self._transport.request(http_method,
+                                            url,
+                                            params=params,
+                                            json_body=json_body or None,
+                                            headers=headers),
+            http_method)
+        if cache_key and self._update_cache(cache_key, cached, url, response):
+            return response, cached.body
+        return response, None
+
+    def _check_cache(self, http_method: str, url: str, params: dict
+                     ) -> Tuple[Optional[str], Optional[CacheEntry], dict]:
+        """Look the GET request up in the response cache.
+
+        Returns:
+            The cache key of the request (None if it can't be cached), its
+            cached entry if there is one, and the headers to send, which
+            ask the server to revalidate a stale entry's ETag.
+        """
+        if http_method != 'GET' or self._cache is None:
+            return None, None, self.headers
+        cache_key, cached = self._cache.lookup(url, params)
+        if cached and cached.etag:
+            return cache_key, cached, dict(self.headers,
+                                           **{'If-None-Match': cached.etag})
+        return cache_key, cached, self.headers
 
-    def _put(self, endpoint):
-        return requests.put(endpoint, headers=self.headers)
+    def _update_cache(self, cache_key: str, cached: Optional[CacheEntry],
+                      url: str, response) -> bool:
+        """Store a successful response in the cache.
 
-    def _post(self, endpoint):
-        return requests.post(endpoint, headers=self.headers)
+        Returns:
+            Whether the server answered that the cached entry is unchanged.
+        """
+        if cached and response.status_code == 304:
+            self._cache.refresh(cache_key, url)
+            return True
+        if response.status_code == 200:
+            self._cache.store(cache_key, url, response.content,
+                              response.headers.get('ETag'))
+        return False
+
+    @staticmethod
+    def _project(params: dict, json_dict: dict) -> dict:
+        """Wrap the json of a request whose fields filter is a Projection in
+        PartialDicts, so the objects built from it are partial."""
+        fields = params.get('fields')
+        if isinstance(fields, Projection):
+            return fields.apply(json_dict)
+        return json_dict
+
+    @staticmethod
+    def _decode_response(http_method: str, response) -> Tuple[dict, bool]:
+        """Decode the json of a response returned by the transport (or any
+        response object with status_code and content attributes). The body
+        is decoded once, straight from its bytes. Every response with a
+        status of 400 or more is an error, whatever its body."""
+        status = response.status_code
+        if http_method == 'GET' and status == 204:
+            return {'status': '204 No Content',
+                    'message': 'The server successfully responded but '
+                               'didn\'t return any content'}, True
+        body = response.content
+        if status >= 400:
+            return _decode_error(status, body), True
+        if not body:
+            return {}, False
+        try:
+            return json_loads(body), False
+        except ValueError:
+            return {'status': status,
+                    'message': 'The server responded with a body which is '
+                               'not json.'}, True
+
+    def _get(self, url, query_params, json_body) -> Tuple[dict, bool]:
+        return self._request('GET', url, query_params, json_body)
+
+    def _put(self, url, query_params, json_body) -> Tuple[dict, bool]:
+        return self._request('PUT', url, query_params, json_body)
+
+    def _post(self, url, query_params, json_body) -> Tuple[dict, bool]:
+        return self._request('POST', url, query_params, json_body)
+
+    def _delete(self, url, query_params, json_body) -> Tuple[dict, bool]:
+        return self._request('DELETE', url, query_params, json_body)
 
     @staticmethod
     def _convert_query_params(params: dict):
@@ -112,6 +325,13 @@ class SpotifyAPI:
                 params[key] = ','.join(value)
         return params
 
+    @staticmethod
+    def _convert_json_body(json_body: dict):
+        """Remove unused parameters from the json body."""
+        return {
+            key: value for key, value in json_body.items() if value is not None
+        }
+
     @staticmethod
     def _convert_array_to_list(response,
                                type_) -> List[Optional[SpotifyObject]]:
@@ -122,6 +342,188 @@ class SpotifyAPI:
             array = list(response.values())[0]
         return [type_(value) if value is not None else None for value in array]
 
+    def get_in_batches(self, method_name: str, ids: List[str],
+                       max_workers: int = 4,
+                       **kwargs) -> List[Optional[SpotifyObject]]:
+        """
+        Call a bulk method such as get_several_tracks with any number of
+        ids. The ids are split into chunks of the endpoint's maximum size,
+        the chunks are requested concurrently and the results are merged
+        back into the order of the ids.
+
+        Args:
+            method_name: The name of the bulk method, e.g.
+                'get_several_tracks'.
+            ids: The Spotify IDs to request.
+            max_workers: The maximum number of chunks requested at once.
+            **kwargs: Extra arguments passed to every request, e.g. market.
+        """
+        return get_in_batches(self, method_name, ids, max_workers, **kwargs)
+
+    def item_batcher(self, method_name: str, max_delay: float = 0.01,
+                     **kwargs) -> ItemBatcher:
+        """
+        Create an ItemBatcher which merges concurrent calls of a single-item
+        getter such as get_a_track into bulk requests.
+
+        Args:
+            method_name: The single-item getter to merge, e.g. 'get_a_track'.
+            max_delay: The number of seconds to wait for more ids before a
+                partial batch is sent.
+            **kwargs: Extra arguments passed to every bulk request.
+        """
+        return ItemBatcher(self, method_name, max_delay, **kwargs)
+
+    def library_queue(self, item_type: str, max_delay: float = 0.5,
+                      max_workers: int = 4) -> LibraryQueue:
+        """
+        Create a LibraryQueue which buffers saves and removals of the
+        user's library and sends them in requests of 50 IDs.
+
+        Args:
+            item_type: 'tracks', 'albums', 'episodes' or 'shows'.
+            max_delay: The number of seconds to wait for more ids before a
+                partial chunk is sent.
+            max_workers: The maximum number of requests sent at once.
+        """
+        return LibraryQueue(self, item_type, max_delay, max_workers)
+
+    def playlist_writer(self, playlist_id: str,
+                        snapshot_id: Optional[str] = None) -> PlaylistWriter:
+        """
+        Create a PlaylistWriter which adds, replaces and removes any number
+        of items of the playlist in requests of at most 100 items, chaining
+        the snapshot id of each write into the next one.
+
+        Args:
+            playlist_id: The Spotify ID of the playlist.
+            snapshot_id: Optional; The snapshot id of the playlist the first
+                write is sent against.
+        """
+        return PlaylistWriter(self, playlist_id, snapshot_id)
+
+    def sync_playlist(self, playlist_id: str, uris: Sequence[str]
+                      ) -> Tuple[PlaylistDiff, Optional[str]]:
+        """
+        Bring the playlist to the target uris with the fewest removals,
+        range moves and insertions, applied in chunks chained by snapshot id.
+
+        Args:
+            playlist_id: The Spotify ID of the playlist.
+            uris: The target uris, in order.
+
+        Returns:
+            The applied diff and the snapshot id of the synced playlist.
+        """
+        return sync_playlist(self, playlist_id, uris)
+
+    def refresh_saved_items(self, item_types: Optional[Sequence[str]] = None
+                            ) -> None:
+        """
+        Load the user's saved items of each type into the saved_index, or
+        add the items saved since the previous refresh.
+
+        Args:
+            item_types: The types to refresh among 'tracks', 'albums',
+                'episodes' and 'shows'. Defaults to all of them.
+        """
+        for item_type in item_types or SAVED_ITEMS_METHODS:
+            refresh_saved_items(self, item_type)
+
+    def iter_pages(self, method_name: str, *args, prefetch: int = 0,
+                   max_items: Optional[int] = None,
+                   **kwargs) -> Iterator[Union[PagingObject,
+                                               CursorPagingObject]]:
+        """
+        Lazily yield every page of a method returning a PagingObject or a
+        CursorPagingObject, following each page's next url on demand.
+
+        Args:
+            method_name: The name of the method, e.g. 'get_a_playlists_items'.
+            *args: The arguments of the method.
+            prefetch: The number of pages requested ahead in a background
+                thread while the current page is processed.
+            max_items: Optional; Stop once this many items have been yielded.
+            **kwargs: The keyword arguments of the method.
+        """
+        return iter_pages(self, method_name, *args, prefetch=prefetch,
+                          max_items=max_items, **kwargs)
+
+    def iter_items(self, method_name: str, *args, prefetch: int = 0,
+                   max_items: Optional[int] = None,
+                   **kwargs) -> Iterator[SpotifyObject]:
+        """
+        Lazily yield every item of every page of a method returning a
+        PagingObject or a CursorPagingObject. Takes the same arguments as
+        iter_pages.
+        """
+        return iter_items(self, method_name, *args, prefetch=prefetch,
+                          max_items=max_items, **kwargs)
+
+    def fetch_all(self, method_name: str, *args, max_workers: int = 8,
+                  **kwargs) -> list:
+        """
+        Request the first page of an offset based method such as
+        get_a_playlists_items, then request every remaining page at once
+        using the first page's total and return all the items in order.
+        search_for_an_item returns one list of items per searched type.
+
+        Args:
+            method_name: The name of the method, e.g. 'get_a_playlists_items'.
+            *args: The arguments of the method.
+            max_workers: The maximum number of pages requested at once.
+            **kwargs: The keyword arguments of the method. The limit of the
+                first page is used for every page.
+        """
+        return fetch_all(self, method_name, *args, max_workers=max_workers,
+                         **kwargs)
+
+    def get_audio_features_matrix(self, ids: List[str], max_workers: int = 4,
+                                  columns: Sequence[str] =
+                                  AUDIO_FEATURE_COLUMNS,
+                                  dtype: str = 'float32') -> FeatureMatrix:
+        """
+        Columnar version of get_audio_features_for_several_tracks. Requests
+        any number of IDs, 100 per request, and decodes the features
+        straight into a matrix, float32 unless another dtype is given,
+        without creating an AudioFeaturesObject per track. Requires numpy.
+
+        Args:
+            ids: The Spotify IDs of the tracks.
+            max_workers: The maximum number of chunks requested at once.
+            columns: The features to keep, in column order.
+            dtype: The dtype of the matrix. 'float64' keeps duration_ms
+                exact.
+        """
+        return get_audio_features_matrix(self, ids, max_workers, columns,
+                                         dtype)
+
+    def stream_items(self, method_name: str, *args, follow_next: bool = True,
+                     **kwargs) -> Iterator[SpotifyObject]:
+        """
+        Yield the items of a method returning a PagingObject one at a time,
+        parsing each response incrementally while it arrives. Requires
+        ijson.
+
+        Args:
+            method_name: The name of the method, e.g. 'get_a_playlists_items'.
+            *args: The arguments of the method.
+            follow_next: Whether to stream the following pages too.
+            **kwargs: The keyword arguments of the method.
+        """
+        return stream_items(self, method_name, *args, follow_next=follow_next,
+                            **kwargs)
+
+    def stream_audio_analysis(self, id_: str) -> AudioAnalysisObject:
+        """
+        Streaming version of get_audio_analysis_for_a_track which decodes
+        the analysis directly from the socket. Requires ijson.
+
+        Args:
+            id_: The Spotify ID of the track.
+        """
+        return stream_audio_analysis(self, id_)
+
     def search_for_an_item(
             self,
             q: str,
@@ -172,6 +574,6 @@ class SpotifyAPI:
         response, error = self._get(url, query_params, json_body)
         if error:
             return ErrorObject(response)
-        return [PagingObject(value, QUERY_DICT[key]) for key, value in
-                response.items()]
+        return [PagingObject(value, SEARCH_ITEM_TYPE)
+                for value in response.values()]
 
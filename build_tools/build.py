@@ -1,10 +1,12 @@
 #! /usr/bin/env python
 """
-Build the object library and the SpotifyAPI class.
+Build the object library, the SpotifyAPI class and the Arrow export
+columns.
 """
 import argparse
 from argparse import Namespace
 
+import build_arrow_schemas
 import build_object_library
 import build_spotify_api_class
 
@@ -37,3 +39,4 @@ if __name__ == '__main__':
     # create_directory_structure(args.directory)
     build_object_library.build(args.directory)
     build_spotify_api_class.build(args.directory)
+    build_arrow_schemas.build(args.directory)
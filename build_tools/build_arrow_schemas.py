@@ -0,0 +1,126 @@
+"""
+Build the column specs of the Arrow export from the object library yaml.
+"""
+from pathlib import Path
+import re
+from typing import List, Optional, Tuple
+
+import yaml
+import yapf
+
+OUTPUT_FILENAME = 'arrow_schemas.py'
+YAML_PATH = Path('build_tools/yaml_files/object_library.yaml')
+
+# The objects which can be exported.
+EXPORTED_CLASSES = ['Track', 'SimplifiedTrack', 'PlaylistTrack', 'SavedTrack',
+                    'AudioFeatures']
+
+# The number of nested objects whose fields are flattened into columns,
+# e.g. PlaylistTrackObject -> track -> album gives 'track.album.id'.
+MAX_DEPTH = 2
+
+# The fields kept from each item of a list of objects, as a list column.
+LIST_FIELDS = ('id', 'name')
+
+ARROW_TYPES = {'str': 'string',
+               'int': 'int64',
+               'float': 'float64',
+               'bool': 'bool',
+               'datetime': 'timestamp'}
+
+HEADER = '''"""
+Column specs of the Arrow export, generated from object_library.yaml by
+build_tools/build_arrow_schemas.py.
+
+Each column is (name, json path, arrow type). A '*' in the path maps the
+rest of the path over a list.
+"""
+
+COLUMNS = {
+'''
+
+Column = Tuple[str, Tuple[str, ...], str]
+
+
+def create_yaml_dicts() -> List[dict]:
+    """Open/load the yaml file."""
+    with open(YAML_PATH, encoding='utf8') as yaml_file:
+        return yaml.load(yaml_file, Loader=yaml.Loader)
+
+
+def strip_optional(return_type: str) -> str:
+    """Remove the Optional around a return type."""
+    return_type = return_type.strip()
+    if return_type.startswith('Optional['):
+        return return_type[len('Optional['):-1]
+    return return_type
+
+
+def get_object_name(return_type: str) -> Optional[str]:
+    """Return the name of the first object of the return type, without its
+    'Object' suffix."""
+    if match := re.search(r'(\w+)Object', return_type):
+        return match.group(1)
+    return None
+
+
+def create_columns(class_name: str, classes: dict,
+                   path: Tuple[str, ...] = (), depth: int = 0
+                   ) -> List[Column]:
+    """Create the columns of the class by flattening its scalar attributes
+    and the attributes of its nested objects up to MAX_DEPTH."""
+    columns = []
+    for attr in classes[class_name]['attrs']:
+        attr_path = path + (attr['name'],)
+        return_type = strip_optional(attr['return'])
+        if return_type in ARROW_TYPES:
+            columns.append(('.'.join(attr_path), attr_path,
+                            ARROW_TYPES[return_type]))
+        elif return_type == 'List[str]':
+            columns.append(('.'.join(attr_path), attr_path, 'list<string>'))
+        elif depth >= MAX_DEPTH:
+            continue
+        elif return_type.startswith('List['):
+            columns.extend(create_list_columns(return_type, classes,
+                                               attr_path))
+        elif (name := get_object_name(return_type)) in classes:
+            columns.extend(create_columns(name, classes, attr_path,
+                                          depth + 1))
+    return columns
+
+
+def create_list_columns(return_type: str, classes: dict,
+                        path: Tuple[str, ...]) -> List[Column]:
+    """Create one list column per LIST_FIELDS attribute of the items of a
+    list of objects, e.g. 'artists.id'."""
+    name = get_object_name(return_type)
+    if name not in classes:
+        return []
+    item_attrs = {attr['name']: strip_optional(attr['return'])
+                  for attr in classes[name]['attrs']}
+    return [('.'.join(path + (field,)), path + ('*', field), 'list<string>')
+            for field in LIST_FIELDS
+            if item_attrs.get(field) == 'str']
+
+
+def create_module_code(yaml_dicts: List[dict]) -> str:
+    """Create the code of the module holding the columns of every exported
+    class."""
+    classes = {class_dict['name']: class_dict for class_dict in yaml_dicts}
+    lines = [HEADER]
+    for class_name in EXPORTED_CLASSES:
+        lines.append(f'    {class_name + "Object"!r}: [\n')
+        for column in create_columns(class_name, classes):
+            lines.append(f'        {column!r},\n')
+        lines.append('    ],\n')
+    lines.append('}\n')
+    return yapf.yapf_api.FormatCode(''.join(lines),
+                                    style_config='pep8')[0]
+
+
+def build(directory: str):
+    """Parse the yaml file and save the columns of the exported classes as
+    'arrow_schemas.py' in the given directory."""
+    code = create_module_code(create_yaml_dicts())
+    with open(Path(directory) / OUTPUT_FILENAME, 'w', encoding='utf8') as file:
+        file.write(code)
@@ -8,7 +8,18 @@ from typing import List
 import yaml
 
 HEADER_TEMPLATE = 'class {class_name}Object(SpotifyObject):\n'
-PROPERTY_TEMPLATE = '\n@property\ndef {attr_name}(self) -> {attr_return}:'
+# The json dictionary is the only state, and it lives in SpotifyObject's
+# slot, so generated classes add no slots (and no __dict__) of their own.
+SLOTS_LINE = '    __slots__ = ()\n'
+PROPERTY_TEMPLATE = '\n@{decorator}\ndef {attr_name}(self) -> {attr_return}:'
+
+OBJECT_TYPES_TEMPLATE = '''
+
+# The value of the 'type' field of the objects of each class.
+OBJECT_TYPES = {{
+{lines}
+}}
+'''
 
 BOILERPLATE_PATH = Path('build_tools/boilerplate/object_library_boiler.py')
 YAML_PATH = Path('build_tools/yaml_files/object_library.yaml')
@@ -32,7 +43,7 @@ def create_class(class_dict: dict) -> str:
     for attr in class_dict['attrs']:
         property_text = create_property(attr)
         property_code.append(property_text)
-    class_statement = class_header + class_docstring + '\n'
+    class_statement = class_header + class_docstring + '\n' + SLOTS_LINE
     class_methods = (repr_header + repr_return_statement + '\n' + str_method +
                      '\n'.join(property_code))
     class_methods = textwrap.indent(class_methods, ' ' * 4)
@@ -93,6 +104,7 @@ def _lookup_attr(class_dict: dict, prop: str) -> dict:
 def create_property(attr_dict: dict) -> str:
     """Create the code for a class property and return it as a string."""
     property_declaration = PROPERTY_TEMPLATE.format(
+        decorator=create_property_decorator(attr_dict['return']),
         attr_name=attr_dict['name'],
         attr_return=attr_dict['return'])
     property_docstring = create_docstring(attr_dict['doc'], 1)
@@ -105,6 +117,14 @@ def create_property(attr_dict: dict) -> str:
     return code_text
 
 
+def create_property_decorator(return_type: str) -> str:
+    """Memoize the properties which wrap their value in other objects so
+    the same wrappers are returned on every access."""
+    if 'Object' in return_type:
+        return 'memoized_property'
+    return 'property'
+
+
 def create_property_return_line(return_type: str, attr_name: str) -> str:
     """Create the return line which will instantiate the return type with the
     class's data."""
@@ -117,11 +137,14 @@ def create_property_return_line(return_type: str, attr_name: str) -> str:
         return f'return {return_class}(self._json_dict[{attr_name!r}])'
     if return_class == 'Optional':
         return _create_optional_return(attr_name, param)
+    if return_class == 'List' and param.startswith('Union['):
+        return f'return [union_parser(({param[6:-1]}), item) for item in ' \
+               f'self._json_dict[{attr_name!r}]]'
     if return_class == 'List':
         return f'return [{param}(item) for item in ' \
                f'self._json_dict[{attr_name!r}]]'
     if return_class == 'Union':
-        return f'return union_parser([{param}], ' \
+        return f'return union_parser(({param}), ' \
                f'self._json_dict[{attr_name!r}])'
     return f'return {return_class}(self._json_dict[{attr_name!r}], {param})'
 
@@ -150,6 +173,14 @@ def _create_optional_return(attr_name: str, param: str) -> str:
            f'    return None'
 
 
+def create_object_types(yaml_dicts: List[dict]) -> str:
+    """Create the table of the value of the 'type' field of each class,
+    which union_parser dispatches on."""
+    lines = [f'    {class_dict["name"]}Object: {class_dict["object_type"]!r},'
+             for class_dict in yaml_dicts if class_dict.get('object_type')]
+    return OBJECT_TYPES_TEMPLATE.format(lines='\n'.join(lines))
+
+
 def build(directory: str):
     """Parse the yaml file and generate the code for the classes. Combine
     the generated code with the boilerplate code and save it as a
@@ -165,3 +196,4 @@ def build(directory: str):
         file.write(boiler)
         file.write(all_classes)
         file.write('\n')
+        file.write(create_object_types(yaml_dicts))
@@ -1,8 +1,6 @@
 """
-Build the Spotify API class
+Build the Spotify API class and its asyncio counterpart.
 """
-# TODO: Search for an item issues. PagingObject needs to be able to handle
-#  multiple possible object types. Right now it just handles 1.
 # TODO: Split long urls. yapf isn't splitting them because they're one word.
 from pathlib import Path
 import re
@@ -13,14 +11,17 @@ import yaml
 import yapf
 
 OUTPUT_FILENAME = 'api.py'
+ASYNC_OUTPUT_FILENAME = 'async_api.py'
 YAML_PATH = Path('build_tools/yaml_files/api_methods.yaml')
 BOILERPLATE_PATH = Path('build_tools/boilerplate/spotify_api_class_boiler.py')
+ASYNC_BOILERPLATE_PATH = Path(
+    'build_tools/boilerplate/async_spotify_api_class_boiler.py')
 
 METHOD_BODY_TEMPLATE = '''
 url = {url}
 query_params = {query_params}
 json_body = {json_body}
-response, error = self._{http_method}(url, query_params, json_body)
+response, error = {await_}self._{http_method}(url, query_params, json_body)
 if error:
     return ErrorObject(response)
 {return_line}
@@ -33,9 +34,11 @@ def create_yaml_dicts() -> List[dict]:
         return yaml.load(yaml_file, Loader=yaml.Loader)
 
 
-def create_method_from_yaml_dict(method: dict) -> str:
+def create_method_from_yaml_dict(method: dict,
+                                 is_async: bool = False) -> str:
     """Create the python code for the class method and return it as a
-    string."""
+    string. If is_async is True the method is created as a coroutine which
+    awaits the request."""
     name = method['method_name']
     doc = method['doc']
     http_method = method['http_method']
@@ -51,25 +54,32 @@ def create_method_from_yaml_dict(method: dict) -> str:
                                      json_parameters)
 
     requires_decorator = create_requires_decorator(scope)
+    cache_decorator = create_cache_decorator(method.get('entity_type'),
+                                             returns)
     param_declarations = create_param_declarations(params_dict)
     description_docstring = create_description_docstring(doc)
     params_docstring = create_params_docstring(params_dict)
     docstring = add_triple_quotes_to_docstring(description_docstring +
                                                params_docstring)
-    return_line = create_return_line(returns)
+    return_line = create_return_line(returns, method.get('returns_key'))
     url = format_url(endpoint)
 
     query_params = create_get_params(params_dict['query_params'])
     json_body = create_get_params(params_dict['json_params'])
 
-    method_declaration = f'def {name}({param_declarations}) -> {returns}:'
+    def_keyword = 'async def' if is_async else 'def'
+    method_declaration = (f'{def_keyword} {name}({param_declarations}) -> '
+                          f'{returns}:')
+    await_ = 'await ' if is_async else ''
     method_body = METHOD_BODY_TEMPLATE.format(url=url,
                                               query_params=query_params,
                                               json_body=json_body,
+                                              await_=await_,
                                               http_method=http_method,
                                               return_line=return_line)
 
     method_code = '\n'.join([requires_decorator,
+                             cache_decorator,
                              method_declaration,
                              textwrap.indent(docstring, ' ' * 4),
                              textwrap.indent(method_body, ' ' * 4)])
@@ -230,19 +240,45 @@ def create_requires_decorator(scope: List[Optional[str]]) -> str:
         return ''
 
 
-def create_return_line(returns: str) -> str:
+def create_cache_decorator(entity_type: Optional[str], returns: str) -> str:
+    """Create a decorator which looks the returned objects up in the
+    client's entity cache if the method has an entity type."""
+    if not entity_type:
+        return ''
+    if 'List' in returns:
+        return f'@cache_entities({entity_type!r})'
+    return f'@cache_entity({entity_type!r})'
+
+
+def create_return_line(returns: str, returns_key: Optional[str] = None
+                       ) -> str:
     """Create the return line for the method which return an instance of the
-    corresponding class using json response's text."""
+    corresponding class using json response's text. A method with a
+    returns_key returns that value of the json, e.g. 'snapshot_id'."""
     objects = re.findall(r'\w*Object|bool|str|dict', returns)
+    if returns == 'Optional[ErrorObject]':
+        return 'return None'
+    if returns_key:
+        return f'return {objects[0]}(response[{returns_key!r}])'
     if 'List' in returns:
         return f'return self._convert_array_to_list(response, ' \
-               f'{objects[0]})'
+               f'{create_item_type(returns, objects[0])})'
     elif 'PagingObject' in returns:
-        return f'return PagingObject(response, {objects[1]})'
+        return f'return PagingObject(response, ' \
+               f'{create_item_type(returns, objects[1])})'
     else:
         return f'return {objects[0]}(response)'
 
 
+def create_item_type(returns: str, first_object: str) -> str:
+    """Return the item type of a returned list or page. The items of a
+    Union are wrapped by the UnionParser of its classes."""
+    if match := re.search(r'(?:List|PagingObject)\[Union\[([^\]]+)\]\]',
+                          returns):
+        return f'get_union_parser({match.group(1)})'
+    return first_object
+
+
 def format_url(endpoint: str) -> str:
     """Format the  url so that it is does not stretch beyond 65 characters."""
     if len(endpoint) <= 65:
@@ -283,18 +319,19 @@ def yapf_format(code: str) -> str:
     return textwrap.indent(formatted_code, ' ' * 4)
 
 
-def get_boilerplate_code() -> str:
+def get_boilerplate_code(boilerplate_path: Path = BOILERPLATE_PATH) -> str:
     """Get the boilerplate code from the boilerplate file."""
-    with open(BOILERPLATE_PATH, 'r', encoding='utf8') as file:
+    with open(boilerplate_path, 'r', encoding='utf8') as file:
         return file.read()
 
 
 def write_code_to_file(directory: str,
                        boilerplate_code: str,
-                       combined_methods_code: str):
+                       combined_methods_code: str,
+                       output_filename: str = OUTPUT_FILENAME):
     """Write the resulting code to the target directory by combing the
     boilerplate code and the generated code."""
-    output_path = Path(directory) / OUTPUT_FILENAME
+    output_path = Path(directory) / output_filename
     with open(output_path, 'w', encoding='utf8') as file:
         file.write(boilerplate_code)
         file.write(combined_methods_code)
@@ -303,13 +340,19 @@ def write_code_to_file(directory: str,
 def build(directory: str):
     """Parse the yaml file and use it to generate the code for each of the
     methods, combine the method code with the code from the boilerplate file
-    and save it as 'api.py' in the given directory."""
+    and save it as 'api.py' in the given directory. The same methods are
+    generated as coroutines and saved as 'async_api.py'."""
     yaml_dicts = create_yaml_dicts()
 
-    code_for_each_method = [create_method_from_yaml_dict(yaml_dict)
-                            for yaml_dict in yaml_dicts]
-    combined_methods_code = '\n'.join(code_for_each_method)
+    for is_async, boilerplate_path, output_filename in (
+            (False, BOILERPLATE_PATH, OUTPUT_FILENAME),
+            (True, ASYNC_BOILERPLATE_PATH, ASYNC_OUTPUT_FILENAME)):
+        code_for_each_method = [create_method_from_yaml_dict(yaml_dict,
+                                                             is_async)
+                                for yaml_dict in yaml_dicts]
+        combined_methods_code = '\n'.join(code_for_each_method)
 
-    boilerplate_code = get_boilerplate_code()
+        boilerplate_code = get_boilerplate_code(boilerplate_path)
 
-    write_code_to_file(directory, boilerplate_code, combined_methods_code)
+        write_code_to_file(directory, boilerplate_code, combined_methods_code,
+                           output_filename)
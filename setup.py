@@ -8,5 +8,11 @@ setup(name='spotifywrapper',
       author_email='me@email.com',
       url='github.com',
       packages=find_packages(where='src'),
-      package_dir={'': 'src'}
+      package_dir={'': 'src'},
+      extras_require={
+          'numpy': ['numpy'],
+          'streaming': ['ijson'],
+          'arrow': ['pyarrow'],
+          'msgpack': ['msgpack'],
+      }
       )
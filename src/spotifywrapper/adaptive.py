@@ -0,0 +1,350 @@
+"""
+Learn which fields the calling code reads from the projectable endpoints and
+request only those fields once a warm-up window has passed.
+"""
+from contextlib import contextmanager
+import re
+import threading
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .object_library import ErrorObject
+from .projection import PAGING_KEYS, PartialDict, Tree, _add_path, \
+    compile_fields
+from .utilities import SpotifyAPIError
+
+# The endpoints whose responses can be projected, keyed by the method
+# requesting them, with the dotted paths of the fields which are always
+# requested from them. PagingObject only reads the items of a page, so the
+# paging keys are required for the pages to be recognized and followed.
+PROJECTABLE_ENDPOINTS = {
+    'get_a_playlists_items': (re.compile(r'^/v1/playlists/[^/]+/tracks$'),
+                              PAGING_KEYS),
+    'get_a_playlist': (re.compile(r'^/v1/playlists/[^/]+$'),
+                       tuple(f'tracks.{key}' for key in PAGING_KEYS)),
+}
+
+Path = Tuple[Union[str, int], ...]
+
+
+def get_projectable_endpoint(url: str) -> Optional[str]:
+    """Return the name of the projectable endpoint the url belongs to."""
+    path = urlsplit(url).path
+    for name, (pattern, _) in PROJECTABLE_ENDPOINTS.items():
+        if pattern.match(path):
+            return name
+    return None
+
+
+def _is_object(value) -> bool:
+    """Whether the value is an object or a list of objects."""
+    if isinstance(value, list):
+        return any(isinstance(item, dict) for item in value)
+    return isinstance(value, dict)
+
+
+def _freeze(tree: Tree) -> Tree:
+    """Copy the learned tree, requesting whole objects whose fields were
+    never read."""
+    return {key: _freeze(subtree) if subtree else None
+            for key, subtree in tree.items()}
+
+
+def _get_url_fields(url: str) -> Optional[str]:
+    """Return the fields filter in the query string of a url, e.g. the next
+    url of a projected page."""
+    return dict(parse_qsl(urlsplit(url).query)).get('fields')
+
+
+def _strip_fields(url: str) -> str:
+    """Remove the fields filter from the query string of a next url."""
+    parts = urlsplit(url)
+    query = [(key, value) for key, value in parse_qsl(parts.query)
+             if key != 'fields']
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+class LearnedEndpoint:
+    """The fields read from the responses of one endpoint.
+
+    Args:
+        required: The dotted paths of the fields which are always requested.
+    """
+
+    def __init__(self, required: Tuple[str, ...] = ()):
+        self.responses = 0
+        self.tree: Tree = {}
+        for path in required:
+            _add_path(self.tree, path)
+        self.issued: Dict[str, Tree] = {}
+        self._fields: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def record(self, node: Tree, key: str, value) -> Optional[Tree]:
+        """Record that the key of the node was read and return the node of
+        its fields if the value is an object whose fields are recorded."""
+        with self._lock:
+            if _is_object(value):
+                if key in node and node[key] is None:
+                    return None
+                if key not in node:
+                    self._fields = None
+                return node.setdefault(key, {})
+            if key not in node:
+                node[key] = None
+                self._fields = None
+            return None
+
+    def record_whole(self, keys: Tuple[str, ...]) -> None:
+        """Record that the whole value at the keys is needed."""
+        with self._lock:
+            node = self.tree
+            for key in keys[:-1]:
+                if node.get(key, {}) is None:
+                    return
+                node = node.setdefault(key, {})
+            if node.get(keys[-1], {}) is not None:
+                node[keys[-1]] = None
+                self._fields = None
+
+    def add_response(self) -> None:
+        """Count a full response recorded during the warm-up."""
+        with self._lock:
+            self.responses += 1
+
+    def get_fields(self, warmup: int) -> Optional[str]:
+        """Return the fields filter to send, or None during the warm-up."""
+        with self._lock:
+            if self.responses < warmup:
+                return None
+            if self._fields is None:
+                tree = _freeze(self.tree)
+                self._fields = compile_fields(tree)
+                self.issued[self._fields] = tree
+            return self._fields
+
+
+class AdaptiveProjector:
+    """Opt-in projection of get_a_playlist and get_a_playlists_items learned
+    from the fields the calling code reads.
+
+    During the warm-up the full responses are requested and wrapped in
+    RecordingDicts, which record every field read through the objects built
+    from them. Afterwards the recorded fields are sent as the fields filter
+    and the responses are wrapped in FallbackDicts: reading a field that was
+    not requested refetches the full response once, returns the field and
+    adds it to the filter of the following requests.
+
+    Args:
+        warmup: The number of full responses of an endpoint recorded before
+            its fields filter is sent.
+    """
+
+    def __init__(self, warmup: int = 20):
+        self.warmup = warmup
+        self.refetches = 0
+        self._endpoints = {name: LearnedEndpoint(required)
+                           for name, (_, required)
+                           in PROJECTABLE_ENDPOINTS.items()}
+        self._local = threading.local()
+
+    @property
+    def learned_fields(self) -> Dict[str, Optional[str]]:
+        """Return the fields filter sent to each endpoint, or None for the
+        endpoints still warming up."""
+        return {name: endpoint.get_fields(self.warmup)
+                for name, endpoint in self._endpoints.items()}
+
+    @contextmanager
+    def bypass(self):
+        """Send the requests of the block without any projection."""
+        self._local.bypass = True
+        try:
+            yield
+        finally:
+            self._local.bypass = False
+
+    def prepare(self, http_method: str, url: str, params: dict) -> None:
+        """Add the learned fields filter to the query parameters of a
+        request to a projectable endpoint, unless the request already has a
+        filter, in its parameters or in its url like the next url of a
+        projected page."""
+        if (http_method != 'GET' or 'fields' in params or
+                getattr(self._local, 'bypass', False) or
+                _get_url_fields(url) is not None):
+            return
+        if name := get_projectable_endpoint(url):
+            fields = self._endpoints[name].get_fields(self.warmup)
+            if fields:
+                params['fields'] = fields
+
+    def apply(self, sp, url: str, params: dict, json_dict):
+        """Wrap the json of a response from a projectable endpoint in a
+        RecordingDict during the warm-up, or in a FallbackDict if it was
+        projected with a learned fields filter."""
+        if (getattr(self._local, 'bypass', False) or
+                not isinstance(json_dict, dict) or
+                isinstance(json_dict, PartialDict)):
+            return json_dict
+        name = get_projectable_endpoint(url)
+        if name is None:
+            return json_dict
+        endpoint = self._endpoints[name]
+        fields = params.get('fields') or _get_url_fields(url)
+        if fields is None:
+            endpoint.add_response()
+            return RecordingDict(json_dict, endpoint, endpoint.tree)
+        if fields in endpoint.issued:
+            refetch = Refetch(self, sp, _strip_fields(url),
+                              {key: value for key, value in params.items()
+                               if key != 'fields'})
+            return FallbackDict(json_dict, endpoint.issued[fields], (),
+                                endpoint, refetch)
+        return json_dict
+
+
+class RecordingDict(dict):
+    """The json of a full response which records the fields read from it.
+
+    Args:
+        value: The decoded json dictionary.
+        endpoint: The endpoint the fields are recorded for.
+        node: The node of the recorded fields of this dictionary.
+    """
+    __slots__ = ('endpoint', 'node')
+
+    def __init__(self, value: dict, endpoint: LearnedEndpoint, node: Tree):
+        super().__init__(value)
+        self.endpoint = endpoint
+        self.node = node
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        child = self.endpoint.record(self.node, key, value)
+        if child is None:
+            return value
+        if isinstance(value, list):
+            value = [RecordingDict(item, self.endpoint, child)
+                     if isinstance(item, dict) and
+                     not isinstance(item, RecordingDict) else item
+                     for item in value]
+        elif not isinstance(value, RecordingDict):
+            value = RecordingDict(value, self.endpoint, child)
+        else:
+            return value
+        dict.__setitem__(self, key, value)
+        return value
+
+    def __reduce__(self):
+        # Reading a pickled copy in another process records nothing.
+        return dict, (dict(self),)
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        self.endpoint.record(self.node, key, None)
+        return default
+
+
+class Refetch:
+    """Requests the full response of a projected request once, the first
+    time a field that was not requested is read."""
+
+    def __init__(self, projector: AdaptiveProjector, sp, url: str,
+                 params: dict):
+        self._projector = projector
+        self._sp = sp
+        self._url = url
+        self._params = params
+        self._lock = threading.Lock()
+        self._full = None
+
+    def get(self, path: Path):
+        """Return the value at the path of the full response.
+
+        Raises:
+            SpotifyAPIError: If the refetch fails.
+        """
+        with self._lock:
+            if self._full is None:
+                with self._projector.bypass():
+                    response, error = self._sp._get(self._url, self._params,
+                                                    {})
+                if error:
+                    raise SpotifyAPIError(ErrorObject(response))
+                self._projector.refetches += 1
+                self._full = response
+        value = self._full
+        for key in path:
+            value = value[key]
+        return value
+
+
+def _wrap_fallback(value, tree: Optional[Tree], path: Path,
+                   endpoint: LearnedEndpoint, refetch: Refetch):
+    """Wrap the dictionaries of a projected response in FallbackDicts."""
+    if tree is None:
+        return value
+    if isinstance(value, list):
+        return [_wrap_fallback(item, tree, path + (i,), endpoint, refetch)
+                for i, item in enumerate(value)]
+    if isinstance(value, dict):
+        return FallbackDict(value, tree, path, endpoint, refetch)
+    return value
+
+
+class FallbackDict(PartialDict):
+    """The json of a response projected with a learned fields filter.
+    Reading a field which was not requested fills this dictionary from the
+    full response, which is refetched once, and adds the field to the
+    learned filter.
+
+    Args:
+        value: The decoded json dictionary.
+        tree: The requested fields of the dictionary.
+        path: The keys and indices leading to the dictionary.
+        endpoint: The endpoint the fields are learned for.
+        refetch: Requests the full response.
+    """
+    __slots__ = ('path', 'endpoint', 'refetch')
+
+    def __init__(self, value: dict, tree: Tree, path: Path,
+                 endpoint: LearnedEndpoint, refetch: Refetch):
+        dict.__init__(self, ((key, _wrap_fallback(item, tree.get(key),
+                                                  path + (key,), endpoint,
+                                                  refetch))
+                             for key, item in value.items()))
+        self.tree = tree
+        self.path = path
+        self.endpoint = endpoint
+        self.refetch = refetch
+
+    def __missing__(self, key):
+        if key not in self.tree:
+            self._fill(key)
+            if dict.__contains__(self, key):
+                return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+    def __reduce__(self):
+        # A pickled copy can not refetch, so it fails like a PartialDict.
+        return PartialDict, (dict(self), self.tree)
+
+    def get(self, key, default=None):
+        if key not in self and key not in self.tree:
+            self._fill(key)
+        return dict.get(self, key, default)
+
+    def rewrap(self, value: dict) -> dict:
+        """Pages following a projected page are wrapped by the projector."""
+        return value
+
+    def _fill(self, key) -> None:
+        """Copy the fields missing from this dictionary from the full
+        response and learn the key."""
+        full = self.refetch.get(self.path)
+        for full_key, value in full.items():
+            if not dict.__contains__(self, full_key):
+                dict.__setitem__(self, full_key, value)
+        keys = tuple(part for part in self.path if isinstance(part, str))
+        self.endpoint.record_whole(keys + (key,))
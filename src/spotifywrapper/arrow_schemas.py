@@ -0,0 +1,208 @@
+"""
+Column specs of the Arrow export, generated from object_library.yaml by
+build_tools/build_arrow_schemas.py.
+
+Each column is (name, json path, arrow type). A '*' in the path maps the
+rest of the path over a list.
+"""
+
+COLUMNS = {
+    'TrackObject': [
+        ('album.album_group', ('album', 'album_group'), 'string'),
+        ('album.album_type', ('album', 'album_type'), 'string'),
+        ('album.artists.id', ('album', 'artists', '*', 'id'), 'list<string>'),
+        ('album.artists.name', ('album', 'artists', '*', 'name'),
+         'list<string>'),
+        ('album.available_markets', ('album', 'available_markets'),
+         'list<string>'),
+        ('album.external_urls.spotify', ('album', 'external_urls', 'spotify'),
+         'string'),
+        ('album.href', ('album', 'href'), 'string'),
+        ('album.id', ('album', 'id'), 'string'),
+        ('album.name', ('album', 'name'), 'string'),
+        ('album.release_date', ('album', 'release_date'), 'string'),
+        ('album.release_date_precision', ('album', 'release_date_precision'),
+         'string'),
+        ('album.restrictions.reason', ('album', 'restrictions', 'reason'),
+         'string'),
+        ('album.type', ('album', 'type'), 'string'),
+        ('album.uri', ('album', 'uri'), 'string'),
+        ('artists.id', ('artists', '*', 'id'), 'list<string>'),
+        ('artists.name', ('artists', '*', 'name'), 'list<string>'),
+        ('available_markets', ('available_markets', ), 'list<string>'),
+        ('disc_number', ('disc_number', ), 'int64'),
+        ('duration_ms', ('duration_ms', ), 'int64'),
+        ('explicit', ('explicit', ), 'bool'),
+        ('external_ids.ean', ('external_ids', 'ean'), 'string'),
+        ('external_ids.isrc', ('external_ids', 'isrc'), 'string'),
+        ('external_ids.upc', ('external_ids', 'upc'), 'string'),
+        ('external_urls.spotify', ('external_urls', 'spotify'), 'string'),
+        ('href', ('href', ), 'string'),
+        ('id', ('id', ), 'string'),
+        ('is_local', ('is_local', ), 'bool'),
+        ('is_playable', ('is_playable', ), 'bool'),
+        ('linked_from.external_urls.spotify', ('linked_from', 'external_urls',
+                                               'spotify'), 'string'),
+        ('linked_from.href', ('linked_from', 'href'), 'string'),
+        ('linked_from.id', ('linked_from', 'id'), 'string'),
+        ('linked_from.type', ('linked_from', 'type'), 'string'),
+        ('linked_from.uri', ('linked_from', 'uri'), 'string'),
+        ('name', ('name', ), 'string'),
+        ('popularity', ('popularity', ), 'int64'),
+        ('preview_url', ('preview_url', ), 'string'),
+        ('restrictions.reason', ('restrictions', 'reason'), 'string'),
+        ('track_number', ('track_number', ), 'int64'),
+        ('type', ('type', ), 'string'),
+        ('uri', ('uri', ), 'string'),
+    ],
+    'SimplifiedTrackObject': [
+        ('artists.id', ('artists', '*', 'id'), 'list<string>'),
+        ('artists.name', ('artists', '*', 'name'), 'list<string>'),
+        ('available_markets', ('available_markets', ), 'list<string>'),
+        ('disc_number', ('disc_number', ), 'int64'),
+        ('duration_ms', ('duration_ms', ), 'int64'),
+        ('explicit', ('explicit', ), 'bool'),
+        ('external_urls.spotify', ('external_urls', 'spotify'), 'string'),
+        ('href', ('href', ), 'string'),
+        ('id', ('id', ), 'string'),
+        ('is_local', ('is_local', ), 'bool'),
+        ('is_playable', ('is_playable', ), 'bool'),
+        ('linked_from.external_urls.spotify', ('linked_from', 'external_urls',
+                                               'spotify'), 'string'),
+        ('linked_from.href', ('linked_from', 'href'), 'string'),
+        ('linked_from.id', ('linked_from', 'id'), 'string'),
+        ('linked_from.type', ('linked_from', 'type'), 'string'),
+        ('linked_from.uri', ('linked_from', 'uri'), 'string'),
+        ('name', ('name', ), 'string'),
+        ('preview_url', ('preview_url', ), 'string'),
+        ('restrictions.reason', ('restrictions', 'reason'), 'string'),
+        ('track_number', ('track_number', ), 'int64'),
+        ('type', ('type', ), 'string'),
+        ('uri', ('uri', ), 'string'),
+    ],
+    'PlaylistTrackObject': [
+        ('added_at', ('added_at', ), 'timestamp'),
+        ('added_by.display_name', ('added_by', 'display_name'), 'string'),
+        ('added_by.external_urls.spotify', ('added_by', 'external_urls',
+                                            'spotify'), 'string'),
+        ('added_by.followers.total', ('added_by', 'followers', 'total'),
+         'int64'),
+        ('added_by.href', ('added_by', 'href'), 'string'),
+        ('added_by.id', ('added_by', 'id'), 'string'),
+        ('added_by.product', ('added_by', 'product'), 'string'),
+        ('added_by.type', ('added_by', 'type'), 'string'),
+        ('added_by.uri', ('added_by', 'uri'), 'string'),
+        ('is_local', ('is_local', ), 'bool'),
+        ('track.album.album_group', ('track', 'album', 'album_group'),
+         'string'),
+        ('track.album.album_type', ('track', 'album', 'album_type'), 'string'),
+        ('track.album.available_markets',
+         ('track', 'album', 'available_markets'), 'list<string>'),
+        ('track.album.href', ('track', 'album', 'href'), 'string'),
+        ('track.album.id', ('track', 'album', 'id'), 'string'),
+        ('track.album.name', ('track', 'album', 'name'), 'string'),
+        ('track.album.release_date', ('track', 'album', 'release_date'),
+         'string'),
+        ('track.album.release_date_precision',
+         ('track', 'album', 'release_date_precision'), 'string'),
+        ('track.album.type', ('track', 'album', 'type'), 'string'),
+        ('track.album.uri', ('track', 'album', 'uri'), 'string'),
+        ('track.artists.id', ('track', 'artists', '*', 'id'), 'list<string>'),
+        ('track.artists.name', ('track', 'artists', '*', 'name'),
+         'list<string>'),
+        ('track.available_markets', ('track', 'available_markets'),
+         'list<string>'),
+        ('track.disc_number', ('track', 'disc_number'), 'int64'),
+        ('track.duration_ms', ('track', 'duration_ms'), 'int64'),
+        ('track.explicit', ('track', 'explicit'), 'bool'),
+        ('track.external_ids.ean', ('track', 'external_ids', 'ean'), 'string'),
+        ('track.external_ids.isrc', ('track', 'external_ids', 'isrc'),
+         'string'),
+        ('track.external_ids.upc', ('track', 'external_ids', 'upc'), 'string'),
+        ('track.external_urls.spotify', ('track', 'external_urls', 'spotify'),
+         'string'),
+        ('track.href', ('track', 'href'), 'string'),
+        ('track.id', ('track', 'id'), 'string'),
+        ('track.is_local', ('track', 'is_local'), 'bool'),
+        ('track.is_playable', ('track', 'is_playable'), 'bool'),
+        ('track.linked_from.href', ('track', 'linked_from', 'href'), 'string'),
+        ('track.linked_from.id', ('track', 'linked_from', 'id'), 'string'),
+        ('track.linked_from.type', ('track', 'linked_from', 'type'), 'string'),
+        ('track.linked_from.uri', ('track', 'linked_from', 'uri'), 'string'),
+        ('track.name', ('track', 'name'), 'string'),
+        ('track.popularity', ('track', 'popularity'), 'int64'),
+        ('track.preview_url', ('track', 'preview_url'), 'string'),
+        ('track.restrictions.reason', ('track', 'restrictions', 'reason'),
+         'string'),
+        ('track.track_number', ('track', 'track_number'), 'int64'),
+        ('track.type', ('track', 'type'), 'string'),
+        ('track.uri', ('track', 'uri'), 'string'),
+    ],
+    'SavedTrackObject': [
+        ('added_at', ('added_at', ), 'timestamp'),
+        ('track.album.album_group', ('track', 'album', 'album_group'),
+         'string'),
+        ('track.album.album_type', ('track', 'album', 'album_type'), 'string'),
+        ('track.album.available_markets',
+         ('track', 'album', 'available_markets'), 'list<string>'),
+        ('track.album.href', ('track', 'album', 'href'), 'string'),
+        ('track.album.id', ('track', 'album', 'id'), 'string'),
+        ('track.album.name', ('track', 'album', 'name'), 'string'),
+        ('track.album.release_date', ('track', 'album', 'release_date'),
+         'string'),
+        ('track.album.release_date_precision',
+         ('track', 'album', 'release_date_precision'), 'string'),
+        ('track.album.type', ('track', 'album', 'type'), 'string'),
+        ('track.album.uri', ('track', 'album', 'uri'), 'string'),
+        ('track.artists.id', ('track', 'artists', '*', 'id'), 'list<string>'),
+        ('track.artists.name', ('track', 'artists', '*', 'name'),
+         'list<string>'),
+        ('track.available_markets', ('track', 'available_markets'),
+         'list<string>'),
+        ('track.disc_number', ('track', 'disc_number'), 'int64'),
+        ('track.duration_ms', ('track', 'duration_ms'), 'int64'),
+        ('track.explicit', ('track', 'explicit'), 'bool'),
+        ('track.external_ids.ean', ('track', 'external_ids', 'ean'), 'string'),
+        ('track.external_ids.isrc', ('track', 'external_ids', 'isrc'),
+         'string'),
+        ('track.external_ids.upc', ('track', 'external_ids', 'upc'), 'string'),
+        ('track.external_urls.spotify', ('track', 'external_urls', 'spotify'),
+         'string'),
+        ('track.href', ('track', 'href'), 'string'),
+        ('track.id', ('track', 'id'), 'string'),
+        ('track.is_local', ('track', 'is_local'), 'bool'),
+        ('track.is_playable', ('track', 'is_playable'), 'bool'),
+        ('track.linked_from.href', ('track', 'linked_from', 'href'), 'string'),
+        ('track.linked_from.id', ('track', 'linked_from', 'id'), 'string'),
+        ('track.linked_from.type', ('track', 'linked_from', 'type'), 'string'),
+        ('track.linked_from.uri', ('track', 'linked_from', 'uri'), 'string'),
+        ('track.name', ('track', 'name'), 'string'),
+        ('track.popularity', ('track', 'popularity'), 'int64'),
+        ('track.preview_url', ('track', 'preview_url'), 'string'),
+        ('track.restrictions.reason', ('track', 'restrictions', 'reason'),
+         'string'),
+        ('track.track_number', ('track', 'track_number'), 'int64'),
+        ('track.type', ('track', 'type'), 'string'),
+        ('track.uri', ('track', 'uri'), 'string'),
+    ],
+    'AudioFeaturesObject': [
+        ('acousticness', ('acousticness', ), 'float64'),
+        ('analysis_url', ('analysis_url', ), 'string'),
+        ('danceability', ('danceability', ), 'float64'),
+        ('duration_ms', ('duration_ms', ), 'int64'),
+        ('energy', ('energy', ), 'float64'),
+        ('id', ('id', ), 'string'),
+        ('instrumentalness', ('instrumentalness', ), 'float64'),
+        ('key', ('key', ), 'int64'),
+        ('liveness', ('liveness', ), 'float64'),
+        ('loudness', ('loudness', ), 'float64'),
+        ('mode', ('mode', ), 'int64'),
+        ('speechiness', ('speechiness', ), 'float64'),
+        ('tempo', ('tempo', ), 'float64'),
+        ('time_signature', ('time_signature', ), 'int64'),
+        ('track_href', ('track_href', ), 'string'),
+        ('type', ('type', ), 'string'),
+        ('uri', ('uri', ), 'string'),
+        ('valence', ('valence', ), 'float64'),
+    ],
+}
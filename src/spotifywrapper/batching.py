@@ -0,0 +1,270 @@
+"""
+Batch any number of Spotify IDs onto the bulk endpoints of the Web API.
+"""
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
+from typing import Any, List, Optional, Sequence, Set, Tuple
+
+from .object_library import ErrorObject, SpotifyObject
+from .utilities import chunked
+
+# The maximum number of IDs each bulk endpoint accepts in one request.
+BATCH_LIMITS = {
+    'get_multiple_albums': 20,
+    'get_multiple_artists': 50,
+    'get_several_tracks': 50,
+    'get_multiple_episodes': 50,
+    'get_multiple_shows': 50,
+    'get_audio_features_for_several_tracks': 100,
+}
+
+# The bulk endpoint returning the same object type as each single-item
+# getter. get_a_show is left out because get_multiple_shows only returns
+# simplified shows.
+BULK_METHODS = {
+    'get_an_album': 'get_multiple_albums',
+    'get_an_artist': 'get_multiple_artists',
+    'get_a_track': 'get_several_tracks',
+    'get_an_episode': 'get_multiple_episodes',
+    'get_audio_features_for_a_track': 'get_audio_features_for_several_tracks',
+}
+
+
+def get_batch_limit(method_name: str) -> int:
+    """Return the maximum number of IDs the bulk method accepts.
+
+    Raises:
+        ValueError: If the method is not a bulk endpoint.
+    """
+    try:
+        return BATCH_LIMITS[method_name]
+    except KeyError:
+        raise ValueError(f'{method_name!r} is not a bulk endpoint. Choose '
+                         f'one of {list(BATCH_LIMITS)}.') from None
+
+
+def get_bulk_method_name(method_name: str) -> str:
+    """Return the name of the bulk method which can answer the single-item
+    getter.
+
+    Raises:
+        ValueError: If the getter has no matching bulk endpoint.
+    """
+    try:
+        return BULK_METHODS[method_name]
+    except KeyError:
+        raise ValueError(f'{method_name!r} has no bulk endpoint. Choose one '
+                         f'of {list(BULK_METHODS)}.') from None
+
+
+def merge_batches(id_chunks: List[Sequence[str]],
+                  results: List[Any]) -> List[Optional[SpotifyObject]]:
+    """Flatten the results of each chunk back into the order of the ids.
+    The ids of a chunk that failed with an ErrorObject are filled with
+    None."""
+    merged = []
+    for ids, result in zip(id_chunks, results):
+        if isinstance(result, ErrorObject):
+            merged.extend([None] * len(ids))
+        else:
+            merged.extend(result)
+    return merged
+
+
+def get_in_batches(sp, method_name: str, ids: Sequence[str],
+                   max_workers: int = 4,
+                   **kwargs) -> List[Optional[SpotifyObject]]:
+    """Call the bulk method with any number of ids by splitting them into
+    chunks of the endpoint's maximum size and requesting the chunks
+    concurrently.
+
+    Args:
+        sp: The SpotifyAPI instance to send the requests through.
+        method_name: The name of the bulk method, e.g. 'get_several_tracks'.
+        ids: The Spotify IDs to request.
+        max_workers: The maximum number of chunks requested at once.
+        **kwargs: Extra arguments passed to every request, e.g. market.
+
+    Returns:
+        A list with one object per id in the same order as the ids. Unknown
+        ids and ids of a failed chunk are None.
+    """
+    id_chunks = chunked(list(ids), get_batch_limit(method_name))
+    method = getattr(sp, method_name)
+    with ThreadPoolExecutor(max_workers) as executor:
+        results = list(executor.map(lambda chunk: method(chunk, **kwargs),
+                                    id_chunks))
+    return merge_batches(id_chunks, results)
+
+
+async def async_get_in_batches(sp, method_name: str, ids: Sequence[str],
+                               max_concurrency: Optional[int] = None,
+                               **kwargs) -> List[Optional[SpotifyObject]]:
+    """Asyncio version of get_in_batches for an AsyncSpotifyAPI instance.
+
+    Args:
+        sp: The AsyncSpotifyAPI instance to send the requests through.
+        method_name: The name of the bulk method, e.g. 'get_several_tracks'.
+        ids: The Spotify IDs to request.
+        max_concurrency: Optional; The maximum number of chunks requested at
+            once. All chunks are requested at once if omitted.
+        **kwargs: Extra arguments passed to every request, e.g. market.
+    """
+    id_chunks = chunked(list(ids), get_batch_limit(method_name))
+    method = getattr(sp, method_name)
+    semaphore = asyncio.Semaphore(max_concurrency or len(id_chunks) or 1)
+
+    async def request_chunk(chunk):
+        async with semaphore:
+            return await method(chunk, **kwargs)
+
+    results = await asyncio.gather(*(request_chunk(chunk)
+                                     for chunk in id_chunks))
+    return merge_batches(id_chunks, results)
+
+
+class ItemBatcher:
+    """Merge concurrent single-item calls, e.g. get_a_track from many
+    threads, into bulk requests.
+
+    A bulk request is sent as soon as enough ids are waiting to fill it, or
+    after max_delay seconds for a partial batch.
+
+    Args:
+        sp: The SpotifyAPI instance to send the bulk requests through.
+        method_name: The single-item getter to merge, e.g. 'get_a_track'.
+        max_delay: The number of seconds to wait for more ids before a
+            partial batch is sent.
+        **kwargs: Extra arguments passed to every bulk request, e.g. market.
+    """
+
+    def __init__(self, sp, method_name: str, max_delay: float = 0.01,
+                 **kwargs):
+        bulk_method_name = get_bulk_method_name(method_name)
+        self._bulk_method = getattr(sp, bulk_method_name)
+        self._limit = get_batch_limit(bulk_method_name)
+        self._max_delay = max_delay
+        self._kwargs = kwargs
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[str, Future]] = []
+        self._timer: Optional[threading.Timer] = None
+
+    def get(self, id_: str) -> Optional[SpotifyObject]:
+        """Return the object of the id once its batch has been requested.
+        Returns None for an unknown id and the ErrorObject if the batch
+        failed."""
+        return self.submit(id_).result()
+
+    def submit(self, id_: str) -> Future:
+        """Queue the id and return a future of its object."""
+        future = Future()
+        with self._lock:
+            self._pending.append((id_, future))
+            if len(self._pending) >= self._limit:
+                batch = self._pending[:self._limit]
+                del self._pending[:self._limit]
+            else:
+                batch = None
+                if self._timer is None:
+                    self._timer = threading.Timer(self._max_delay,
+                                                  self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+        if batch:
+            self._send(batch)
+        return future
+
+    def flush(self) -> None:
+        """Send every waiting id right away."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        for batch in chunked(pending, self._limit):
+            self._send(batch)
+
+    def _send(self, batch: List[Tuple[str, Future]]) -> None:
+        """Request the batch and resolve the future of each id."""
+        try:
+            result = self._bulk_method([id_ for id_, _ in batch],
+                                       **self._kwargs)
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        if isinstance(result, ErrorObject):
+            result = [result] * len(batch)
+        for (_, future), item in zip(batch, result):
+            future.set_result(item)
+
+
+class AsyncItemBatcher:
+    """Asyncio version of ItemBatcher for an AsyncSpotifyAPI instance.
+
+    Args:
+        sp: The AsyncSpotifyAPI instance to send the bulk requests through.
+        method_name: The single-item getter to merge, e.g. 'get_a_track'.
+        max_delay: The number of seconds to wait for more ids before a
+            partial batch is sent.
+        **kwargs: Extra arguments passed to every bulk request, e.g. market.
+    """
+
+    def __init__(self, sp, method_name: str, max_delay: float = 0.01,
+                 **kwargs):
+        bulk_method_name = get_bulk_method_name(method_name)
+        self._bulk_method = getattr(sp, bulk_method_name)
+        self._limit = get_batch_limit(bulk_method_name)
+        self._max_delay = max_delay
+        self._kwargs = kwargs
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def get(self, id_: str) -> Optional[SpotifyObject]:
+        """Return the object of the id once its batch has been requested.
+        Returns None for an unknown id and the ErrorObject if the batch
+        failed."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((id_, future))
+        if len(self._pending) >= self._limit:
+            batch = self._pending[:self._limit]
+            del self._pending[:self._limit]
+            self._start_send(batch)
+        elif self._handle is None:
+            self._handle = loop.call_later(self._max_delay, self.flush)
+        return await future
+
+    def flush(self) -> None:
+        """Send every waiting id right away."""
+        pending, self._pending = self._pending, []
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        for batch in chunked(pending, self._limit):
+            self._start_send(batch)
+
+    def _start_send(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """Request the batch in a task which is kept referenced until it is
+        done."""
+        task = asyncio.ensure_future(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """Request the batch and resolve the future of each id."""
+        try:
+            result = await self._bulk_method([id_ for id_, _ in batch],
+                                             **self._kwargs)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        if isinstance(result, ErrorObject):
+            result = [result] * len(batch)
+        for (_, future), item in zip(batch, result):
+            if not future.done():
+                future.set_result(item)
@@ -0,0 +1,237 @@
+"""
+Caches of the Web API's GET responses and of the decoded objects.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .utilities import hash_request
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# How long a response stays fresh, keyed by the first path segment after
+# /v1/. Catalog data rarely changes so it is kept the longest. Endpoints
+# which are not listed are only stored when they return an ETag, and are
+# then revalidated on every request.
+DEFAULT_TTLS = {
+    'albums': 7 * DAY,
+    'artists': DAY,
+    'audio-analysis': 30 * DAY,
+    'audio-features': 30 * DAY,
+    'browse': HOUR,
+    'episodes': DAY,
+    'markets': DAY,
+    'recommendations': 10 * MINUTE,
+    'shows': DAY,
+    'tracks': 7 * DAY,
+}
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body and its validator."""
+    key: str
+    body: bytes
+    etag: Optional[str]
+    expires: float
+
+    @property
+    def fresh(self) -> bool:
+        """Whether the entry can be used without asking the server."""
+        return self.expires > time.time()
+
+
+class ResponseCache:
+    """SQLite backed cache of GET responses keyed by the normalized url and
+    query parameters.
+
+    Fresh entries are returned without a request. Stale entries which have
+    an ETag are revalidated with If-None-Match, so an unchanged resource
+    only costs an empty 304 response. Once the stored bodies exceed
+    max_size bytes the least recently used entries are evicted.
+
+    Args:
+        path: The path of the SQLite database file.
+        max_size: The maximum total size in bytes of the stored bodies.
+        ttls: Optional; The number of seconds a response stays fresh, keyed
+            by the first path segment after /v1/, e.g. {'albums': 3600}.
+            Defaults to DEFAULT_TTLS.
+        default_ttl: The number of seconds a response of an endpoint missing
+            from ttls stays fresh.
+    """
+
+    def __init__(self,
+                 path: str = 'spotify_cache.sqlite',
+                 max_size: int = 256 * 1024 * 1024,
+                 ttls: Optional[Dict[str, float]] = None,
+                 default_ttl: float = 0):
+        self.max_size = max_size
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path,
+                                           check_same_thread=False,
+                                           isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'key TEXT PRIMARY KEY, body BLOB NOT NULL, etag TEXT, '
+            'expires REAL NOT NULL, size INTEGER NOT NULL, '
+            'last_access REAL NOT NULL)')
+        self._connection.execute(
+            'CREATE INDEX IF NOT EXISTS responses_last_access '
+            'ON responses (last_access)')
+        self._size = self._connection.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute(
+                'SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    @property
+    def size(self) -> int:
+        """Return the total size in bytes of the stored bodies."""
+        return self._size
+
+    def get_ttl(self, url: str) -> float:
+        """Return the number of seconds a response of the url stays
+        fresh."""
+        segments = urlsplit(url).path.split('/')
+        resource = segments[2] if len(segments) > 2 else ''
+        return self.ttls.get(resource, self.default_ttl)
+
+    def lookup(self, url: str,
+               query_params: dict) -> Tuple[str, Optional[CacheEntry]]:
+        """Return the key of the request and its entry if one is stored."""
+        key = hash_request(url, query_params)
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT body, etag, expires FROM responses WHERE key = ?',
+                (key,)).fetchone()
+            if row is None:
+                return key, None
+            self._connection.execute(
+                'UPDATE responses SET last_access = ? WHERE key = ?',
+                (time.time(), key))
+        return key, CacheEntry(key, *row)
+
+    def store(self, key: str, url: str, body: bytes,
+              etag: Optional[str] = None) -> None:
+        """Store the body of a successful response. Bodies of endpoints
+        without a ttl are only stored when they can be revalidated with an
+        ETag."""
+        ttl = self.get_ttl(url)
+        if ttl <= 0 and not etag:
+            return
+        size = len(body)
+        now = time.time()
+        with self._lock:
+            old_size = self._connection.execute(
+                'SELECT size FROM responses WHERE key = ?',
+                (key,)).fetchone()
+            self._connection.execute(
+                'INSERT OR REPLACE INTO responses '
+                '(key, body, etag, expires, size, last_access) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (key, body, etag, now + ttl, size, now))
+            self._size += size - (old_size[0] if old_size else 0)
+            self._evict()
+
+    def refresh(self, key: str, url: str) -> None:
+        """Mark the entry as fresh again after the server confirmed it is
+        unchanged."""
+        with self._lock:
+            self._connection.execute(
+                'UPDATE responses SET expires = ? WHERE key = ?',
+                (time.time() + self.get_ttl(url), key))
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._connection.execute('DELETE FROM responses')
+            self._size = 0
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries until the stored bodies
+        fit in max_size. Must be called while holding the lock."""
+        while self._size > self.max_size:
+            rows = self._connection.execute(
+                'SELECT key, size FROM responses '
+                'ORDER BY last_access LIMIT 64').fetchall()
+            if not rows:
+                self._size = 0
+                return
+            for key, size in rows:
+                self._connection.execute(
+                    'DELETE FROM responses WHERE key = ?', (key,))
+                self._size -= size
+                if self._size <= self.max_size:
+                    return
+
+
+class EntityCache:
+    """In-memory LRU cache of decoded objects keyed by their entity type
+    (e.g. 'album' or 'audio_features'), Spotify ID and market.
+
+    Args:
+        max_entries: The maximum number of objects kept. The least recently
+            used objects are evicted first.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entities: OrderedDict = OrderedDict()
+
+    def __len__(self):
+        return len(self._entities)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Return the hit, miss and eviction counters."""
+        return dict(hits=self.hits, misses=self.misses,
+                    evictions=self.evictions)
+
+    def get(self, entity_type: str, id_: str, market: Optional[str] = None):
+        """Return the cached object or None if it is not cached."""
+        key = (entity_type, id_, market)
+        with self._lock:
+            entity = self._entities.get(key)
+            if entity is None:
+                self.misses += 1
+                return None
+            self._entities.move_to_end(key)
+            self.hits += 1
+            return entity
+
+    def put(self, entity_type: str, id_: str, entity,
+            market: Optional[str] = None) -> None:
+        """Cache the object, evicting the least recently used objects once
+        there are more than max_entries."""
+        key = (entity_type, id_, market)
+        with self._lock:
+            self._entities[key] = entity
+            self._entities.move_to_end(key)
+            while len(self._entities) > self.max_entries:
+                self._entities.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove every object and reset the counters."""
+        with self._lock:
+            self._entities.clear()
+            self.hits = self.misses = self.evictions = 0
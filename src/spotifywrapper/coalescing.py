@@ -0,0 +1,91 @@
+"""
+Coalesce identical GET requests which are in flight at the same time, so
+concurrent callers asking for the same resource share one HTTP request.
+"""
+import asyncio
+import threading
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class _Call:
+    """A call in flight and the result its waiters receive."""
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Runs one call per key at a time. The first caller of a key runs the
+    call and every caller arriving while it is in flight waits for its
+    result, or its exception, instead of running the call again. Once the
+    call has finished the key is forgotten, so nothing is cached.
+
+    The same key is coalesced across threads with do and across tasks with
+    async_do.
+    """
+
+    def __init__(self):
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._tasks: Dict[str, asyncio.Future] = {}
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """Return the result of fn, shared with the other callers of the
+        key.
+
+        Raises:
+            Exception: Whatever fn raised, in every caller sharing it.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def async_do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Return the result of the coroutine created by fn, shared with the
+        other callers of the key. The coroutine runs in its own task, so a
+        cancelled caller does not cancel it for the others.
+
+        Raises:
+            Exception: Whatever the coroutine raised, in every caller
+                sharing it.
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = self._tasks[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Future) -> None:
+        """Drop the finished task of the key. Its exception is retrieved so
+        a task whose callers were all cancelled does not log it."""
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,188 @@
+"""
+Export streams of objects to Arrow record batches and Parquet files.
+Requires the optional pyarrow dependency.
+"""
+from typing import Iterable, Iterator, List, Tuple, Type, Union
+
+from .arrow_schemas import COLUMNS
+from .object_library import SpotifyObject
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+Column = Tuple[str, Tuple[str, ...], str]
+ItemType = Union[Type[SpotifyObject], str]
+
+
+def require_pyarrow() -> None:
+    """Make sure pyarrow is installed.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    if pa is None:
+        raise ImportError('pyarrow is required for the Arrow export. '
+                          'Install it with '
+                          '"pip install spotifywrapper[arrow]".')
+
+
+def get_columns(item_type: ItemType) -> List[Column]:
+    """Return the columns of the exported class, e.g. TrackObject.
+
+    Raises:
+        ValueError: If the class can not be exported.
+    """
+    name = item_type if isinstance(item_type, str) else item_type.__name__
+    try:
+        return COLUMNS[name]
+    except KeyError:
+        raise ValueError(f'{name} can not be exported. Choose one of '
+                         f'{list(COLUMNS)}.') from None
+
+
+def _get_arrow_type(type_name: str) -> 'pa.DataType':
+    """Return the Arrow type of a column's type name."""
+    return {'string': pa.string(),
+            'int64': pa.int64(),
+            'float64': pa.float64(),
+            'bool': pa.bool_(),
+            'timestamp': pa.timestamp('ms', tz='UTC'),
+            'list<string>': pa.list_(pa.string())}[type_name]
+
+
+def get_schema(item_type: ItemType) -> 'pa.Schema':
+    """Return the Arrow schema of the exported class.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+        ValueError: If the class can not be exported.
+    """
+    require_pyarrow()
+    return pa.schema([pa.field(name, _get_arrow_type(type_name))
+                      for name, _, type_name in get_columns(item_type)])
+
+
+def _get_path(value, path: Tuple[str, ...]):
+    """Return the value at the json path, mapping the rest of the path over
+    a list at '*'. Missing values are None."""
+    for i, key in enumerate(path):
+        if value is None:
+            return None
+        if key == '*':
+            return [_get_path(item, path[i + 1:]) for item in value]
+        value = value.get(key)
+    return value
+
+
+def _create_array(values: list, type_name: str) -> 'pa.Array':
+    """Convert the values of a column into an Arrow array. Timestamps are
+    parsed by Arrow from their ISO 8601 strings."""
+    if type_name == 'timestamp':
+        return pa.array(values, pa.string()).cast(_get_arrow_type(type_name))
+    return pa.array(values, _get_arrow_type(type_name))
+
+
+def record_batch(items: Iterable[Union[SpotifyObject, dict]],
+                 item_type: ItemType) -> 'pa.RecordBatch':
+    """Convert the objects, or their raw json dictionaries, into one record
+    batch. The values are read straight from the json, so no property is
+    called and no nested object is wrapped.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+        ValueError: If the class can not be exported.
+    """
+    require_pyarrow()
+    columns = get_columns(item_type)
+    rows = [getattr(item, '_json_dict', item) for item in items]
+    arrays = [_create_array([_get_path(row, path) for row in rows], type_name)
+              for _, path, type_name in columns]
+    return pa.RecordBatch.from_arrays(arrays, schema=get_schema(item_type))
+
+
+def iter_record_batches(items: Iterable[Union[SpotifyObject, dict]],
+                        item_type: ItemType,
+                        batch_size: int = 65536
+                        ) -> Iterator['pa.RecordBatch']:
+    """Convert a stream of objects into record batches of at most
+    batch_size rows, holding one batch of rows in memory at a time."""
+    rows = []
+    for item in items:
+        rows.append(item)
+        if len(rows) >= batch_size:
+            yield record_batch(rows, item_type)
+            rows = []
+    if rows:
+        yield record_batch(rows, item_type)
+
+
+class ParquetExporter:
+    """Write streams of objects to a Parquet file in row groups of at most
+    row_group_size rows. Only the rows of the current row group are held in
+    memory.
+
+    Example:
+        with ParquetExporter('tracks.parquet', PlaylistTrackObject) as out:
+            out.write(sp.iter_items('get_a_playlists_items', playlist_id))
+
+    Args:
+        path: The path of the Parquet file.
+        item_type: The class of the exported objects, e.g. TrackObject.
+        row_group_size: The maximum number of rows of a row group.
+        compression: The compression codec of the file.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+        ValueError: If the class can not be exported.
+    """
+
+    def __init__(self, path: str, item_type: ItemType,
+                 row_group_size: int = 65536, compression: str = 'zstd'):
+        require_pyarrow()
+        self.item_type = item_type
+        self.row_group_size = row_group_size
+        self.rows_written = 0
+        self._rows = []
+        self._writer = pq.ParquetWriter(path, get_schema(item_type),
+                                        compression=compression)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, items: Iterable[Union[SpotifyObject, dict]]) -> None:
+        """Add the objects to the file, writing a row group every time
+        row_group_size rows are waiting."""
+        for item in items:
+            self._rows.append(item)
+            if len(self._rows) >= self.row_group_size:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write the waiting rows as a row group."""
+        if not self._rows:
+            return
+        table = pa.Table.from_batches([record_batch(self._rows,
+                                                    self.item_type)])
+        self._writer.write_table(table, row_group_size=self.row_group_size)
+        self.rows_written += len(self._rows)
+        self._rows = []
+
+    def close(self) -> None:
+        """Write the waiting rows and close the file."""
+        self.flush()
+        self._writer.close()
+
+
+def export_parquet(items: Iterable[Union[SpotifyObject, dict]], path: str,
+                   item_type: ItemType, row_group_size: int = 65536) -> int:
+    """Write a stream of objects to a Parquet file and return the number of
+    rows written. See ParquetExporter."""
+    with ParquetExporter(path, item_type, row_group_size) as exporter:
+        exporter.write(items)
+    return exporter.rows_written
@@ -0,0 +1,192 @@
+"""
+Buffer saves and removals of the user's library and send them in bulk.
+"""
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .object_library import ErrorObject
+from .utilities import SpotifyAPIError
+
+# The maximum number of IDs the library endpoints accept in one request.
+MAX_IDS_PER_REQUEST = 50
+
+# The methods saving and removing each type of library item.
+LIBRARY_METHODS = {
+    'tracks': ('save_tracks_for_users', 'remove_users_saved_tracks'),
+    'albums': ('save_albums_for_current_user',
+               'remove_albums_for_current_user'),
+    'episodes': ('save_episodes_for_user', 'remove_users_saved_episodes'),
+    'shows': ('save_shows_for_current_user', 'remove_users_saved_shows'),
+}
+
+
+def get_library_methods(item_type: str) -> Tuple[str, str]:
+    """Return the names of the methods saving and removing the item type.
+
+    Raises:
+        ValueError: If the item type is not part of the library.
+    """
+    try:
+        return LIBRARY_METHODS[item_type]
+    except KeyError:
+        raise ValueError(f'{item_type!r} is not a library item type. Choose '
+                         f'one of {list(LIBRARY_METHODS)}.') from None
+
+
+class LibraryQueue:
+    """Buffer saves and removals of one type of library item, e.g. the
+    user's saved tracks, and send them in requests of 50 IDs.
+
+    Each queued save or remove flips the saved state of an id, so a remove
+    cancels a pending save of the same id (and a save a pending remove):
+    toggling an id before it is sent sends nothing. Repeated saves or
+    removals are sent once. Full chunks are sent as soon as they fill up
+    and partial ones after max_delay seconds, by up to max_workers requests
+    at once. An id is never in two requests at the same time, so its
+    writes are applied in the order they were queued.
+
+    Example:
+        with sp.library_queue('tracks') as queue:
+            for id_ in liked:
+                queue.save([id_])
+
+    Args:
+        sp: The SpotifyAPI instance to send the requests through.
+        item_type: 'tracks', 'albums', 'episodes' or 'shows'.
+        max_delay: The number of seconds to wait for more ids before a
+            partial chunk is sent.
+        max_workers: The maximum number of requests sent at once.
+
+    Raises:
+        ValueError: If the item type is not part of the library.
+    """
+
+    def __init__(self, sp, item_type: str, max_delay: float = 0.5,
+                 max_workers: int = 4):
+        save_method_name, remove_method_name = get_library_methods(item_type)
+        self._methods = {True: getattr(sp, save_method_name),
+                         False: getattr(sp, remove_method_name)}
+        self.item_type = item_type
+        self.requests = 0
+        self._max_delay = max_delay
+        self._executor = ThreadPoolExecutor(max_workers)
+        self._lock = threading.Lock()
+        self._pending: Dict[str, bool] = {}
+        self._in_flight: Set[str] = set()
+        self._futures: Set[Future] = set()
+        self._errors: List[Exception] = []
+        self._timer: Optional[threading.Timer] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def pending(self) -> int:
+        """Return the number of ids waiting to be sent."""
+        with self._lock:
+            return len(self._pending)
+
+    def save(self, ids: Iterable[str]) -> None:
+        """Queue saving the ids to the library."""
+        self._queue(ids, True)
+
+    def remove(self, ids: Iterable[str]) -> None:
+        """Queue removing the ids from the library."""
+        self._queue(ids, False)
+
+    def flush(self) -> None:
+        """Send every waiting id right away and wait for all the requests.
+
+        Raises:
+            SpotifyAPIError: If a request failed.
+            Exception: Whatever a request raised, e.g. PermissionError for
+                a missing scope.
+        """
+        while True:
+            with self._lock:
+                self._cancel_timer()
+                self._dispatch(full_only=False)
+                futures = set(self._futures)
+                if not futures and not self._pending:
+                    errors, self._errors = self._errors, []
+                    break
+            wait(futures)
+            with self._lock:
+                self._futures -= futures
+        if errors:
+            raise errors[0]
+
+    def close(self) -> None:
+        """Flush the waiting ids and stop the worker threads."""
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def _queue(self, ids: Iterable[str], save: bool) -> None:
+        """Merge the ids into the pending writes and send the full chunks."""
+        with self._lock:
+            for id_ in ids:
+                pending = self._pending.get(id_)
+                if pending is None:
+                    self._pending[id_] = save
+                elif pending is not save:
+                    del self._pending[id_]
+            self._dispatch(full_only=True)
+            self._start_timer()
+
+    def _dispatch(self, full_only: bool) -> None:
+        """Send the pending ids which are not in flight, in full chunks only
+        unless full_only is False. Must be called with the lock held."""
+        for save in (True, False):
+            ids = [id_ for id_, pending in self._pending.items()
+                   if pending is save and id_ not in self._in_flight]
+            while len(ids) >= MAX_IDS_PER_REQUEST or (ids and not full_only):
+                chunk = ids[:MAX_IDS_PER_REQUEST]
+                del ids[:MAX_IDS_PER_REQUEST]
+                for id_ in chunk:
+                    del self._pending[id_]
+                self._in_flight.update(chunk)
+                future = self._executor.submit(self._send, save, chunk)
+                self._futures.add(future)
+                future.add_done_callback(self._futures.discard)
+
+    def _send(self, save: bool, ids: List[str]) -> None:
+        """Send one chunk and keep its error."""
+        try:
+            result = self._methods[save](ids)
+        except Exception as e:
+            result = e
+        with self._lock:
+            self.requests += 1
+            self._in_flight.difference_update(ids)
+            if isinstance(result, ErrorObject):
+                self._errors.append(SpotifyAPIError(result))
+            elif isinstance(result, Exception):
+                self._errors.append(result)
+            # Ids queued again while this chunk was in flight were held back.
+            self._start_timer()
+
+    def _start_timer(self) -> None:
+        """Send the partial chunks after max_delay seconds. Must be called
+        with the lock held."""
+        if self._pending and self._timer is None:
+            self._timer = threading.Timer(self._max_delay, self._on_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _cancel_timer(self) -> None:
+        """Must be called with the lock held."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            self._timer = None
+            self._dispatch(full_only=False)
+            self._start_timer()
@@ -0,0 +1,215 @@
+"""
+Columnar NumPy views of Web API results. Requires the optional numpy
+dependency.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .batching import get_batch_limit
+from .object_library import AudioFeaturesObject, ErrorObject
+from .utilities import SpotifyAPIError, chunked
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+AUDIO_FEATURES_URL = 'https://api.spotify.com/v1/audio-features'
+
+# The numeric attributes of an AudioFeaturesObject, in column order.
+AUDIO_FEATURE_COLUMNS = ('acousticness', 'danceability', 'duration_ms',
+                         'energy', 'instrumentalness', 'key', 'liveness',
+                         'loudness', 'mode', 'speechiness', 'tempo',
+                         'time_signature', 'valence')
+
+# The fields of the structured arrays of an audio analysis. Times are kept
+# as float64 and everything else as float32, or int32 for the estimates
+# the API reports as integers. Segments hold their 12 pitches and 12
+# timbre values as (12,) subarrays.
+INTERVAL_FIELDS = [('start', 'f8'), ('duration', 'f8'), ('confidence', 'f4')]
+SECTION_FIELDS = INTERVAL_FIELDS + [
+    ('loudness', 'f4'), ('tempo', 'f4'), ('tempo_confidence', 'f4'),
+    ('key', 'i4'), ('key_confidence', 'f4'), ('mode', 'i4'),
+    ('mode_confidence', 'f4'), ('time_signature', 'i4'),
+    ('time_signature_confidence', 'f4')]
+SEGMENT_FIELDS = INTERVAL_FIELDS + [
+    ('loudness_start', 'f4'), ('loudness_max', 'f4'),
+    ('loudness_max_time', 'f4'), ('loudness_end', 'f4'),
+    ('pitches', 'f4', (12,)), ('timbre', 'f4', (12,))]
+
+
+def require_numpy() -> None:
+    """Make sure numpy is installed.
+
+    Raises:
+        ImportError: If numpy is not installed.
+    """
+    if np is None:
+        raise ImportError('numpy is required for the columnar results. '
+                          'Install it with '
+                          '"pip install spotifywrapper[numpy]".')
+
+
+@dataclass
+class FeatureMatrix:
+    """Audio features of many tracks as one matrix, float32 by default.
+
+    float32 only holds integers up to 2**24 exactly, so a duration_ms above
+    16,777,216 (about 4.7 hours) is rounded. Decode with dtype='float64' to
+    keep every column exact.
+
+    Attributes:
+        data: The (n_tracks, n_columns) matrix.
+        columns: The name of each column.
+        index: The row of each track ID.
+    """
+    data: 'np.ndarray'
+    columns: Tuple[str, ...]
+    index: Dict[str, int]
+
+    def __len__(self):
+        return len(self.data)
+
+    @property
+    def ids(self) -> List[str]:
+        """Return the track IDs in row order."""
+        return list(self.index)
+
+    def column(self, name: str) -> 'np.ndarray':
+        """Return the column of the feature, e.g. 'tempo', as a view."""
+        return self.data[:, self.columns.index(name)]
+
+    def row(self, id_: str) -> 'np.ndarray':
+        """Return the features of the track ID as a view."""
+        return self.data[self.index[id_]]
+
+
+def audio_features_matrix(
+        features: Iterable[Optional[Union[dict, AudioFeaturesObject]]],
+        columns: Sequence[str] = AUDIO_FEATURE_COLUMNS,
+        dtype: str = 'float32') -> FeatureMatrix:
+    """Convert audio features (raw json dictionaries or AudioFeaturesObject
+    instances) into a FeatureMatrix in one vectorized decode. None entries,
+    which the API returns for unknown IDs, are skipped.
+
+    Args:
+        features: The audio features of the tracks.
+        columns: The features to keep, in column order.
+        dtype: The dtype of the matrix. 'float64' keeps duration_ms exact.
+
+    Raises:
+        ImportError: If numpy is not installed.
+    """
+    require_numpy()
+    rows = [feature._json_dict if isinstance(feature, AudioFeaturesObject)
+            else feature
+            for feature in features
+            if feature is not None]
+    columns = tuple(columns)
+    values = chain.from_iterable([row[column] for column in columns]
+                                 for row in rows)
+    data = np.fromiter(values, dtype=dtype,
+                       count=len(rows) * len(columns))
+    index = {row['id']: i for i, row in enumerate(rows)}
+    return FeatureMatrix(data.reshape(len(rows), len(columns)), columns,
+                         index)
+
+
+def analysis_array(rows: List[dict], fields: list) -> 'np.ndarray':
+    """Convert the intervals of an audio analysis (e.g. its segments) into a
+    structured array, filling one field at a time from the raw json without
+    creating an object per interval. Missing and null values are NaN, or -1
+    for the integer fields, which is what the API uses for an unknown key.
+
+    Args:
+        rows: The raw json of the intervals.
+        fields: The structured array fields, e.g. SEGMENT_FIELDS.
+
+    Raises:
+        ImportError: If numpy is not installed.
+    """
+    require_numpy()
+    dtype = np.dtype(fields)
+    array = np.empty(len(rows), dtype=dtype)
+    for name in dtype.names:
+        field_dtype = dtype[name]
+        missing = -1 if field_dtype.base.kind == 'i' else np.nan
+        if field_dtype.shape:
+            empty = np.full(field_dtype.shape, missing)
+            values = [empty if row.get(name) is None else row[name]
+                      for row in rows]
+            array[name] = np.asarray(values, dtype=field_dtype.base).reshape(
+                len(rows), *field_dtype.shape)
+            continue
+        array[name] = np.fromiter(
+            (missing if row.get(name) is None else row[name] for row in rows),
+            dtype=field_dtype, count=len(rows))
+    return array
+
+
+def _check_features_response(response: dict, error: bool) -> List[dict]:
+    """Return the raw audio features of a response.
+
+    Raises:
+        SpotifyAPIError: If the request failed.
+    """
+    if error:
+        raise SpotifyAPIError(ErrorObject(response))
+    return response['audio_features']
+
+
+def get_audio_features_matrix(sp, ids: Sequence[str], max_workers: int = 4,
+                              columns: Sequence[str] = AUDIO_FEATURE_COLUMNS,
+                              dtype: str = 'float32') -> FeatureMatrix:
+    """Request the audio features of any number of tracks, 100 IDs per
+    request, and decode them straight into a FeatureMatrix without creating
+    an AudioFeaturesObject per track.
+
+    Args:
+        sp: The SpotifyAPI instance to send the requests through.
+        ids: The Spotify IDs of the tracks.
+        max_workers: The maximum number of chunks requested at once.
+        columns: The features to keep, in column order.
+        dtype: The dtype of the matrix. 'float64' keeps duration_ms exact.
+
+    Raises:
+        ImportError: If numpy is not installed.
+        SpotifyAPIError: If one of the requests fails.
+    """
+    require_numpy()
+    id_chunks = chunked(list(ids),
+                        get_batch_limit('get_audio_features_for_several_'
+                                        'tracks'))
+
+    def request_chunk(chunk):
+        return _check_features_response(
+            *sp._get(AUDIO_FEATURES_URL, {'ids': chunk}, {}))
+
+    with ThreadPoolExecutor(max_workers) as executor:
+        results = list(executor.map(request_chunk, id_chunks))
+    return audio_features_matrix(chain.from_iterable(results), columns, dtype)
+
+
+async def async_get_audio_features_matrix(
+        sp, ids: Sequence[str], max_concurrency: Optional[int] = None,
+        columns: Sequence[str] = AUDIO_FEATURE_COLUMNS,
+        dtype: str = 'float32') -> FeatureMatrix:
+    """Asyncio version of get_audio_features_matrix for an AsyncSpotifyAPI
+    instance."""
+    require_numpy()
+    id_chunks = chunked(list(ids),
+                        get_batch_limit('get_audio_features_for_several_'
+                                        'tracks'))
+    semaphore = asyncio.Semaphore(max_concurrency or len(id_chunks) or 1)
+
+    async def request_chunk(chunk):
+        async with semaphore:
+            return _check_features_response(
+                *await sp._get(AUDIO_FEATURES_URL, {'ids': chunk}, {}))
+
+    results = await asyncio.gather(*(request_chunk(chunk)
+                                     for chunk in id_chunks))
+    return audio_features_matrix(chain.from_iterable(results), columns, dtype)
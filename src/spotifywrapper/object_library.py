@@ -2,28 +2,78 @@
 
 from collections.abc import Sequence
 from datetime import datetime
-import json
-from typing import Dict, List, Optional, Type, TypeVar, Union, Generic
+from functools import lru_cache
+from typing import List, Optional, Tuple, Type, TypeVar, Union, Generic, \
+    TYPE_CHECKING
 
-# from .utilities import cached_static_property
+from .utilities import json_dumps, json_loads, memoized_property
+
+if TYPE_CHECKING:
+    import numpy as np
 
 T = TypeVar('T')
 
 
-def union_parser(classes: List[Type[T]], value: Dict[str, str]) -> Union[T]:
-    ...
+class UnionParser:
+    """Wraps each value in the class of a Union whose object type matches
+    the value's 'type' field. Values without a type field get the first
+    class and values of an unknown type a plain SpotifyObject. Projections
+    always request the type of a Union, so their values are dispatched too.
+    Use get_union_parser so each Union builds its dispatch table once.
+
+    Args:
+        *classes: The classes of the Union. None allows null values.
+    """
+    __slots__ = ('classes', 'dispatch', '__name__')
+
+    def __init__(self, *classes: Optional[Type[T]]):
+        self.classes = tuple(cls for cls in classes if cls is not None)
+        self.dispatch = {OBJECT_TYPES[cls]: cls for cls in self.classes
+                         if cls in OBJECT_TYPES}
+        names = ', '.join(cls.__name__ for cls in self.classes)
+        self.__name__ = f'Union[{names}]'
+
+    def __call__(self, value: Optional[dict]) -> Optional[T]:
+        if value is None:
+            return None
+        if 'type' not in value:
+            return self.classes[0](value)
+        return self.dispatch.get(value['type'], SpotifyObject)(value)
+
+    def __reduce__(self):
+        return get_union_parser, self.classes
+
+    def __repr__(self):
+        return self.__name__
+
+
+@lru_cache(maxsize=None)
+def get_union_parser(*classes: Optional[Type[T]]) -> UnionParser:
+    """Return the shared UnionParser of the classes."""
+    return UnionParser(*classes)
+
+
+def union_parser(classes: Tuple[Optional[Type[T]], ...],
+                 value: Optional[dict]) -> Optional[T]:
+    """Wrap the value in the class of the Union matching its 'type'
+    field. See UnionParser."""
+    return get_union_parser(*classes)(value)
 
 
 class SpotifyObject:
-    """Baby cat."""
+    """Baby cat.
+
+    Only the decoded json dictionary is stored and the classes use
+    __slots__, so an instance carries no __dict__ and holds its payload
+    once. Nested objects are wrapped on first access and memoized in the
+    _memo slot.
+    """
+    __slots__ = ('_json_dict', '_memo')
 
-    def __init__(self, json_object: Optional[str, dict]):
-        if isinstance(json_object, dict):
-            self._json_string = json.dumps(json_object)
-            self._json_dict = json_object
-        elif isinstance(json_object, str):
-            self._json_string = json_object
-            self._json_dict = json.loads(json_object)
+    def __init__(self, json_object: Optional[str, bytes, dict]):
+        if isinstance(json_object, (str, bytes)):
+            json_object = json_loads(json_object)
+        self._json_dict = json_object
 
         # TODO: What is this?
         # self._set_attributes(self._json_dict)
@@ -34,6 +84,16 @@ class SpotifyObject:
     def __str__(self):
         return str(self._json_dict)
 
+    def __reduce__(self):
+        # Pickle the decoded json only. The memoized nested objects are
+        # rebuilt lazily on the other side.
+        return self.__class__, (self._json_dict,)
+
+    @property
+    def _json_string(self) -> str:
+        """The json of the object, encoded only when it is asked for."""
+        return json_dumps(self._json_dict)
+
     def _set_attributes(self, json_dict: dict):
         ...
 
@@ -41,24 +101,53 @@ class SpotifyObject:
 class PagingObject(Sequence, Generic[T], SpotifyObject):
     """
     PagingObject doc string...
+
+    The items are wrapped in item_type lazily, one index at a time on first
+    access, and the wrapped items are kept. Iterating, indexing, slicing and
+    len therefore cost O(1) per item however often the page is used.
     """
+    __slots__ = ('item_type', '_items')
 
-    def __init__(self, json_object: Optional[str, dict], item_type: Type[T]):
-        json_dict = json_object
-        print(json_dict.keys())
-        if len(json_dict.keys()) < 3:
-            json_object = list(json_dict.values())[-1]
+    def __init__(self, json_object: Optional[str, bytes, dict],
+                 item_type: Type[T] = SpotifyObject):
+        if isinstance(json_object, (str, bytes)):
+            json_object = json_loads(json_object)
+        if len(json_object) < 3:
+            json_object = list(json_object.values())[-1]
         super().__init__(json_object)
         self.item_type = item_type
+        self._items: List[Optional[T]] = [None] * len(json_object['items'])
 
     def __getitem__(self, i):
-        return self.items[i]
+        if isinstance(i, slice):
+            return [self._get_item(j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('PagingObject index out of range')
+        return self._get_item(i)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._get_item(i)
 
     def __len__(self):
-        return len(self.items)
+        return len(self._items)
 
     def __repr__(self):
-        return f'<PagingObject items={self.items}>'
+        return f'<{self.__class__.__name__} items={self.items}>'
+
+    def __reduce__(self):
+        return _restore_page, (self.__class__, self._json_dict,
+                               self.item_type)
+
+    def _get_item(self, i: int) -> T:
+        """Return the item at index i, wrapping it on first access."""
+        item = self._items[i]
+        if item is None:
+            item = self._items[i] = self.item_type(
+                self._json_dict['items'][i])
+        return item
 
     @property
     def href(self) -> str:
@@ -73,7 +162,7 @@ class PagingObject(Sequence, Generic[T], SpotifyObject):
         """
         The requested data.
         """
-        return [self.item_type(item) for item in self._json_dict['items']]
+        return self[:]
 
     @property
     def limit(self) -> int:
@@ -116,10 +205,117 @@ class PagingObject(Sequence, Generic[T], SpotifyObject):
         return int(self._json_dict['total'])
 
 
+def _restore_page(cls: Type[PagingObject], json_dict: dict,
+                  item_type: Type[T]) -> PagingObject[T]:
+    """Rebuild a pickled page from its stored json without unwrapping it
+    again."""
+    page = cls.__new__(cls)
+    SpotifyObject.__init__(page, json_dict)
+    page.item_type = item_type
+    page._items = [None] * len(json_dict['items'])
+    return page
+
+
+class CursorPagingObject(PagingObject[T]):
+    """
+    CursorPagingObject doc string...
+
+    Cursor based pages have no offset or previous url. The next page is
+    found with the cursors instead.
+    """
+    __slots__ = ()
+
+    @property
+    def cursors(self) -> CursorObject:
+        """
+        The cursors used to find the next set of items.
+        """
+        return CursorObject(self._json_dict['cursors'])
+
+
+class AudioAnalysisObject(SpotifyObject):
+    """
+    Audio Analysis Object docstring...
+
+    The bars, beats, tatums, sections and segments are NumPy structured
+    arrays, built once per object on first access. Requires numpy.
+    """
+    __slots__ = ()
+
+    def __repr__(self):
+        return f'<AudioAnalysisObject ' \
+               f'sections={len(self._json_dict.get("sections", []))}, ' \
+               f'segments={len(self._json_dict.get("segments", []))}>'
+
+    @property
+    def data(self) -> dict:
+        """
+        The raw json of the analysis. It is not copied.
+        """
+        return self._json_dict
+
+    @memoized_property
+    def bars(self) -> np.ndarray:
+        """
+        The start, duration and confidence of each bar.
+        """
+        return self._analysis_array('bars', 'INTERVAL_FIELDS')
+
+    @memoized_property
+    def beats(self) -> np.ndarray:
+        """
+        The start, duration and confidence of each beat.
+        """
+        return self._analysis_array('beats', 'INTERVAL_FIELDS')
+
+    @memoized_property
+    def tatums(self) -> np.ndarray:
+        """
+        The start, duration and confidence of each tatum.
+        """
+        return self._analysis_array('tatums', 'INTERVAL_FIELDS')
+
+    @memoized_property
+    def sections(self) -> np.ndarray:
+        """
+        The timing, loudness, tempo, key, mode and time signature of each
+        section.
+        """
+        return self._analysis_array('sections', 'SECTION_FIELDS')
+
+    @memoized_property
+    def segments(self) -> np.ndarray:
+        """
+        The timing, loudness, pitches and timbre of each segment.
+        """
+        return self._analysis_array('segments', 'SEGMENT_FIELDS')
+
+    @property
+    def pitches(self) -> np.ndarray:
+        """
+        The (n_segments, 12) float32 pitches of the segments, as a view.
+        """
+        return self.segments['pitches']
+
+    @property
+    def timbre(self) -> np.ndarray:
+        """
+        The (n_segments, 12) float32 timbre of the segments, as a view.
+        """
+        return self.segments['timbre']
+
+    def _analysis_array(self, key: str, fields_name: str) -> np.ndarray:
+        """Build the structured array of the intervals under key."""
+        from . import numeric
+        return numeric.analysis_array(self._json_dict.get(key, []),
+                                      getattr(numeric, fields_name))
+
+
 class AlbumObject(SpotifyObject):
     """
     Album Object Doc String.
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<AlbumObject name={self.name!r}, id={self.id!r},' \
@@ -135,7 +331,7 @@ class AlbumObject(SpotifyObject):
         """
         return str(self._json_dict['album_type'])
 
-    @property
+    @memoized_property
     def artists(self) -> List[SimplifiedArtistObject]:
         """
         The artists of the album. Each artist object includes a link in href
@@ -152,21 +348,21 @@ class AlbumObject(SpotifyObject):
         """
         return [str(item) for item in self._json_dict['available_markets']]
 
-    @property
+    @memoized_property
     def copyrights(self) -> List[CopyrightObject]:
         """
         The copyright statements of the album.
         """
         return [CopyrightObject(item) for item in self._json_dict['copyrights']]
 
-    @property
+    @memoized_property
     def external_ids(self) -> ExternalIdObject:
         """
         Known external IDs for the album.
         """
         return ExternalIdObject(self._json_dict['external_ids'])
 
-    @property
+    @memoized_property
     def external_urls(self) -> ExternalUrlObject:
         """
         Known external URLs for this album.
@@ -195,7 +391,7 @@ class AlbumObject(SpotifyObject):
         """
         return str(self._json_dict['id'])
 
-    @property
+    @memoized_property
     def images(self) -> List[ImageObject]:
         """
         The cover art for the album in various sizes, widest first.
@@ -242,7 +438,7 @@ class AlbumObject(SpotifyObject):
         """
         return str(self._json_dict['release_date_precision'])
 
-    @property
+    @memoized_property
     def restrictions(self) -> Optional[AlbumRestrictionObject]:
         """
         Included in the response when a content restriction is applied. See
@@ -252,7 +448,7 @@ class AlbumObject(SpotifyObject):
             return AlbumRestrictionObject(value)
         return None
 
-    @property
+    @memoized_property
     def tracks(self) -> PagingObject[SimplifiedTrackObject]:
         """
         The tracks of the album.
@@ -278,6 +474,7 @@ class AlbumRestrictionObject(SpotifyObject):
     """
     Album Restriction Object docstring...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<AlbumRestrictionObject reason={self.reason!r}>'
@@ -301,6 +498,7 @@ class ArtistObject(SpotifyObject):
     """
     Artist docstring
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<ArtistObject name={self.name!r}>'
@@ -308,14 +506,14 @@ class ArtistObject(SpotifyObject):
     def __str__(self):
         return str(self.name)
 
-    @property
+    @memoized_property
     def external_urls(self) -> ExternalUrlObject:
         """
         Known external URLs for this artist.
         """
         return ExternalUrlObject(self._json_dict['external_urls'])
 
-    @property
+    @memoized_property
     def followers(self) -> FollowersObject:
         """
         Information about the followers of the artist.
@@ -344,7 +542,7 @@ class ArtistObject(SpotifyObject):
         """
         return str(self._json_dict['id'])
 
-    @property
+    @memoized_property
     def images(self) -> List[ImageObject]:
         """
         Images of the artist in various sizes, widest first.
@@ -374,7 +572,7 @@ class ArtistObject(SpotifyObject):
         """
         return str(self._json_dict['type'])
 
-    @property
+    @memoized_property
     def uri(self) -> List[ImageObject]:
         """
         The Spotify URI for the artist.
@@ -386,6 +584,7 @@ class AudioFeaturesObject(SpotifyObject):
     """
     AudioFeatures docstring..
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<AudioFeaturesObject id={self.id!r}>'
@@ -443,7 +642,7 @@ class AudioFeaturesObject(SpotifyObject):
         return str(self._json_dict['id'])
 
     @property
-    def instrumentalness(self) -> int:
+    def instrumentalness(self) -> float:
         """
         Predicts whether a track contains no vocals. “Ooh” and “aah” sounds
         are treated as instrumental in this context. Rap or spoken word tracks
@@ -452,7 +651,7 @@ class AudioFeaturesObject(SpotifyObject):
         above 0.5 are intended to represent instrumental tracks, but
         confidence is higher as the value approaches 1.0.)
         """
-        return int(self._json_dict['instrumentalness'])
+        return float(self._json_dict['instrumentalness'])
 
     @property
     def key(self) -> int:
@@ -560,6 +759,7 @@ class CategoryObject(SpotifyObject):
     """
     CategoryObject doc string....
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<CategoryObject name={self.name!r}>'
@@ -574,7 +774,7 @@ class CategoryObject(SpotifyObject):
         """
         return str(self._json_dict['href'])
 
-    @property
+    @memoized_property
     def icons(self) -> List[ImageObject]:
         """
         The category icon, in various sizes.
@@ -600,11 +800,12 @@ class ContextObject(SpotifyObject):
     """
     ContextObject doc string....
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<ContextObject type={self.type!r}>'
 
-    @property
+    @memoized_property
     def external_urls(self) -> ExternalUrlObject:
         """
         External URLs for this context.
@@ -637,6 +838,7 @@ class CopyrightObject(SpotifyObject):
     """
     Copyright doc string....
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<CopyrightObject text={self.text!r},' \
@@ -665,13 +867,14 @@ class CurrentlyPlayingContextObject(SpotifyObject):
     """
     CurrentlyPlayingContext doc string....
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<CurrentlyPlayingContextObject device={self.device},' \
                f' repeat_state={self.repeat_state!r},' \
                f' shuffle_state={self.shuffle_state!r}>'
 
-    @property
+    @memoized_property
     def actions(self) -> DisallowsObject:
         """
         Allows to update the user interface based on which playback actions
@@ -679,7 +882,7 @@ class CurrentlyPlayingContextObject(SpotifyObject):
         """
         return DisallowsObject(self._json_dict['actions'])
 
-    @property
+    @memoized_property
     def context(self) -> Optional[ContextObject]:
         """
         A Context Object. Can be None.
@@ -696,7 +899,7 @@ class CurrentlyPlayingContextObject(SpotifyObject):
         """
         return str(self._json_dict['currently_playing_type'])
 
-    @property
+    @memoized_property
     def device(self) -> DeviceObject:
         """
         The device that is currently active.
@@ -710,12 +913,12 @@ class CurrentlyPlayingContextObject(SpotifyObject):
         """
         return bool(self._json_dict['is_playing'])
 
-    @property
+    @memoized_property
     def item(self) -> Union[TrackObject, EpisodeObject, None]:
         """
         The currently playing track or episode. Can be None.
         """
-        return union_parser([TrackObject, EpisodeObject, None], self._json_dict['item'])
+        return union_parser((TrackObject, EpisodeObject, None), self._json_dict['item'])
 
     @property
     def progress_ms(self) -> Optional[int]:
@@ -752,11 +955,12 @@ class CurrentlyPlayingObject(SpotifyObject):
     """
     CurrentlyPlaying doc string....
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<CurrentlyPlayingObject item={self.item}>'
 
-    @property
+    @memoized_property
     def context(self) -> Optional[ContextObject]:
         """
         A Context Object. Can be None.
@@ -780,12 +984,12 @@ class CurrentlyPlayingObject(SpotifyObject):
         """
         return bool(self._json_dict['is_playing'])
 
-    @property
+    @memoized_property
     def item(self) -> Union[TrackObject, EpisodeObject, None]:
         """
         The currently playing track or episode. Can be None.
         """
-        return union_parser([TrackObject, EpisodeObject, None], self._json_dict['item'])
+        return union_parser((TrackObject, EpisodeObject, None), self._json_dict['item'])
 
     @property
     def progress_ms(self) -> Optional[int]:
@@ -808,6 +1012,7 @@ class CursorObject(SpotifyObject):
     """
     CursorObject doc string..
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<CursorObject after={self.after!r}>'
@@ -820,66 +1025,11 @@ class CursorObject(SpotifyObject):
         return str(self._json_dict['after'])
 
 
-class CursorPagingObject(SpotifyObject):
-    """
-    CursorPagingObject doc string...
-    """
-
-    def __repr__(self):
-        return f'<CursorPagingObject items={self.items},' \
-               f' limit={self.limit}, next={self.next}>'
-
-    @property
-    def cursors(self) -> CursorObject:
-        """
-        The cursors used to find the next set of items.
-        """
-        return CursorObject(self._json_dict['cursors'])
-
-    @property
-    def href(self) -> str:
-        """
-        A link to the Web API endpoint returning the full result of the
-        request.
-        """
-        return str(self._json_dict['href'])
-
-    @property
-    def items(self) -> List[SpotifyObject]:
-        """
-        The requested data.
-        """
-        return [SpotifyObject(item) for item in self._json_dict['items']]
-
-    @property
-    def limit(self) -> int:
-        """
-        The maximum number of items in the response (as set in the query or by
-        default).
-        """
-        return int(self._json_dict['limit'])
-
-    @property
-    def next(self) -> Optional[str]:
-        """
-        URL to the next page of items. (Returns None if this is the last page)
-        """
-        if value := self._json_dict.get('next'):
-            return str(value)
-        return None
-
-    @property
-    def total(self) -> int:
-        """
-        Unix Millisecond Timestamp when data was fetched.
-        """
-        return int(self._json_dict['total'])
-
-
 class DeviceObject(SpotifyObject):
     """
     DeviceObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<DeviceObject name={self.name!r}, id={self.id},' \
@@ -947,11 +1097,12 @@ class DevicesObject(SpotifyObject):
     """
     DevicesObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<DevicesObject devices={self.devices}>'
 
-    @property
+    @memoized_property
     def devices(self) -> List[DeviceObject]:
         """
         A list of 0..n Device objects
@@ -963,6 +1114,7 @@ class DisallowsObject(SpotifyObject):
     """
     DisallowsObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<DisallowsObject' \
@@ -1071,6 +1223,7 @@ class EpisodeObject(SpotifyObject):
     """
     EpisodeObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<EpisodeObject name={self.name!r}, show={self.show},' \
@@ -1111,7 +1264,7 @@ class EpisodeObject(SpotifyObject):
         """
         return bool(self._json_dict['explicit'])
 
-    @property
+    @memoized_property
     def external_urls(self) -> ExternalUrlObject:
         """
         External URLs for this episode.
@@ -1132,7 +1285,7 @@ class EpisodeObject(SpotifyObject):
         """
         return str(self._json_dict['id'])
 
-    @property
+    @memoized_property
     def images(self) -> List[ImageObject]:
         """
         The cover art for the episode in various sizes, widest first.
@@ -1184,7 +1337,7 @@ class EpisodeObject(SpotifyObject):
         """
         return str(self._json_dict['release_date_precision'])
 
-    @property
+    @memoized_property
     def resume_point(self) -> Optional[ResumePointObject]:
         """
         The user’s most recent position in the episode. Set if the supplied
@@ -1195,7 +1348,7 @@ class EpisodeObject(SpotifyObject):
             return ResumePointObject(value)
         return None
 
-    @property
+    @memoized_property
     def show(self) -> SimplifiedShowObject:
         """
         The show on which the episode belongs.
@@ -1221,6 +1374,7 @@ class ErrorObject(SpotifyObject):
     """
     ErrorObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<ErrorObject message={self.message!r},' \
@@ -1248,6 +1402,7 @@ class ExplicitContentSettingsObject(SpotifyObject):
     """
     ExplicitContentSettings doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<ExplicitContentSettingsObject' \
@@ -1274,6 +1429,7 @@ class ExternalIdObject(SpotifyObject):
     """
     ExternalIdObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<ExternalIdObject ean={self.ean}, isrc={self.isrc},' \
@@ -1311,6 +1467,7 @@ class ExternalUrlObject(SpotifyObject):
     """
     ExternalUrlObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<ExternalUrlObject spotify={self.spotify!r}>'
@@ -1330,6 +1487,7 @@ class FollowersObject(SpotifyObject):
     """
     FollowersObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<FollowersObject total={self.total}>'
@@ -1349,6 +1507,7 @@ class ImageObject(SpotifyObject):
     """
     ImageObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<ImageObject url={self.url!r}, height={self.height},' \
@@ -1387,6 +1546,7 @@ class LinkedTrackObject(SpotifyObject):
     """
     LinkedTrackObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<LinkedTrackObject id={self.id!r}, uri={self.uri!r}>'
@@ -1394,7 +1554,7 @@ class LinkedTrackObject(SpotifyObject):
     def __str__(self):
         return str(self.uri)
 
-    @property
+    @memoized_property
     def external_urls(self) -> ExternalUrlObject:
         """
         Known external URLs for this track.
@@ -1434,6 +1594,7 @@ class PlayHistoryObject(SpotifyObject):
     """
     PlayHistoryObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<PlayHistoryObject track={self.track},' \
@@ -1442,7 +1603,7 @@ class PlayHistoryObject(SpotifyObject):
     def __str__(self):
         return str(self.track)
 
-    @property
+    @memoized_property
     def context(self) -> ContextObject:
         """
         The context the track was played from.
@@ -1456,7 +1617,7 @@ class PlayHistoryObject(SpotifyObject):
         """
         return datetime.strptime(self._json_dict['played_at'], "%Y-%m-%dT%H:%M:%S.%fZ")
 
-    @property
+    @memoized_property
     def track(self) -> SimplifiedTrackObject:
         """
         The track the user listened to.
@@ -1468,6 +1629,7 @@ class PlayErrorObject(SpotifyObject):
     """
     PlayErrorObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<PlayErrorObject message={self.message!r},' \
@@ -1528,6 +1690,7 @@ class PlaylistObject(SpotifyObject):
     """
     PlayListObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<PlaylistObject name={self.name!r}, id={self.id!r},' \
@@ -1553,14 +1716,14 @@ class PlaylistObject(SpotifyObject):
             return str(value)
         return None
 
-    @property
+    @memoized_property
     def external_urls(self) -> ExternalUrlObject:
         """
         Known external URLs for this playlist.
         """
         return ExternalUrlObject(self._json_dict['external_urls'])
 
-    @property
+    @memoized_property
     def followers(self) -> FollowersObject:
         """
         Information about the followers of the playlist.
@@ -1581,7 +1744,7 @@ class PlaylistObject(SpotifyObject):
         """
         return str(self._json_dict['id'])
 
-    @property
+    @memoized_property
     def images(self) -> List[ImageObject]:
         """
         Images for the playlist. The array may be empty or contain up to three
@@ -1598,7 +1761,7 @@ class PlaylistObject(SpotifyObject):
         """
         return str(self._json_dict['name'])
 
-    @property
+    @memoized_property
     def owner(self) -> PublicUserObject:
         """
         The user who owns the playlist
@@ -1624,13 +1787,13 @@ class PlaylistObject(SpotifyObject):
         """
         return str(self._json_dict['snapshot_id'])
 
-    @property
-    def tracks(self) -> List[Optional[PlaylistTrackObject]]:
+    @memoized_property
+    def tracks(self) -> PagingObject[PlaylistTrackObject]:
         """
         Information about the tracks of the playlist. Note, a track object may
         be None. This can happen if a track is no longer available.
         """
-        return [Optional[PlaylistTrackObject](item) for item in self._json_dict['tracks']]
+        return PagingObject(self._json_dict['tracks'], PlaylistTrackObject)
 
     @property
     def type(self) -> str:
@@ -1651,6 +1814,7 @@ class PlaylistTrackObject(SpotifyObject):
     """
     PlayListTrackObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<PlaylistTrackObject track={self.track}>'
@@ -1668,7 +1832,7 @@ class PlaylistTrackObject(SpotifyObject):
             return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%fZ")
         return None
 
-    @property
+    @memoized_property
     def added_by(self) -> Optional[PublicUserObject]:
         """
         The Spotify user who added the track or episode. Note that some very
@@ -1685,18 +1849,19 @@ class PlaylistTrackObject(SpotifyObject):
         """
         return bool(self._json_dict['is_local'])
 
-    @property
+    @memoized_property
     def track(self) -> Union[TrackObject, EpisodeObject]:
         """
         Information about the track or episode.
         """
-        return union_parser([TrackObject, EpisodeObject], self._json_dict['track'])
+        return union_parser((TrackObject, EpisodeObject), self._json_dict['track'])
 
 
 class PlaylistTracksRefObject(SpotifyObject):
     """
     PlaylistTracksRefObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<PlaylistTracksRefObject href={self.href!r}>'
@@ -1724,6 +1889,7 @@ class PrivateUserObject(SpotifyObject):
     """
     PrivateUserObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<PrivateUserObject display_name={self.display_name},' \
@@ -1763,7 +1929,7 @@ class PrivateUserObject(SpotifyObject):
             return str(value)
         return None
 
-    @property
+    @memoized_property
     def explicit_content(self) -> Optional[ExplicitContentSettingsObject]:
         """
         The user’s explicit content settings. This field is only available
@@ -1774,14 +1940,14 @@ class PrivateUserObject(SpotifyObject):
             return ExplicitContentSettingsObject(value)
         return None
 
-    @property
+    @memoized_property
     def external_urls(self) -> ExternalUrlObject:
         """
         Known external URLs for this user.
         """
         return ExternalUrlObject(self._json_dict['external_urls'])
 
-    @property
+    @memoized_property
     def followers(self) -> FollowersObject:
         """
         Information about the followers of the user.
@@ -1802,7 +1968,7 @@ class PrivateUserObject(SpotifyObject):
         """
         return str(self._json_dict['id'])
 
-    @property
+    @memoized_property
     def images(self) -> List[ImageObject]:
         """
         The user’s profile image.
@@ -1840,6 +2006,7 @@ class PublicUserObject(SpotifyObject):
     """
     PublicUserObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<PublicUserObject display_name={self.display_name},' \
@@ -1857,14 +2024,14 @@ class PublicUserObject(SpotifyObject):
             return str(value)
         return None
 
-    @property
+    @memoized_property
     def external_urls(self) -> ExternalUrlObject:
         """
         Known external URLs for this user.
         """
         return ExternalUrlObject(self._json_dict['external_urls'])
 
-    @property
+    @memoized_property
     def followers(self) -> FollowersObject:
         """
         Information about the followers of this user.
@@ -1885,7 +2052,7 @@ class PublicUserObject(SpotifyObject):
         """
         return str(self._json_dict['id'])
 
-    @property
+    @memoized_property
     def images(self) -> List[ImageObject]:
         """
         The user’s profile image.
@@ -1923,6 +2090,7 @@ class RecommendationSeedObject(SpotifyObject):
     """
     RecommendationSeedObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<RecommendationSeedObject type={self.type!r}>'
@@ -1979,19 +2147,20 @@ class RecommendationsObject(SpotifyObject):
     """
     RecommendationsObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<RecommendationsObject seeds={self.seeds},' \
                f' tracks={self.tracks}>'
 
-    @property
+    @memoized_property
     def seeds(self) -> List[RecommendationSeedObject]:
         """
         A list of recommendation seed objects.
         """
         return [RecommendationSeedObject(item) for item in self._json_dict['seeds']]
 
-    @property
+    @memoized_property
     def tracks(self) -> List[SimplifiedTrackObject]:
         """
         A list of simplified track objects ordered according to the parameters
@@ -2004,6 +2173,7 @@ class ResumePointObject(SpotifyObject):
     """
     ResumePointObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<ResumePointObject fully_played={self.fully_played},' \
@@ -2028,6 +2198,7 @@ class SavedAlbumObject(SpotifyObject):
     """
     SavedAlbumObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<SavedAlbumObject album={self.album},' \
@@ -2045,7 +2216,7 @@ class SavedAlbumObject(SpotifyObject):
         """
         return datetime.strptime(self._json_dict['added_at'], "%Y-%m-%dT%H:%M:%S.%fZ")
 
-    @property
+    @memoized_property
     def album(self) -> AlbumObject:
         """
         Information about the album.
@@ -2057,6 +2228,7 @@ class SavedEpisodeObject(SpotifyObject):
     """
     SavedEpisodeObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<SavedEpisodeObject episode={self.episode},' \
@@ -2074,7 +2246,7 @@ class SavedEpisodeObject(SpotifyObject):
         """
         return datetime.strptime(self._json_dict['added_at'], "%Y-%m-%dT%H:%M:%S.%fZ")
 
-    @property
+    @memoized_property
     def episode(self) -> EpisodeObject:
         """
         Information about the episode.
@@ -2086,6 +2258,7 @@ class SavedShowObject(SpotifyObject):
     """
     SavedShowObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<SavedShowObject show={self.show},' \
@@ -2103,7 +2276,7 @@ class SavedShowObject(SpotifyObject):
         """
         return datetime.strptime(self._json_dict['added_at'], "%Y-%m-%dT%H:%M:%S.%fZ")
 
-    @property
+    @memoized_property
     def show(self) -> SimplifiedShowObject:
         """
         Information about the show.
@@ -2115,6 +2288,7 @@ class SavedTrackObject(SpotifyObject):
     """
     SavedTrackObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<SavedTrackObject track={self.track},' \
@@ -2132,7 +2306,7 @@ class SavedTrackObject(SpotifyObject):
         """
         return datetime.strptime(self._json_dict['added_at'], "%Y-%m-%dT%H:%M:%S.%fZ")
 
-    @property
+    @memoized_property
     def track(self) -> TrackObject:
         """
         Information about the track.
@@ -2144,6 +2318,7 @@ class ShowObject(SpotifyObject):
     """
     ShowObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<ShowObject name={self.name!r}, id={self.id!r},' \
@@ -2160,7 +2335,7 @@ class ShowObject(SpotifyObject):
         """
         return [str(item) for item in self._json_dict['available_markets']]
 
-    @property
+    @memoized_property
     def copyrights(self) -> List[CopyrightObject]:
         """
         The copyright statement of the show.
@@ -2174,7 +2349,7 @@ class ShowObject(SpotifyObject):
         """
         return str(self._json_dict['description'])
 
-    @property
+    @memoized_property
     def episodes(self) -> List[SimplifiedEpisodeObject]:
         """
         A list of the show’s episodes.
@@ -2189,7 +2364,7 @@ class ShowObject(SpotifyObject):
         """
         return bool(self._json_dict['explicit'])
 
-    @property
+    @memoized_property
     def external_urls(self) -> ExternalUrlObject:
         """
         External URLs for this show.
@@ -2210,7 +2385,7 @@ class ShowObject(SpotifyObject):
         """
         return str(self._json_dict['id'])
 
-    @property
+    @memoized_property
     def images(self) -> List[ImageObject]:
         """
         The cover art for the show in various sizes, widest first.
@@ -2275,6 +2450,7 @@ class SimplifiedAlbumObject(SpotifyObject):
     """
     SimplifiedAlbumObject Doc String.
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<SimplifiedAlbumObject name={self.name!r},' \
@@ -2300,7 +2476,7 @@ class SimplifiedAlbumObject(SpotifyObject):
         """
         return str(self._json_dict['album_type'])
 
-    @property
+    @memoized_property
     def artists(self) -> List[SimplifiedArtistObject]:
         """
         The artists of the album. Each artist object includes a link in href
@@ -2317,7 +2493,7 @@ class SimplifiedAlbumObject(SpotifyObject):
         """
         return [str(item) for item in self._json_dict['available_markets']]
 
-    @property
+    @memoized_property
     def external_urls(self) -> ExternalUrlObject:
         """
         Known external URLs for this album.
@@ -2338,7 +2514,7 @@ class SimplifiedAlbumObject(SpotifyObject):
         """
         return str(self._json_dict['id'])
 
-    @property
+    @memoized_property
     def images(self) -> List[ImageObject]:
         """
         The cover art for the album in various sizes, widest first.
@@ -2369,7 +2545,7 @@ class SimplifiedAlbumObject(SpotifyObject):
         """
         return str(self._json_dict['release_date_precision'])
 
-    @property
+    @memoized_property
     def restrictions(self) -> Optional[AlbumRestrictionObject]:
         """
         Included in the response when a content restriction is applied. See
@@ -2398,6 +2574,7 @@ class SimplifiedArtistObject(SpotifyObject):
     """
     Artist docstring
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<SimplifiedArtistObject name={self.name!r},' \
@@ -2406,7 +2583,7 @@ class SimplifiedArtistObject(SpotifyObject):
     def __str__(self):
         return str(self.name)
 
-    @property
+    @memoized_property
     def external_urls(self) -> ExternalUrlObject:
         """
         Known external URLs for this artist.
@@ -2453,6 +2630,7 @@ class SimplifiedEpisodeObject(SpotifyObject):
     """
     SimplifiedEpisodeObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<SimplifiedEpisodeObject name={self.name!r},' \
@@ -2493,7 +2671,7 @@ class SimplifiedEpisodeObject(SpotifyObject):
         """
         return bool(self._json_dict['explicit'])
 
-    @property
+    @memoized_property
     def external_urls(self) -> ExternalUrlObject:
         """
         External URLs for this episode.
@@ -2514,7 +2692,7 @@ class SimplifiedEpisodeObject(SpotifyObject):
         """
         return str(self._json_dict['id'])
 
-    @property
+    @memoized_property
     def images(self) -> List[ImageObject]:
         """
         The cover art for the episode in various sizes, widest first.
@@ -2566,7 +2744,7 @@ class SimplifiedEpisodeObject(SpotifyObject):
         """
         return str(self._json_dict['release_date_precision'])
 
-    @property
+    @memoized_property
     def resume_point(self) -> Optional[ResumePointObject]:
         """
         The user’s most recent position in the episode. Set if the supplied
@@ -2577,7 +2755,7 @@ class SimplifiedEpisodeObject(SpotifyObject):
             return ResumePointObject(value)
         return None
 
-    @property
+    @memoized_property
     def show(self) -> SimplifiedShowObject:
         """
         The show on which the episode belongs.
@@ -2603,6 +2781,7 @@ class SimplifiedPlaylistObject(SpotifyObject):
     """
     SimplifiedPlayListObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<SimplifiedPlaylistObject name={self.name!r},' \
@@ -2628,7 +2807,7 @@ class SimplifiedPlaylistObject(SpotifyObject):
             return str(value)
         return None
 
-    @property
+    @memoized_property
     def external_urls(self) -> ExternalUrlObject:
         """
         Known external URLs for this playlist.
@@ -2649,7 +2828,7 @@ class SimplifiedPlaylistObject(SpotifyObject):
         """
         return str(self._json_dict['id'])
 
-    @property
+    @memoized_property
     def images(self) -> List[ImageObject]:
         """
         Images for the playlist. The array may be empty or contain up to three
@@ -2666,7 +2845,7 @@ class SimplifiedPlaylistObject(SpotifyObject):
         """
         return str(self._json_dict['name'])
 
-    @property
+    @memoized_property
     def owner(self) -> PublicUserObject:
         """
         The user who owns the playlist
@@ -2692,7 +2871,7 @@ class SimplifiedPlaylistObject(SpotifyObject):
         """
         return str(self._json_dict['snapshot_id'])
 
-    @property
+    @memoized_property
     def tracks(self) -> Optional[PlaylistTracksRefObject]:
         """
         Information about the tracks of the playlist. Note, a track object may
@@ -2721,6 +2900,7 @@ class SimplifiedShowObject(SpotifyObject):
     """
     ShowObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<SimplifiedShowObject name={self.name!r},' \
@@ -2737,7 +2917,7 @@ class SimplifiedShowObject(SpotifyObject):
         """
         return [str(item) for item in self._json_dict['available_markets']]
 
-    @property
+    @memoized_property
     def copyrights(self) -> List[CopyrightObject]:
         """
         The copyright statement of the show.
@@ -2759,7 +2939,7 @@ class SimplifiedShowObject(SpotifyObject):
         """
         return bool(self._json_dict['explicit'])
 
-    @property
+    @memoized_property
     def external_urls(self) -> ExternalUrlObject:
         """
         External URLs for this show.
@@ -2780,7 +2960,7 @@ class SimplifiedShowObject(SpotifyObject):
         """
         return str(self._json_dict['id'])
 
-    @property
+    @memoized_property
     def images(self) -> List[ImageObject]:
         """
         The cover art for the show in various sizes, widest first.
@@ -2845,6 +3025,7 @@ class SimplifiedTrackObject(SpotifyObject):
     """
     SimplifiedTrackObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<SimplifiedTrackObject name={self.name!r},' \
@@ -2853,7 +3034,7 @@ class SimplifiedTrackObject(SpotifyObject):
     def __str__(self):
         return str(self.name)
 
-    @property
+    @memoized_property
     def artists(self) -> List[SimplifiedArtistObject]:
         """
         The artists who performed the track. Each artist object includes a
@@ -2892,7 +3073,7 @@ class SimplifiedTrackObject(SpotifyObject):
         """
         return bool(self._json_dict['explicit'])
 
-    @property
+    @memoized_property
     def external_urls(self) -> ExternalUrlObject:
         """
         External URLs for this track.
@@ -2930,7 +3111,7 @@ class SimplifiedTrackObject(SpotifyObject):
             return bool(value)
         return None
 
-    @property
+    @memoized_property
     def linked_from(self) -> LinkedTrackObject:
         """
         Part of the response when Track Relinking is applied and is only part
@@ -2955,7 +3136,7 @@ class SimplifiedTrackObject(SpotifyObject):
         """
         return str(self._json_dict['preview_url'])
 
-    @property
+    @memoized_property
     def restrictions(self) -> TrackRestrictionObject:
         """
         Included in the response when a content restriction is applied. See
@@ -2990,6 +3171,7 @@ class TrackObject(SpotifyObject):
     """
     TrackObject doc string...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<TrackObject name={self.name!r}, id={self.id!r},' \
@@ -2998,7 +3180,7 @@ class TrackObject(SpotifyObject):
     def __str__(self):
         return str(self.name)
 
-    @property
+    @memoized_property
     def album(self) -> SimplifiedAlbumObject:
         """
         The album on which the track appears. The album object includes a link
@@ -3006,7 +3188,7 @@ class TrackObject(SpotifyObject):
         """
         return SimplifiedAlbumObject(self._json_dict['album'])
 
-    @property
+    @memoized_property
     def artists(self) -> List[SimplifiedArtistObject]:
         """
         The artists who performed the track. Each artist object includes a
@@ -3045,14 +3227,14 @@ class TrackObject(SpotifyObject):
         """
         return bool(self._json_dict['explicit'])
 
-    @property
+    @memoized_property
     def external_ids(self) -> ExternalIdObject:
         """
         Known external IDs for the track
         """
         return ExternalIdObject(self._json_dict['external_ids'])
 
-    @property
+    @memoized_property
     def external_urls(self) -> ExternalUrlObject:
         """
         External URLs for this track.
@@ -3090,7 +3272,7 @@ class TrackObject(SpotifyObject):
             return bool(value)
         return None
 
-    @property
+    @memoized_property
     def linked_from(self) -> LinkedTrackObject:
         """
         Part of the response when Track Relinking is applied and is only part
@@ -3133,7 +3315,7 @@ class TrackObject(SpotifyObject):
         """
         return str(self._json_dict['preview_url'])
 
-    @property
+    @memoized_property
     def restrictions(self) -> TrackRestrictionObject:
         """
         Included in the response when a content restriction is applied. See
@@ -3168,6 +3350,7 @@ class TrackRestrictionObject(SpotifyObject):
     """
     Track Restriction Object docstring...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<TrackRestrictionObject reason={self.reason!r}>'
@@ -3194,6 +3377,7 @@ class TuneableTrackObject(SpotifyObject):
     """
     TuneableTrackObject docstring..
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<TuneableTrackObject' \
@@ -3353,26 +3537,11 @@ class TuneableTrackObject(SpotifyObject):
         return float(self._json_dict['valence'])
 
 
-class AudioAnalysisObject(SpotifyObject):
-    """
-    Audio Analysis Object docstring...
-    """
-
-    def __repr__(self):
-        return f'<AudioAnalysisObject data={self.data}>'
-
-    @property
-    def data(self) -> dict:
-        """
-        The data
-        """
-        return dict(self._json_dict['data'])
-
-
 class UserObject(SpotifyObject):
     """
     User Object docstring...
     """
+    __slots__ = ()
 
     def __repr__(self):
         return f'<UserObject data={self.data}>'
@@ -3383,3 +3552,24 @@ class UserObject(SpotifyObject):
         The data
         """
         return dict(self._json_dict['data'])
+
+
+# The value of the 'type' field of the objects of each class.
+OBJECT_TYPES = {
+    AlbumObject: 'album',
+    ArtistObject: 'artist',
+    AudioFeaturesObject: 'audio_features',
+    EpisodeObject: 'episode',
+    LinkedTrackObject: 'track',
+    PlaylistObject: 'playlist',
+    PrivateUserObject: 'user',
+    PublicUserObject: 'user',
+    ShowObject: 'show',
+    SimplifiedAlbumObject: 'album',
+    SimplifiedArtistObject: 'artist',
+    SimplifiedEpisodeObject: 'episode',
+    SimplifiedPlaylistObject: 'playlist',
+    SimplifiedShowObject: 'show',
+    SimplifiedTrackObject: 'track',
+    TrackObject: 'track',
+}
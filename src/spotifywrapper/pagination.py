@@ -0,0 +1,315 @@
+"""
+Lazily walk every page of the methods returning a PagingObject or a
+CursorPagingObject.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import inspect
+import queue
+import threading
+from typing import AsyncIterator, Iterator, List, Optional, Tuple, Union
+
+from .object_library import CursorPagingObject, ErrorObject, PagingObject, \
+    SpotifyObject
+from .projection import PartialDict
+from .utilities import SpotifyAPIError
+
+Page = Union[PagingObject, CursorPagingObject]
+
+_END = object()
+
+# The search endpoint refuses offsets above this value.
+MAX_SEARCH_OFFSET = 1000
+
+
+def check_page(result) -> Page:
+    """Return the result if it is a page.
+
+    Raises:
+        SpotifyAPIError: If the result is an ErrorObject.
+        TypeError: If the method did not return a single page.
+    """
+    if isinstance(result, ErrorObject):
+        raise SpotifyAPIError(result)
+    if not isinstance(result, PagingObject):
+        raise TypeError(f'Expected a PagingObject or a CursorPagingObject '
+                        f'but got {type(result).__name__}.')
+    return result
+
+
+def wrap_next_page(page: Page, response: dict) -> Page:
+    """Wrap the json of the page following page in the same page type. The
+    next page of a projected page is partial too."""
+    if isinstance(page._json_dict, PartialDict):
+        response = page._json_dict.rewrap(response)
+    return type(page)(response, page.item_type)
+
+
+def _fetch_next_page(sp, page: Page) -> Page:
+    """Request the page following page."""
+    response, error = sp._get(page.next, {}, {})
+    if error:
+        raise SpotifyAPIError(ErrorObject(response))
+    return wrap_next_page(page, response)
+
+
+def iter_pages(sp, method_name: str, *args, prefetch: int = 0,
+               max_items: Optional[int] = None, **kwargs) -> Iterator[Page]:
+    """Yield the first page returned by the method followed by every page
+    after it. Pages are requested on demand by following their next url, so
+    only the current page (plus the prefetched ones) is held in memory.
+
+    Args:
+        sp: The SpotifyAPI instance to send the requests through.
+        method_name: The name of a method returning a PagingObject or a
+            CursorPagingObject, e.g. 'get_a_playlists_items'.
+        *args: The arguments of the method.
+        prefetch: The number of pages requested ahead in a background thread
+            while the current page is processed. 0 requests each page only
+            once it is needed.
+        max_items: Optional; Stop once this many items have been yielded in
+            total.
+        **kwargs: The keyword arguments of the method.
+
+    Raises:
+        SpotifyAPIError: If one of the requests fails.
+    """
+    page = check_page(getattr(sp, method_name)(*args, **kwargs))
+    if prefetch <= 0:
+        seen = 0
+        while True:
+            yield page
+            seen += len(page)
+            if not page.next or (max_items is not None and seen >= max_items):
+                return
+            page = _fetch_next_page(sp, page)
+    else:
+        yield from _iter_prefetched_pages(sp, page, prefetch, max_items)
+
+
+def _iter_prefetched_pages(sp, page: Page, prefetch: int,
+                           max_items: Optional[int]) -> Iterator[Page]:
+    """Yield the pages while a background thread follows the next urls and
+    keeps up to prefetch pages waiting in a bounded queue."""
+    pages = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+
+    def put(value) -> bool:
+        while not stop.is_set():
+            try:
+                pages.put(value, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce(current: Page):
+        seen = len(current)
+        try:
+            while current.next and (max_items is None or seen < max_items):
+                current = _fetch_next_page(sp, current)
+                seen += len(current)
+                if not put(current):
+                    return
+        except Exception as e:
+            put(e)
+            return
+        put(_END)
+
+    producer = threading.Thread(target=produce, args=(page,), daemon=True)
+    producer.start()
+    try:
+        yield page
+        while (value := pages.get()) is not _END:
+            if isinstance(value, Exception):
+                raise value
+            yield value
+    finally:
+        stop.set()
+
+
+def iter_items(sp, method_name: str, *args, prefetch: int = 0,
+               max_items: Optional[int] = None,
+               **kwargs) -> Iterator[SpotifyObject]:
+    """Yield every item of every page returned by the method. Takes the
+    same arguments as iter_pages."""
+    yielded = 0
+    for page in iter_pages(sp, method_name, *args, prefetch=prefetch,
+                           max_items=max_items, **kwargs):
+        for item in page:
+            yield item
+            yielded += 1
+            if max_items is not None and yielded >= max_items:
+                return
+
+
+async def _async_fetch_next_page(sp, page: Page) -> Page:
+    """Request the page following page."""
+    response, error = await sp._get(page.next, {}, {})
+    if error:
+        raise SpotifyAPIError(ErrorObject(response))
+    return wrap_next_page(page, response)
+
+
+async def async_iter_pages(sp, method_name: str, *args, prefetch: int = 0,
+                           max_items: Optional[int] = None,
+                           **kwargs) -> AsyncIterator[Page]:
+    """Asyncio version of iter_pages for an AsyncSpotifyAPI instance. The
+    prefetched pages are requested by a background task."""
+    page = check_page(await getattr(sp, method_name)(*args, **kwargs))
+    if prefetch <= 0:
+        seen = 0
+        while True:
+            yield page
+            seen += len(page)
+            if not page.next or (max_items is not None and seen >= max_items):
+                return
+            page = await _async_fetch_next_page(sp, page)
+
+    pages = asyncio.Queue(maxsize=prefetch)
+
+    async def produce(current: Page):
+        seen = len(current)
+        try:
+            while current.next and (max_items is None or seen < max_items):
+                current = await _async_fetch_next_page(sp, current)
+                seen += len(current)
+                await pages.put(current)
+        except Exception as e:
+            await pages.put(e)
+            return
+        await pages.put(_END)
+
+    producer = asyncio.ensure_future(produce(page))
+    try:
+        yield page
+        while (value := await pages.get()) is not _END:
+            if isinstance(value, Exception):
+                raise value
+            yield value
+    finally:
+        producer.cancel()
+
+
+async def async_iter_items(sp, method_name: str, *args, prefetch: int = 0,
+                           max_items: Optional[int] = None,
+                           **kwargs) -> AsyncIterator[SpotifyObject]:
+    """Asyncio version of iter_items for an AsyncSpotifyAPI instance."""
+    yielded = 0
+    async for page in async_iter_pages(sp, method_name, *args,
+                                       prefetch=prefetch,
+                                       max_items=max_items, **kwargs):
+        for item in page:
+            yield item
+            yielded += 1
+            if max_items is not None and yielded >= max_items:
+                return
+
+
+def check_takes_offset(method_name: str, method) -> None:
+    """Make sure the method is offset based.
+
+    Raises:
+        ValueError: If the method does not take an offset.
+    """
+    if 'offset' not in inspect.signature(method).parameters:
+        raise ValueError(f'{method_name!r} does not take an offset.')
+
+
+def plan_remaining_pages(method_name: str,
+                         first_result) -> Tuple[int, List[int]]:
+    """Return the page size and the offset of every page after the first
+    result, which is either a page or the list of pages returned by
+    search_for_an_item.
+
+    Raises:
+        SpotifyAPIError: If the first result is an ErrorObject.
+    """
+    pages = first_result if isinstance(first_result, list) else [first_result]
+    pages = [check_page(page) for page in pages]
+    if not pages:
+        return 0, []
+    limit = pages[0].limit
+    start = pages[0].offset + limit
+    total = max(page.total for page in pages)
+    if method_name == 'search_for_an_item':
+        total = min(total, MAX_SEARCH_OFFSET + limit)
+    return limit, list(range(start, total, limit))
+
+
+def merge_page_items(first_result, results: list) -> list:
+    """Merge the items of the first result and of the pages that followed
+    it in order. The items of search_for_an_item are merged into one list
+    per item type.
+
+    Raises:
+        SpotifyAPIError: If one of the results is an ErrorObject.
+    """
+    if isinstance(first_result, list):
+        merged = [list(page.items) for page in first_result]
+        for result in results:
+            if isinstance(result, ErrorObject):
+                raise SpotifyAPIError(result)
+            for items, page in zip(merged, result):
+                items.extend(page.items)
+        return merged
+    merged = list(first_result.items)
+    for result in results:
+        merged.extend(check_page(result).items)
+    return merged
+
+
+def fetch_all(sp, method_name: str, *args, max_workers: int = 8,
+              **kwargs) -> list:
+    """Request the first page of an offset based method, then request every
+    remaining page at once using the total of the first page and return all
+    the items in order.
+
+    Args:
+        sp: The SpotifyAPI instance to send the requests through.
+        method_name: The name of a method taking an offset, e.g.
+            'get_a_playlists_items'.
+        *args: The arguments of the method.
+        max_workers: The maximum number of pages requested at once.
+        **kwargs: The keyword arguments of the method. The limit (page
+            size) of the first page is used for every page.
+
+    Returns:
+        Every item of every page. search_for_an_item returns one list of
+        items per searched type instead.
+
+    Raises:
+        SpotifyAPIError: If one of the requests fails.
+        ValueError: If the method does not take an offset.
+    """
+    method = getattr(sp, method_name)
+    check_takes_offset(method_name, method)
+    first_result = method(*args, **kwargs)
+    kwargs['limit'], offsets = plan_remaining_pages(method_name,
+                                                    first_result)
+
+    def request_page(offset):
+        return method(*args, **dict(kwargs, offset=offset))
+
+    with ThreadPoolExecutor(max_workers) as executor:
+        results = list(executor.map(request_page, offsets))
+    return merge_page_items(first_result, results)
+
+
+async def async_fetch_all(sp, method_name: str, *args,
+                          max_concurrency: int = 8, **kwargs) -> list:
+    """Asyncio version of fetch_all for an AsyncSpotifyAPI instance."""
+    method = getattr(sp, method_name)
+    check_takes_offset(method_name, method)
+    first_result = await method(*args, **kwargs)
+    kwargs['limit'], offsets = plan_remaining_pages(method_name,
+                                                    first_result)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def request_page(offset):
+        async with semaphore:
+            return await method(*args, **dict(kwargs, offset=offset))
+
+    results = await asyncio.gather(*(request_page(offset)
+                                     for offset in offsets))
+    return merge_page_items(first_result, results)
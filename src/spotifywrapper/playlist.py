@@ -0,0 +1,299 @@
+"""
+Write any number of items to a playlist in requests of at most 100 items,
+chaining the snapshot id of each write into the next one.
+"""
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from .object_library import ErrorObject
+from .utilities import SpotifyAPIError, chunked
+
+# The maximum number of items the playlist endpoints accept in one request.
+MAX_ITEMS_PER_REQUEST = 100
+
+
+def plan_additions(uris: Iterable[str], position: Optional[int] = None
+                   ) -> List[Tuple[List[str], Optional[int]]]:
+    """Split the uris into chunks of at most 100 items, each with the
+    position it is inserted at so the chunks land in the order of the uris.
+    Chunks without a position are appended."""
+    return [(chunk, None if position is None
+             else position + i * MAX_ITEMS_PER_REQUEST)
+            for i, chunk in enumerate(chunked(list(uris),
+                                              MAX_ITEMS_PER_REQUEST))]
+
+
+def plan_removals(uris: Iterable[str]) -> List[List[dict]]:
+    """Split the uris into the 'tracks' bodies of at most 100 items of
+    remove_items_from_a_playlist. Every occurrence of a uri is removed, so
+    each uri is sent once."""
+    return [[{'uri': uri} for uri in chunk]
+            for chunk in chunked(list(dict.fromkeys(uris)),
+                                 MAX_ITEMS_PER_REQUEST)]
+
+
+def plan_positional_removals(items: Iterable[Tuple[str, int]]
+                             ) -> List[List[dict]]:
+    """Split (uri, position) pairs into the 'tracks' bodies of at most 100
+    positions of remove_items_from_a_playlist. The highest positions are
+    removed first, so the positions of each body are still valid once the
+    bodies before it have been applied."""
+    items = sorted(items, key=lambda item: item[1], reverse=True)
+    bodies = []
+    for chunk in chunked(items, MAX_ITEMS_PER_REQUEST):
+        positions = {}
+        for uri, position in chunk:
+            positions.setdefault(uri, []).append(position)
+        bodies.append([{'uri': uri, 'positions': uri_positions}
+                       for uri, uri_positions in positions.items()])
+    return bodies
+
+
+class PlaylistWriter:
+    """Add, replace and remove any number of items of a playlist.
+
+    The writes are split into requests of at most 100 items, which are sent
+    one after the other by a background thread while the caller queues the
+    next ones. Each write is sent with the snapshot id returned by the
+    previous one. Once a write fails the writes queued after it are
+    skipped, and flush raises its error.
+
+    Example:
+        with sp.playlist_writer(playlist_id) as writer:
+            writer.add(uris)
+            writer.remove(unwanted_uris)
+
+    Args:
+        sp: The SpotifyAPI instance to send the requests through.
+        playlist_id: The Spotify ID of the playlist.
+        snapshot_id: Optional; The snapshot id of the playlist the first
+            write is sent against.
+    """
+
+    def __init__(self, sp, playlist_id: str,
+                 snapshot_id: Optional[str] = None):
+        self._sp = sp
+        self.playlist_id = playlist_id
+        self.snapshot_id = snapshot_id
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._futures: List[Future] = []
+        self._error: Optional[Exception] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        if exc_type is None:
+            self.close()
+        else:
+            self._executor.shutdown(wait=True)
+
+    def add(self, uris: Iterable[str], position: Optional[int] = None
+            ) -> None:
+        """Queue the uris to be added at the position, or appended if it is
+        omitted, in their order."""
+        for chunk, chunk_position in plan_additions(uris, position):
+            self._submit(self._sp.add_items_to_a_playlist, self.playlist_id,
+                         position=chunk_position, uris=chunk)
+
+    def replace(self, uris: Iterable[str]) -> None:
+        """Queue the replacement of every item of the playlist with the
+        uris. An empty list clears the playlist."""
+        chunks = plan_additions(uris) or [([], None)]
+        self._submit(self._sp.reorder_or_replace_a_playlists_items,
+                     self.playlist_id, uris=chunks[0][0])
+        for chunk, _ in chunks[1:]:
+            self._submit(self._sp.add_items_to_a_playlist, self.playlist_id,
+                         uris=chunk)
+
+    def remove(self, uris: Iterable[str]) -> None:
+        """Queue the removal of every occurrence of the uris."""
+        for tracks in plan_removals(uris):
+            self._submit(self._sp.remove_items_from_a_playlist,
+                         self.playlist_id, tracks=tracks, snapshot=True)
+
+    def remove_at(self, items: Iterable[Tuple[str, int]]) -> None:
+        """Queue the removal of the (uri, position) items. The positions
+        are those of the playlist once the writes queued before have been
+        applied."""
+        for tracks in plan_positional_removals(items):
+            self._submit(self._sp.remove_items_from_a_playlist,
+                         self.playlist_id, tracks=tracks, snapshot=True)
+
+    def reorder(self, range_start: int, insert_before: int,
+                range_length: int = 1) -> None:
+        """Queue moving range_length items from range_start to before the
+        item at insert_before."""
+        self._submit(self._sp.reorder_or_replace_a_playlists_items,
+                     self.playlist_id, range_start=range_start,
+                     insert_before=insert_before, range_length=range_length,
+                     snapshot=True)
+
+    def flush(self) -> Optional[str]:
+        """Wait for every queued write and return the latest snapshot id.
+
+        Raises:
+            SpotifyAPIError: If a write failed. The writes queued after it
+                were skipped.
+        """
+        with self._lock:
+            futures, self._futures = self._futures, []
+        for future in futures:
+            future.result()
+        with self._lock:
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+        return self.snapshot_id
+
+    def close(self) -> Optional[str]:
+        """Flush the queued writes and stop the background thread."""
+        try:
+            return self.flush()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def _submit(self, method: Callable, *args, snapshot: bool = False,
+                **kwargs) -> None:
+        """Queue a request. Requests with snapshot are sent against the
+        latest snapshot id."""
+        future = self._executor.submit(self._write, method, args, kwargs,
+                                       snapshot)
+        with self._lock:
+            self._futures.append(future)
+
+    def _write(self, method: Callable, args: tuple, kwargs: dict,
+               snapshot: bool) -> None:
+        """Send a request unless an earlier one failed and keep its snapshot
+        id."""
+        if self._error is not None:
+            return
+        if snapshot:
+            kwargs['snapshot_id'] = self.snapshot_id
+        try:
+            result = method(*args, **kwargs)
+        except Exception as e:
+            self._error = e
+            return
+        self.requests += 1
+        if isinstance(result, ErrorObject):
+            self._error = SpotifyAPIError(result)
+        else:
+            self.snapshot_id = result
+
+
+class AsyncPlaylistWriter:
+    """Asyncio version of PlaylistWriter for an AsyncSpotifyAPI instance.
+    The writes are sent one after the other by a chain of tasks.
+
+    Args:
+        sp: The AsyncSpotifyAPI instance to send the requests through.
+        playlist_id: The Spotify ID of the playlist.
+        snapshot_id: Optional; The snapshot id of the playlist the first
+            write is sent against.
+    """
+
+    def __init__(self, sp, playlist_id: str,
+                 snapshot_id: Optional[str] = None):
+        self._sp = sp
+        self.playlist_id = playlist_id
+        self.snapshot_id = snapshot_id
+        self.requests = 0
+        self._last: Optional[asyncio.Task] = None
+        self._error: Optional[Exception] = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, *exc_info):
+        if exc_type is None:
+            await self.flush()
+        elif self._last is not None:
+            await asyncio.wait([self._last])
+
+    def add(self, uris: Iterable[str], position: Optional[int] = None
+            ) -> None:
+        """Queue the uris to be added at the position, or appended if it is
+        omitted, in their order."""
+        for chunk, chunk_position in plan_additions(uris, position):
+            self._submit(self._sp.add_items_to_a_playlist, self.playlist_id,
+                         position=chunk_position, uris=chunk)
+
+    def replace(self, uris: Iterable[str]) -> None:
+        """Queue the replacement of every item of the playlist with the
+        uris. An empty list clears the playlist."""
+        chunks = plan_additions(uris) or [([], None)]
+        self._submit(self._sp.reorder_or_replace_a_playlists_items,
+                     self.playlist_id, uris=chunks[0][0])
+        for chunk, _ in chunks[1:]:
+            self._submit(self._sp.add_items_to_a_playlist, self.playlist_id,
+                         uris=chunk)
+
+    def remove(self, uris: Iterable[str]) -> None:
+        """Queue the removal of every occurrence of the uris."""
+        for tracks in plan_removals(uris):
+            self._submit(self._sp.remove_items_from_a_playlist,
+                         self.playlist_id, tracks=tracks, snapshot=True)
+
+    def remove_at(self, items: Iterable[Tuple[str, int]]) -> None:
+        """Queue the removal of the (uri, position) items. The positions
+        are those of the playlist once the writes queued before have been
+        applied."""
+        for tracks in plan_positional_removals(items):
+            self._submit(self._sp.remove_items_from_a_playlist,
+                         self.playlist_id, tracks=tracks, snapshot=True)
+
+    def reorder(self, range_start: int, insert_before: int,
+                range_length: int = 1) -> None:
+        """Queue moving range_length items from range_start to before the
+        item at insert_before."""
+        self._submit(self._sp.reorder_or_replace_a_playlists_items,
+                     self.playlist_id, range_start=range_start,
+                     insert_before=insert_before, range_length=range_length,
+                     snapshot=True)
+
+    async def flush(self) -> Optional[str]:
+        """Wait for every queued write and return the latest snapshot id.
+
+        Raises:
+            SpotifyAPIError: If a write failed. The writes queued after it
+                were skipped.
+        """
+        if self._last is not None:
+            await self._last
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+        return self.snapshot_id
+
+    def _submit(self, method: Callable, *args, snapshot: bool = False,
+                **kwargs) -> None:
+        """Queue a request after the last queued one."""
+        self._last = asyncio.ensure_future(
+            self._write(self._last, method, args, kwargs, snapshot))
+
+    async def _write(self, previous: Optional[asyncio.Task],
+                     method: Callable, args: tuple, kwargs: dict,
+                     snapshot: bool) -> None:
+        """Send a request once the previous one is done, unless an earlier
+        one failed, and keep its snapshot id."""
+        if previous is not None:
+            await previous
+        if self._error is not None:
+            return
+        if snapshot:
+            kwargs['snapshot_id'] = self.snapshot_id
+        try:
+            result = await method(*args, **kwargs)
+        except Exception as e:
+            self._error = e
+            return
+        self.requests += 1
+        if isinstance(result, ErrorObject):
+            self._error = SpotifyAPIError(result)
+        else:
+            self.snapshot_id = result
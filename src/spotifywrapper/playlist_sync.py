@@ -0,0 +1,243 @@
+"""
+Bring a playlist to a target list of uris with the fewest writes: the items
+missing from the target are removed, the items out of order are moved with
+range reorders planned from a longest increasing subsequence, and the
+missing items are inserted in runs.
+"""
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .object_library import ErrorObject, PlaylistTrackObject
+from .playlist import MAX_ITEMS_PER_REQUEST, AsyncPlaylistWriter, \
+    PlaylistWriter
+from .projection import Projection
+from .utilities import SpotifyAPIError
+
+# The fields requested from the items of the synced playlist.
+ITEM_FIELDS = Projection.items(PlaylistTrackObject, 'track.uri')
+
+
+@dataclass
+class PlaylistDiff:
+    """The writes turning the current items of a playlist into the target.
+    They are applied in order: removals, then moves, then insertions.
+
+    Attributes:
+        removals: The (uri, position) of each removed item, positions of
+            the current playlist.
+        moves: The (range_start, insert_before, range_length) of each
+            reorder, positions of the playlist at the time of the move.
+        insertions: The (position, uris) of each run of inserted items,
+            positions of the target.
+    """
+    removals: List[Tuple[str, int]] = field(default_factory=list)
+    moves: List[Tuple[int, int, int]] = field(default_factory=list)
+    insertions: List[Tuple[int, List[str]]] = field(default_factory=list)
+
+    def __bool__(self):
+        return bool(self.removals or self.moves or self.insertions)
+
+    @property
+    def requests(self) -> int:
+        """The number of requests applying the diff takes."""
+        return (-(-len(self.removals) // MAX_ITEMS_PER_REQUEST) +
+                len(self.moves) +
+                sum(-(-len(uris) // MAX_ITEMS_PER_REQUEST)
+                    for _, uris in self.insertions))
+
+
+def longest_increasing_subsequence(values: Sequence[int]) -> List[int]:
+    """Return the indices of a longest strictly increasing subsequence of
+    the values in O(n log n)."""
+    tails: List[int] = []
+    tail_indices: List[int] = []
+    previous: List[Optional[int]] = []
+    for i, value in enumerate(values):
+        j = bisect_left(tails, value)
+        if j == len(tails):
+            tails.append(value)
+            tail_indices.append(i)
+        else:
+            tails[j] = value
+            tail_indices[j] = i
+        previous.append(tail_indices[j - 1] if j else None)
+    indices = []
+    i = tail_indices[-1] if tail_indices else None
+    while i is not None:
+        indices.append(i)
+        i = previous[i]
+    return indices[::-1]
+
+
+def _match(current: Sequence[str], target: Sequence[str]
+           ) -> Tuple[List[Tuple[str, int]], List[int]]:
+    """Match the n-th occurrence of each uri of the current items to its
+    n-th occurrence in the target.
+
+    Returns:
+        The unmatched current items as (uri, position), and the target
+        index of each matched item in current order.
+    """
+    target_indices: Dict[str, List[int]] = {}
+    for i, uri in enumerate(target):
+        target_indices.setdefault(uri, []).append(i)
+    used: Dict[str, int] = {}
+    removals, kept = [], []
+    for position, uri in enumerate(current):
+        n = used.get(uri, 0)
+        indices = target_indices.get(uri, ())
+        if n < len(indices):
+            kept.append(indices[n])
+            used[uri] = n + 1
+        else:
+            removals.append((uri, position))
+    return removals, kept
+
+
+def _plan_moves(kept: List[int]) -> List[Tuple[int, int, int]]:
+    """Plan the reorders sorting the target indices of the kept items. The
+    items of a longest increasing subsequence stay; every other item is
+    moved right after the placed item preceding it in the target, together
+    with the following items which come next in the target too."""
+    order = list(kept)
+    placed = sorted(order[i] for i in
+                    longest_increasing_subsequence(order))
+    stays = set(placed)
+    moved = set()
+    moves = []
+    for index in sorted(set(order) - stays):
+        if index in moved:
+            continue
+        start = order.index(index)
+        length = 1
+        while (start + length < len(order) and
+               order[start + length] == index + length and
+               index + length not in stays):
+            length += 1
+        slot = bisect_left(placed, index)
+        insert_before = order.index(placed[slot - 1]) + 1 if slot else 0
+        block = list(range(index, index + length))
+        moved.update(block)
+        for value in block:
+            insort(placed, value)
+        if start <= insert_before <= start + length:
+            continue
+        moves.append((start, insert_before, length))
+        del order[start:start + length]
+        if insert_before > start:
+            insert_before -= length
+        order[insert_before:insert_before] = block
+    return moves
+
+
+def _plan_insertions(kept: List[int], target: Sequence[str]
+                     ) -> List[Tuple[int, List[str]]]:
+    """Group the target items which are not kept into runs of consecutive
+    positions. Inserting the runs in order puts every item at its target
+    position."""
+    kept = set(kept)
+    insertions: List[Tuple[int, List[str]]] = []
+    for i, uri in enumerate(target):
+        if i in kept:
+            continue
+        if insertions and insertions[-1][0] + len(insertions[-1][1]) == i:
+            insertions[-1][1].append(uri)
+        else:
+            insertions.append((i, [uri]))
+    return insertions
+
+
+def diff_playlist(current: Sequence[str],
+                  target: Sequence[str]) -> PlaylistDiff:
+    """Plan the fewest writes turning the current uris into the target
+    uris. Duplicated uris are matched by occurrence."""
+    removals, kept = _match(current, target)
+    return PlaylistDiff(removals=removals,
+                        moves=_plan_moves(kept),
+                        insertions=_plan_insertions(kept, target))
+
+
+def _get_uri(item: PlaylistTrackObject) -> Optional[str]:
+    """Return the uri of a playlist item, or None if it has no track."""
+    track = item._json_dict['track']
+    return track['uri'] if track is not None else None
+
+
+def _plan(current: List[Optional[str]],
+          target: Sequence[str]) -> Tuple[PlaylistDiff, bool]:
+    """Return the diff of the playlist and whether it has to be replaced
+    because an item without a track can not be removed by uri."""
+    if None in current:
+        return PlaylistDiff(removals=list(zip(current, range(len(current)))),
+                            insertions=[(0, list(target))]), True
+    return diff_playlist(current, target), False
+
+
+def _queue(writer, diff: PlaylistDiff, replace: bool,
+           target: Sequence[str]) -> None:
+    """Queue the writes of the diff in order."""
+    if replace:
+        writer.replace(target)
+        return
+    writer.remove_at(diff.removals)
+    for range_start, insert_before, range_length in diff.moves:
+        writer.reorder(range_start, insert_before, range_length)
+    for position, uris in diff.insertions:
+        writer.add(uris, position)
+
+
+def _get_snapshot_id(playlist) -> str:
+    """Return the snapshot id of the requested playlist.
+
+    Raises:
+        SpotifyAPIError: If the request failed.
+    """
+    if isinstance(playlist, ErrorObject):
+        raise SpotifyAPIError(playlist)
+    return playlist.snapshot_id
+
+
+def sync_playlist(sp, playlist_id: str,
+                  uris: Sequence[str]) -> Tuple[PlaylistDiff, Optional[str]]:
+    """Bring the playlist to the target uris with the writes planned by
+    diff_playlist, chained by snapshot id. A playlist holding items without
+    a track, which can not be removed by uri, is replaced instead.
+
+    Args:
+        sp: The SpotifyAPI instance to send the requests through.
+        playlist_id: The Spotify ID of the playlist.
+        uris: The target uris, in order.
+
+    Returns:
+        The applied diff and the snapshot id of the synced playlist.
+
+    Raises:
+        SpotifyAPIError: If one of the requests fails.
+    """
+    snapshot_id = _get_snapshot_id(
+        sp.get_a_playlist(playlist_id, fields='snapshot_id'))
+    items = sp.fetch_all('get_a_playlists_items', playlist_id,
+                         fields=ITEM_FIELDS, limit=MAX_ITEMS_PER_REQUEST)
+    diff, replace = _plan([_get_uri(item) for item in items], uris)
+    if not diff:
+        return diff, snapshot_id
+    with PlaylistWriter(sp, playlist_id, snapshot_id) as writer:
+        _queue(writer, diff, replace, uris)
+    return diff, writer.snapshot_id
+
+
+async def async_sync_playlist(sp, playlist_id: str, uris: Sequence[str]
+                              ) -> Tuple[PlaylistDiff, Optional[str]]:
+    """Asyncio version of sync_playlist for an AsyncSpotifyAPI instance."""
+    snapshot_id = _get_snapshot_id(
+        await sp.get_a_playlist(playlist_id, fields='snapshot_id'))
+    items = await sp.fetch_all('get_a_playlists_items', playlist_id,
+                               fields=ITEM_FIELDS,
+                               limit=MAX_ITEMS_PER_REQUEST)
+    diff, replace = _plan([_get_uri(item) for item in items], uris)
+    if not diff:
+        return diff, snapshot_id
+    async with AsyncPlaylistWriter(sp, playlist_id, snapshot_id) as writer:
+        _queue(writer, diff, replace, uris)
+    return diff, writer.snapshot_id
@@ -0,0 +1,206 @@
+"""
+Compile object_library attribute paths into the fields filter of the
+playlist endpoints and return partial objects holding only those fields.
+"""
+import re
+from typing import Dict, List, Optional, Sequence, Tuple, Type
+
+from . import object_library
+from .object_library import PagingObject, SpotifyObject
+
+# The keys of a paging object which are always requested with its items so
+# the pages can still be followed and counted.
+PAGING_KEYS = ('href', 'limit', 'next', 'offset', 'previous', 'total')
+
+Tree = Dict[str, Optional['Tree']]
+Candidate = Tuple[Type[SpotifyObject], Tuple[Type[SpotifyObject], ...]]
+
+
+class NotProjectedError(KeyError, AttributeError):
+    """Raised when a partial object is asked for a field its projection
+    did not request."""
+
+
+def _get_classes(annotation: str) -> List[Candidate]:
+    """Return the object_library classes named by a property's return
+    annotation, each with the item classes of a PagingObject."""
+    classes = [getattr(object_library, name)
+               for name in re.findall(r'\w*Object', annotation)]
+    if PagingObject in classes:
+        items = tuple(cls for cls in classes if cls is not PagingObject)
+        return [(PagingObject, items)]
+    return [(cls, ()) for cls in classes]
+
+
+def _check_path(root: Type[SpotifyObject], path: str,
+                items: Sequence[Type[SpotifyObject]] = ()
+                ) -> Tuple[List[str], List[str]]:
+    """Make sure every attribute of the dotted path is a property of the
+    classes it goes through.
+
+    Returns:
+        The prefixes of the path which lead to a PagingObject, e.g.
+        ['tracks'] for 'tracks.items.track.id' on PlaylistObject, and the
+        prefixes which lead to a Union below which the path continues, e.g.
+        ['tracks.items.track'].
+
+    Raises:
+        ValueError: If an attribute does not exist.
+    """
+    candidates: List[Candidate] = [(root, tuple(items))]
+    attrs = path.split('.')
+    pages, unions = [], []
+    for depth, attr in enumerate(attrs):
+        if depth and any(cls is PagingObject for cls, _ in candidates):
+            pages.append('.'.join(attrs[:depth]))
+        if not candidates:
+            raise ValueError(f'{path!r} goes below a value which is not an '
+                             f'object.')
+        found = [(cls, item_classes) for cls, item_classes in candidates
+                 if isinstance(getattr(cls, attr, None), property)]
+        if not found:
+            names = ', '.join(cls.__name__ for cls, _ in candidates)
+            raise ValueError(f'{path!r}: {names} has no attribute {attr!r}.')
+        next_candidates = []
+        for cls, item_classes in found:
+            if cls is PagingObject and attr == 'items':
+                next_candidates.extend((item, ()) for item in item_classes)
+            else:
+                annotation = getattr(cls, attr).fget.__annotations__.get(
+                    'return', '')
+                next_candidates.extend(_get_classes(str(annotation)))
+        candidates = next_candidates
+        if len(candidates) > 1 and depth < len(attrs) - 1:
+            unions.append('.'.join(attrs[:depth + 1]))
+    return pages, unions
+
+
+def _add_path(tree: Tree, path: str) -> None:
+    """Add the dotted path to the tree. A path ending on an object requests
+    the whole object."""
+    *parents, leaf = path.split('.')
+    node = tree
+    for attr in parents:
+        if attr in node and node[attr] is None:
+            return
+        node = node.setdefault(attr, {})
+    node[leaf] = None
+
+
+def compile_fields(tree: Tree) -> str:
+    """Compile the tree into the syntax of the fields filter, e.g.
+    {'items': {'track': {'id': None}}} becomes 'items(track(id))'."""
+    return ','.join(key if subtree is None
+                    else f'{key}({compile_fields(subtree)})'
+                    for key, subtree in tree.items())
+
+
+class Projection(str):
+    """The fields filter of get_a_playlist or get_a_playlists_items built
+    from attribute paths of the object_library classes. The client returns
+    partial objects for a projected request, which raise NotProjectedError
+    for the fields that were not requested.
+
+    Example:
+        fields = Projection.items(PlaylistTrackObject, 'added_at',
+                                  'track.id', 'track.album.id')
+        page = sp.get_a_playlists_items(playlist_id, fields=fields)
+
+    Args:
+        root: The class of the requested object, e.g. PlaylistObject.
+        *paths: Dotted attribute paths such as 'tracks.items.track.id'. A
+            path ending on an object requests all of its fields. The paging
+            keys of every page a path goes through are requested too, and
+            the type of every Union, which picks the class of its value.
+
+    Raises:
+        ValueError: If a path names an attribute the classes don't have.
+    """
+
+    tree: Tree
+
+    def __new__(cls, root: Type[SpotifyObject], *paths: str,
+                _items: Sequence[Type[SpotifyObject]] = ()):
+        tree: Tree = {}
+        for path in paths:
+            pages, unions = _check_path(root, path, _items)
+            _add_path(tree, path)
+            for page in pages:
+                for key in PAGING_KEYS:
+                    _add_path(tree, f'{page}.{key}')
+            for union in unions:
+                _add_path(tree, f'{union}.type')
+        projection = super().__new__(cls, compile_fields(tree))
+        projection.tree = tree
+        return projection
+
+    @classmethod
+    def items(cls, item_type: Type[SpotifyObject],
+              *paths: str) -> 'Projection':
+        """Create the projection of a paging endpoint from paths relative to
+        its items, e.g. Projection.items(PlaylistTrackObject, 'track.id').
+        The paging keys are always requested."""
+        return cls(PagingObject,
+                   *PAGING_KEYS,
+                   *(f'items.{path}' for path in paths),
+                   _items=(item_type,))
+
+    def apply(self, json_value):
+        """Wrap the decoded json of the projected response in PartialDicts
+        which know which fields were requested."""
+        return wrap_partial(json_value, self.tree)
+
+
+def wrap_partial(value, tree: Optional[Tree]):
+    """Wrap the dictionaries of the value, and the dictionaries in its
+    lists, in PartialDicts of the tree. A None tree means the whole value
+    was requested."""
+    if tree is None:
+        return value
+    if isinstance(value, list):
+        return [wrap_partial(item, tree) for item in value]
+    if isinstance(value, dict):
+        return PartialDict(value, tree)
+    return value
+
+
+class PartialDict(dict):
+    """The json of a projected object. Looking up a key which the
+    projection did not request raises NotProjectedError instead of
+    KeyError or returning a default, so a partial object fails loudly.
+
+    Args:
+        value: The decoded json dictionary.
+        tree: The requested fields of the dictionary.
+    """
+    __slots__ = ('tree',)
+
+    def __init__(self, value: dict, tree: Tree):
+        super().__init__((key, wrap_partial(item, tree.get(key)))
+                         for key, item in value.items())
+        self.tree = tree
+
+    def __missing__(self, key):
+        self._check_projected(key)
+        raise KeyError(key)
+
+    def __reduce__(self):
+        return PartialDict, (dict(self), self.tree)
+
+    def get(self, key, default=None):
+        if key not in self:
+            self._check_projected(key)
+        return super().get(key, default)
+
+    def rewrap(self, value: dict) -> 'PartialDict':
+        """Wrap another response of the same projection, e.g. the next
+        page."""
+        return PartialDict(value, self.tree)
+
+    def _check_projected(self, key) -> None:
+        """Raise NotProjectedError if the projection did not request the
+        key."""
+        if key not in self.tree:
+            raise NotProjectedError(
+                f'{key!r} was not requested by the fields projection '
+                f'{compile_fields(self.tree)!r}.')
@@ -0,0 +1,264 @@
+"""
+Keep the ids of the user's saved tracks, albums, episodes and shows in
+memory, so checking whether items are saved takes no request.
+"""
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+from .pagination import async_iter_pages, iter_pages
+
+# The maximum number of items the saved items endpoints return per page.
+MAX_ITEMS_PER_PAGE = 50
+
+# The methods listing each type of saved item.
+SAVED_ITEMS_METHODS = {
+    'tracks': 'get_users_saved_tracks',
+    'albums': 'get_users_saved_albums',
+    'episodes': 'get_users_saved_episodes',
+    'shows': 'get_users_saved_shows',
+}
+
+# The path of the endpoints saving, removing and checking each type.
+LIBRARY_PATH = '/v1/me/'
+
+
+def get_saved_items_method(item_type: str) -> str:
+    """Return the name of the method listing the saved items of the type.
+
+    Raises:
+        ValueError: If the item type is not part of the library.
+    """
+    try:
+        return SAVED_ITEMS_METHODS[item_type]
+    except KeyError:
+        raise ValueError(f'{item_type!r} is not a library item type. Choose '
+                         f'one of {list(SAVED_ITEMS_METHODS)}.') from None
+
+
+def _parse_url(url: str) -> Tuple[Optional[str], bool]:
+    """Return the item type of a library endpoint's url, or None for any
+    other url, and whether it is the endpoint checking the ids."""
+    path = urlsplit(url).path
+    if not path.startswith(LIBRARY_PATH):
+        return None, False
+    segments = path[len(LIBRARY_PATH):].split('/')
+    if segments[0] not in SAVED_ITEMS_METHODS or len(segments) > 2:
+        return None, False
+    if len(segments) == 2:
+        return (segments[0], True) if segments[1] == 'contains' \
+            else (None, False)
+    return segments[0], False
+
+
+def _get_ids(params: dict) -> List[str]:
+    """Return the ids of the converted query parameters of a request."""
+    ids = params.get('ids')
+    return ids.split(',') if ids else []
+
+
+def _read_items(item_type: str, items: Iterable) -> List[Tuple[str, str]]:
+    """Return the (id, added_at) of each saved item, skipping the items
+    which are no longer available."""
+    key = item_type[:-1]
+    read = []
+    for item in items:
+        json_dict = item._json_dict
+        saved = json_dict.get(key)
+        if saved is not None:
+            read.append((saved['id'], json_dict['added_at']))
+    return read
+
+
+def _get_index(sp) -> 'SavedItemsIndex':
+    """Return the saved_index of the client.
+
+    Raises:
+        ValueError: If the client has none.
+    """
+    if sp.saved_index is None:
+        raise ValueError('The client has no saved_index. Create it with '
+                         'saved_index=SavedItemsIndex().')
+    return sp.saved_index
+
+
+class SavedItemsIndex:
+    """The ids of the current user's saved items of each type, to check
+    whether items are saved without a request.
+
+    A type is loaded by the client's refresh_saved_items, which walks the
+    saved items once and afterwards only requests the pages of the items
+    saved since the previous refresh. Once a type is loaded, the client
+    keeps it current with its own save and remove requests and answers its
+    check_users_saved_* requests from the index. Items saved or removed by
+    another device show up on the next refresh.
+
+    Example:
+        sp = SpotifyAPI(saved_index=SavedItemsIndex())
+        sp.refresh_saved_items(['tracks'])
+        hearts = sp.saved_index.contains('tracks', track_ids)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ids: Dict[str, Set[str]] = {}
+        self._newest: Dict[str, Optional[str]] = {}
+
+    def __len__(self):
+        with self._lock:
+            return sum(map(len, self._ids.values()))
+
+    @property
+    def item_types(self) -> List[str]:
+        """Return the loaded item types."""
+        with self._lock:
+            return list(self._ids)
+
+    def is_loaded(self, item_type: str) -> bool:
+        """Return whether the saved items of the type are indexed."""
+        with self._lock:
+            return item_type in self._ids
+
+    def contains(self, item_type: str, ids: Iterable[str]) -> List[bool]:
+        """Return whether each id is saved.
+
+        Raises:
+            ValueError: If the item type is not loaded.
+        """
+        with self._lock:
+            saved = self._ids.get(item_type)
+            if saved is None:
+                raise ValueError(f'The saved {item_type} are not loaded. Call '
+                                 f'refresh_saved_items first.')
+            return [id_ in saved for id_ in ids]
+
+    def get_newest(self, item_type: str) -> Optional[str]:
+        """Return when the newest indexed item of the type was saved."""
+        with self._lock:
+            return self._newest.get(item_type)
+
+    def replace(self, item_type: str, items: Iterable) -> None:
+        """Index the saved items, newest first, as every item of the
+        type."""
+        read = _read_items(item_type, items)
+        with self._lock:
+            self._ids[item_type] = {id_ for id_, _ in read}
+            self._newest[item_type] = read[0][1] if read else None
+
+    def merge(self, item_type: str, items: Iterable, total: int) -> bool:
+        """Add the most recently saved items, newest first, to the loaded
+        type.
+
+        Returns:
+            Whether the index holds as many items as the total of the saved
+            items. If not, items were removed by another device and the type
+            has to be replaced.
+        """
+        read = _read_items(item_type, items)
+        with self._lock:
+            saved = self._ids[item_type]
+            saved.update(id_ for id_, _ in read)
+            if read:
+                self._newest[item_type] = max(
+                    read[0][1], self._newest[item_type] or '')
+            return len(saved) == total
+
+    def clear(self) -> None:
+        """Forget every loaded type, e.g. when the user logs out."""
+        with self._lock:
+            self._ids.clear()
+            self._newest.clear()
+
+    def lookup(self, http_method: str, url: str,
+               params: dict) -> Optional[List[bool]]:
+        """Answer a request checking saved ids of a loaded type.
+
+        Returns:
+            The json the endpoint would return, or None if the request has
+            to be sent.
+        """
+        if http_method != 'GET':
+            return None
+        item_type, check = _parse_url(url)
+        if not check:
+            return None
+        with self._lock:
+            saved = self._ids.get(item_type)
+            if saved is None:
+                return None
+            return [id_ in saved for id_ in _get_ids(params)]
+
+    def record(self, http_method: str, url: str, params: dict) -> None:
+        """Apply a successful request saving or removing ids of a loaded
+        type."""
+        if http_method not in ('PUT', 'DELETE'):
+            return
+        item_type, check = _parse_url(url)
+        if item_type is None or check:
+            return
+        with self._lock:
+            saved = self._ids.get(item_type)
+            if saved is None:
+                return
+            if http_method == 'PUT':
+                saved.update(_get_ids(params))
+            else:
+                saved.difference_update(_get_ids(params))
+
+
+def _reaches(page, item_type: str, newest: Optional[str]) -> bool:
+    """Return whether the page reaches the items indexed by the previous
+    refresh."""
+    read = _read_items(item_type, page)
+    return newest is not None and bool(read) and read[-1][1] <= newest
+
+
+def refresh_saved_items(sp, item_type: str) -> None:
+    """Load the saved items of the type into the client's saved_index, or
+    add the items saved since the previous refresh. The pages are requested
+    newest first until one reaches the indexed items; if the index then
+    misses or holds extra items, every page is requested again at once.
+
+    Args:
+        sp: The SpotifyAPI instance to send the requests through.
+        item_type: 'tracks', 'albums', 'episodes' or 'shows'.
+
+    Raises:
+        ValueError: If the client has no saved_index or the item type is
+            not part of the library.
+        SpotifyAPIError: If one of the requests fails.
+    """
+    index = _get_index(sp)
+    method_name = get_saved_items_method(item_type)
+    if index.is_loaded(item_type):
+        newest = index.get_newest(item_type)
+        items, total = [], 0
+        for page in iter_pages(sp, method_name, limit=MAX_ITEMS_PER_PAGE):
+            items.extend(page)
+            total = page.total
+            if _reaches(page, item_type, newest):
+                break
+        if index.merge(item_type, items, total):
+            return
+    index.replace(item_type, sp.fetch_all(method_name,
+                                          limit=MAX_ITEMS_PER_PAGE))
+
+
+async def async_refresh_saved_items(sp, item_type: str) -> None:
+    """Asyncio version of refresh_saved_items for an AsyncSpotifyAPI
+    instance."""
+    index = _get_index(sp)
+    method_name = get_saved_items_method(item_type)
+    if index.is_loaded(item_type):
+        newest = index.get_newest(item_type)
+        items, total = [], 0
+        async for page in async_iter_pages(sp, method_name,
+                                           limit=MAX_ITEMS_PER_PAGE):
+            items.extend(page)
+            total = page.total
+            if _reaches(page, item_type, newest):
+                break
+        if index.merge(item_type, items, total):
+            return
+    index.replace(item_type, await sp.fetch_all(method_name,
+                                                limit=MAX_ITEMS_PER_PAGE))
@@ -0,0 +1,289 @@
+"""
+Pace the requests of a client and retry the ones the Web API rate limited.
+"""
+import asyncio
+from collections import deque
+from email.utils import parsedate_to_datetime
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# The methods whose requests are retried after a 5xx. Sending a POST again
+# could apply it twice, e.g. add the same items to a playlist, so it is
+# only retried after a 429, which the server did not process.
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'PUT', 'DELETE')
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Return the number of seconds to wait given by a Retry-After header,
+    which is either a number of seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(),
+                   0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _close(response) -> None:
+    """Close a response which is retried, so a streamed response gives its
+    pooled connection back."""
+    close = getattr(response, 'close', None)
+    if close is not None:
+        close()
+
+
+async def _async_close(response) -> None:
+    """Asyncio version of _close for httpx responses."""
+    aclose = getattr(response, 'aclose', None)
+    if aclose is not None:
+        await aclose()
+    else:
+        _close(response)
+
+
+class RequestScheduler:
+    """Scheduler shared by every request of a SpotifyAPI client.
+
+    A 429 response pauses every request of the client for the number of
+    seconds given by its Retry-After header, and 429 responses, or 5xx
+    responses of idempotent requests, are retried with jittered exponential
+    backoff. Pacing is opt-in: with a rate, requests are paced by a token
+    bucket, and with max_in_flight at most that many are sent at once.
+    Requests waiting for an in-flight slot, from threads or from tasks of
+    any event loop, are woken one at a time in the order they arrived as
+    slots are freed.
+
+    Args:
+        rate: Optional; The number of requests per second the token bucket
+            allows. Requests are not paced if it is omitted.
+        burst: The number of requests which can be sent at once before the
+            rate applies.
+        max_in_flight: Optional; The maximum number of requests waiting for
+            the server at the same time. Unlimited if it is omitted.
+        max_retries: The number of times a 429 or 5xx response is retried
+            before it is returned.
+        backoff_factor: The backoff (in seconds) of the first retry. It
+            doubles with every retry and is fully jittered.
+        max_backoff: The maximum number of seconds to wait before a retry.
+    """
+
+    def __init__(self,
+                 rate: Optional[float] = None,
+                 burst: int = 40,
+                 max_in_flight: Optional[int] = None,
+                 max_retries: int = 5,
+                 backoff_factor: float = 0.5,
+                 max_backoff: float = 30.0):
+        self.rate = rate
+        self.burst = burst
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.requests = 0
+        self.retries = 0
+        self.rate_limited = 0
+        self.throttled_seconds = 0.0
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._slot_waiters: Deque[Callable[[], None]] = deque()
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """Return the request, retry and rate limit counters and the total
+        number of seconds requests spent waiting on the scheduler."""
+        return dict(requests=self.requests,
+                    retries=self.retries,
+                    rate_limited=self.rate_limited,
+                    throttled_seconds=self.throttled_seconds)
+
+    def send(self, send_request: Callable[[], Any],
+             http_method: str = 'GET') -> Any:
+        """Send the request once the scheduler allows it and retry it while
+        it is rate limited or, if it is idempotent, fails with a 5xx status.
+
+        Args:
+            send_request: A function sending the request and returning the
+                response.
+            http_method: The method of the request, which decides whether a
+                5xx is retried.
+
+        Returns:
+            The first response which should not be retried, or the last one
+            once the retries are used up.
+        """
+        attempt = 0
+        while True:
+            self._wait(self._reserve())
+            self._acquire_slot()
+            try:
+                response = send_request()
+            finally:
+                self._release_slot()
+            delay = self._get_retry_delay(response, attempt, http_method)
+            if delay is None:
+                return response
+            _close(response)
+            attempt += 1
+            self._wait(delay)
+
+    async def async_send(self, send_request: Callable[[], Awaitable],
+                         http_method: str = 'GET') -> Any:
+        """Asyncio version of send for an AsyncSpotifyAPI instance. The
+        in-flight limit is shared with threaded callers."""
+        attempt = 0
+        while True:
+            await self._async_wait(self._reserve())
+            await self._async_acquire_slot()
+            try:
+                response = await send_request()
+            finally:
+                self._release_slot()
+            delay = self._get_retry_delay(response, attempt, http_method)
+            if delay is None:
+                return response
+            await _async_close(response)
+            attempt += 1
+            await self._async_wait(delay)
+
+    def _reserve(self) -> float:
+        """Take a token from the bucket and return the number of seconds to
+        wait before it may be used. Tokens are reserved ahead, so waiting
+        requests are released in the order they arrived."""
+        with self._lock:
+            now = time.monotonic()
+            self.requests += 1
+            if self.rate is None:
+                return self._paused_until - now
+            self._tokens = min(self.burst, self._tokens +
+                               (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    def _get_retry_delay(self, response, attempt: int,
+                         http_method: str) -> Optional[float]:
+        """Return the number of seconds to wait before retrying the response
+        or None if it should be returned. A 429 pauses every request until
+        its Retry-After has passed."""
+        status = response.status_code
+        if status not in RETRY_STATUSES or attempt >= self.max_retries:
+            return None
+        if status != 429 and http_method.upper() not in IDEMPOTENT_METHODS:
+            return None
+        backoff = random.uniform(
+            0, min(self.max_backoff, self.backoff_factor * 2 ** attempt))
+        with self._lock:
+            self.retries += 1
+            if status != 429:
+                return backoff
+            self.rate_limited += 1
+            retry_after = parse_retry_after(
+                response.headers.get('Retry-After'))
+            if retry_after is None:
+                return backoff
+            self._paused_until = max(self._paused_until,
+                                     time.monotonic() + retry_after)
+            self._tokens = min(self._tokens, 0.0)
+            return retry_after
+
+    def _wait(self, seconds: float) -> None:
+        """Sleep and add the time to throttled_seconds."""
+        if seconds > 0:
+            self._add_throttled(seconds)
+            time.sleep(seconds)
+
+    async def _async_wait(self, seconds: float) -> None:
+        """Sleep without blocking the event loop and add the time to
+        throttled_seconds."""
+        if seconds > 0:
+            self._add_throttled(seconds)
+            await asyncio.sleep(seconds)
+
+    def _try_acquire_slot(self) -> bool:
+        """Take a free in-flight slot unless requests are already waiting
+        for one. Must be called with the lock held."""
+        if self.max_in_flight is None or (
+                self._in_flight < self.max_in_flight and
+                not self._slot_waiters):
+            self._in_flight += 1
+            return True
+        return False
+
+    def _acquire_slot(self) -> None:
+        """Wait for an in-flight slot and add the time to
+        throttled_seconds."""
+        with self._lock:
+            if self._try_acquire_slot():
+                return
+            handed_over = threading.Event()
+            self._slot_waiters.append(handed_over.set)
+        start = time.monotonic()
+        handed_over.wait()
+        self._add_throttled(time.monotonic() - start)
+
+    async def _async_acquire_slot(self) -> None:
+        """Wait for an in-flight slot without blocking the event loop. The
+        slot is handed over to the waiting task through a future of its
+        loop, so nothing runs while it waits."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._try_acquire_slot():
+                return
+            handed_over = loop.create_future()
+
+            def wake():
+                loop.call_soon_threadsafe(self._hand_over, handed_over)
+
+            self._slot_waiters.append(wake)
+        start = time.monotonic()
+        try:
+            await handed_over
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._slot_waiters.remove(wake)
+                    waiting = True
+                except ValueError:
+                    waiting = False
+            # A slot handed over before the cancellation is passed on.
+            if (not waiting and handed_over.done() and
+                    not handed_over.cancelled()):
+                self._release_slot()
+            raise
+        self._add_throttled(time.monotonic() - start)
+
+    def _hand_over(self, handed_over: asyncio.Future) -> None:
+        """Give the released slot to a waiting task, or pass it on if the
+        task was cancelled meanwhile."""
+        if handed_over.cancelled():
+            self._release_slot()
+        else:
+            handed_over.set_result(None)
+
+    def _release_slot(self) -> None:
+        """Hand the slot over to the first waiting request, or free it."""
+        with self._lock:
+            if not self._slot_waiters:
+                self._in_flight -= 1
+                return
+            wake = self._slot_waiters.popleft()
+        wake()
+
+    def _add_throttled(self, seconds: float) -> None:
+        """Add the number of seconds a request waited."""
+        with self._lock:
+            self.throttled_seconds += seconds
@@ -0,0 +1,140 @@
+"""
+Compact serialization of object_library objects for moving them between
+processes. Uses msgpack when it is installed and json otherwise.
+
+Each object is stored once, as its class name, the item class name of a page,
+its decoded json and the requested fields of a projected object, and is
+rebuilt from the decoded payload without being parsed a second time.
+"""
+from typing import Iterable, List, Optional, Tuple, Union
+
+from . import object_library
+from .object_library import PagingObject, SpotifyObject, UnionParser, \
+    _restore_page, get_union_parser
+from .projection import PartialDict, Tree, wrap_partial
+from .utilities import json_dumps, json_loads
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# The first byte of the payload tells the formats apart, so bytes written by
+# a process with msgpack can be read by one without it and vice versa, as
+# long as both formats are available where they are read.
+MSGPACK = b'm'
+JSON = b'j'
+
+Record = Tuple[str, Union[str, List[str], None], dict, Optional[Tree]]
+
+
+def _get_class(name: str) -> type:
+    """Return the object_library class of the name.
+
+    Raises:
+        ValueError: If the name is not an object_library class.
+    """
+    cls = getattr(object_library, name, None)
+    if not isinstance(cls, type) or not issubclass(cls, SpotifyObject):
+        raise ValueError(f'{name!r} is not an object_library class.')
+    return cls
+
+
+def _encode_item_type(item_type) -> Union[str, List[str], None]:
+    """Return the class name of the items of a page, or the class names of
+    a Union."""
+    if item_type is None:
+        return None
+    if isinstance(item_type, UnionParser):
+        return [cls.__name__ for cls in item_type.classes]
+    return item_type.__name__
+
+
+def _decode_item_type(item_type: Union[str, List[str]]):
+    """Return the item type encoded by _encode_item_type."""
+    if isinstance(item_type, list):
+        return get_union_parser(*map(_get_class, item_type))
+    return _get_class(item_type)
+
+
+def encode_object(obj: SpotifyObject) -> Record:
+    """Return the class name, the item class name(s) of a page, the json of
+    the object and the requested fields tree if the object is partial."""
+    json_dict = obj._json_dict
+    return (obj.__class__.__name__,
+            _encode_item_type(getattr(obj, 'item_type', None)),
+            json_dict,
+            json_dict.tree if isinstance(json_dict, PartialDict) else None)
+
+
+def decode_object(record: Record) -> SpotifyObject:
+    """Rebuild the object of an encoded record around its json. A partial
+    object is partial again, raising NotProjectedError for the fields its
+    projection did not request.
+
+    Raises:
+        ValueError: If the record names an unknown class.
+    """
+    class_name, item_type, json_dict, tree = record
+    cls = _get_class(class_name)
+    json_dict = wrap_partial(json_dict, tree)
+    if issubclass(cls, PagingObject):
+        return _restore_page(cls, json_dict, _decode_item_type(item_type))
+    return cls(json_dict)
+
+
+def _pack(value) -> bytes:
+    """Encode the value with msgpack if it is installed, or as json."""
+    if msgpack is not None:
+        return MSGPACK + msgpack.packb(value, use_bin_type=True)
+    return JSON + json_dumps(value).encode('utf8')
+
+
+def _unpack(data: bytes):
+    """Decode a value encoded by _pack.
+
+    Raises:
+        ImportError: If the data was encoded with msgpack and it is not
+            installed.
+        ValueError: If the data was not encoded by _pack.
+    """
+    data = memoryview(data)
+    kind, body = bytes(data[:1]), data[1:]
+    if kind == MSGPACK:
+        if msgpack is None:
+            raise ImportError('msgpack is required to decode this data. '
+                              'Install it with '
+                              '"pip install spotifywrapper[msgpack]".')
+        return msgpack.unpackb(body, raw=False, use_list=True)
+    if kind == JSON:
+        return json_loads(bytes(body))
+    raise ValueError('The data was not encoded by spotifywrapper.')
+
+
+def dumps(obj: SpotifyObject) -> bytes:
+    """Serialize the object."""
+    return _pack(encode_object(obj))
+
+
+def loads(data: bytes) -> SpotifyObject:
+    """Rebuild an object serialized by dumps.
+
+    Raises:
+        ValueError: If the data is not a serialized object.
+    """
+    return decode_object(_unpack(data))
+
+
+def dumps_many(objects: Iterable[SpotifyObject]) -> bytes:
+    """Serialize the objects into one payload, e.g. a batch of tracks sent to
+    a worker process."""
+    return _pack([encode_object(obj) for obj in objects])
+
+
+def loads_many(data: bytes) -> List[SpotifyObject]:
+    """Rebuild the objects serialized by dumps_many.
+
+    Raises:
+        ValueError: If the data is not a serialized list of objects.
+    """
+    return [decode_object(record) for record in _unpack(data)]
@@ -0,0 +1,191 @@
+"""
+Parse large responses incrementally from the socket instead of reading the
+whole body first. Requires the optional ijson dependency.
+"""
+from contextlib import closing
+from typing import Iterator, Optional, Tuple
+
+from .object_library import AudioAnalysisObject, ErrorObject, PagingObject, \
+    SpotifyObject
+from .utilities import SpotifyAPIError
+
+try:
+    import ijson
+    from ijson.common import ObjectBuilder
+except ImportError:
+    ijson = None
+
+# The json handed to a method while its request is recorded. The items come
+# first so the methods returning lists also get an empty one.
+_EMPTY_PAGE = {'items': [], 'href': None, 'limit': 0, 'next': None,
+               'offset': 0, 'previous': None, 'total': 0}
+
+# The keys which start a paging object. Any other first key is the name of
+# the object wrapping the page, e.g. 'albums' for get_new_releases.
+_PAGING_KEYS = set(_EMPTY_PAGE)
+
+
+def require_ijson() -> None:
+    """Make sure ijson is installed.
+
+    Raises:
+        ImportError: If ijson is not installed.
+    """
+    if ijson is None:
+        raise ImportError('ijson is required for streaming responses. '
+                          'Install it with '
+                          '"pip install spotifywrapper[streaming]".')
+
+
+class RequestRecorder:
+    """Stand-in for a SpotifyAPI instance which records the request an
+    endpoint method would send instead of sending it.
+
+    The generated methods build the url and the parameters, so calling one
+    with a recorder in place of self gives the request to stream along with
+    the type of object the method wraps the response in.
+
+    Args:
+        sp: The SpotifyAPI instance whose scopes and helpers are used.
+    """
+    entity_cache = None
+
+    def __init__(self, sp):
+        self._sp = sp
+        self.request: Optional[Tuple[str, str, dict]] = None
+
+    def __getattr__(self, name):
+        return getattr(self._sp, name)
+
+    def _request(self, http_method: str, url: str, query_params: dict,
+                 json_body: dict) -> Tuple[dict, bool]:
+        self.request = (http_method, url,
+                        self._sp._convert_query_params(query_params))
+        return dict(_EMPTY_PAGE), False
+
+    def _get(self, url, query_params, json_body) -> Tuple[dict, bool]:
+        return self._request('GET', url, query_params, json_body)
+
+
+def record_request(sp, method_name: str, *args,
+                   **kwargs) -> Tuple[Tuple[str, str, dict], object]:
+    """Return the request the method sends and the (empty) object it
+    returns.
+
+    Raises:
+        ValueError: If the method does not send a GET request.
+    """
+    recorder = RequestRecorder(sp)
+    result = getattr(type(sp), method_name)(recorder, *args, **kwargs)
+    if recorder.request is None:
+        raise ValueError(f'{method_name!r} can not be streamed.')
+    return recorder.request, result
+
+
+def _open_stream(sp, url: str, params: Optional[dict] = None):
+    """Send the GET request through the client's scheduler and transport
+    without reading the body.
+
+    Raises:
+        SpotifyAPIError: If the request fails.
+    """
+    response = sp.scheduler.send(
+        lambda: sp.transport.request('GET', url, params=params or None,
+                                     headers=sp.headers, stream=True))
+    if response.status_code != 200:
+        with closing(response):
+            json_dict, _ = sp._decode_response('GET', response)
+        raise SpotifyAPIError(ErrorObject(json_dict))
+    response.raw.decode_content = True
+    return response
+
+
+def iter_page_items(stream) -> Iterator[Tuple[str, object]]:
+    """Parse a paging object incrementally and yield ('item', json) for each
+    item as soon as it has been read, and ('next', url) once the url of the
+    next page has been read. Pages wrapped in an object, e.g.
+    {'albums': {...}}, are unwrapped."""
+    item_prefix = next_prefix = None
+    builder = None
+    for prefix, event, value in ijson.parse(stream, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == item_prefix and event in ('end_map', 'end_array'):
+                yield 'item', builder.value
+                builder = None
+        elif item_prefix is None:
+            if prefix == '' and event == 'map_key':
+                base = '' if value in _PAGING_KEYS else f'{value}.'
+                item_prefix = f'{base}items.item'
+                next_prefix = f'{base}next'
+        elif prefix == item_prefix:
+            if event in ('start_map', 'start_array'):
+                builder = ObjectBuilder()
+                builder.event(event, value)
+            else:
+                yield 'item', value
+        elif prefix == next_prefix:
+            yield 'next', value
+
+
+def stream_items(sp, method_name: str, *args, follow_next: bool = True,
+                 **kwargs) -> Iterator[SpotifyObject]:
+    """Yield the items of a paging method one at a time while the response
+    is still arriving, without holding the body or the whole page in
+    memory.
+
+    Args:
+        sp: The SpotifyAPI instance to send the requests through.
+        method_name: The name of a method returning a PagingObject, e.g.
+            'get_a_playlists_items'.
+        *args: The arguments of the method.
+        follow_next: Whether to stream the following pages too.
+        **kwargs: The keyword arguments of the method.
+
+    Raises:
+        ImportError: If ijson is not installed.
+        SpotifyAPIError: If one of the requests fails.
+        TypeError: If the method does not return a PagingObject.
+    """
+    require_ijson()
+    (_, url, params), page = record_request(sp, method_name, *args,
+                                            **kwargs)
+    if not isinstance(page, PagingObject):
+        raise TypeError(f'{method_name!r} does not return a PagingObject.')
+    while url:
+        next_url = None
+        with closing(_open_stream(sp, url, params)) as response:
+            for kind, value in iter_page_items(response.raw):
+                if kind == 'next':
+                    next_url = value
+                elif value is None:
+                    yield None
+                else:
+                    yield page.item_type(value)
+        url, params = (next_url if follow_next else None), None
+
+
+def stream_object(sp, method_name: str, *args, **kwargs) -> SpotifyObject:
+    """Request the object returned by the method and decode it directly
+    from the socket, so the raw body is never held in memory next to the
+    decoded json.
+
+    Raises:
+        ImportError: If ijson is not installed.
+        SpotifyAPIError: If the request fails.
+        TypeError: If the method does not return a single object.
+    """
+    require_ijson()
+    (_, url, params), result = record_request(sp, method_name, *args,
+                                              **kwargs)
+    if not isinstance(result, SpotifyObject) or isinstance(result,
+                                                           PagingObject):
+        raise TypeError(f'{method_name!r} does not return a single object.')
+    with closing(_open_stream(sp, url, params)) as response:
+        json_dict = next(ijson.items(response.raw, '', use_float=True))
+    return type(result)(json_dict)
+
+
+def stream_audio_analysis(sp, id_: str) -> AudioAnalysisObject:
+    """Stream the audio analysis of the track. See stream_object."""
+    return stream_object(sp, 'get_audio_analysis_for_a_track', id_)
@@ -0,0 +1,89 @@
+"""
+Pooled HTTP transport used by SpotifyAPI to send requests to the Web API.
+"""
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class HTTPTransport:
+    """HTTP transport that keeps a single requests.Session alive so every
+    request to api.spotify.com reuses pooled keep-alive connections instead
+    of doing a new TCP and TLS handshake.
+
+    Any object with a compatible request method can be handed to SpotifyAPI
+    in place of this class. Only failed connections are retried here; 429
+    and 5xx responses are retried by the client's RequestScheduler.
+
+    Args:
+        pool_connections: The number of host connection pools to cache.
+        pool_maxsize: The maximum number of connections kept alive in each
+            pool. Raise this when sharing the client across many threads.
+        max_retries: The number of times a failed connection is retried
+            before giving up.
+        backoff_factor: The backoff factor (in seconds) applied between
+            retries.
+        timeout: The number of seconds to wait for the server before giving
+            up on a request. None waits forever.
+    """
+
+    def __init__(self,
+                 pool_connections: int = 4,
+                 pool_maxsize: int = 16,
+                 max_retries: int = 3,
+                 backoff_factor: float = 0.5,
+                 timeout: Optional[float] = 10.0):
+        self.timeout = timeout
+        retries = Retry(total=max_retries,
+                        backoff_factor=backoff_factor,
+                        status=0,
+                        raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=pool_connections,
+                              pool_maxsize=pool_maxsize,
+                              max_retries=retries)
+        self._session = requests.Session()
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def session(self) -> requests.Session:
+        """Return the underlying keep-alive session."""
+        return self._session
+
+    def request(self,
+                http_method: str,
+                url: str,
+                params: Optional[dict] = None,
+                json_body: Optional[dict] = None,
+                headers: Optional[dict] = None,
+                stream: bool = False) -> requests.Response:
+        """Send a request over the pooled session.
+
+        Args:
+            http_method: The HTTP method, e.g. 'GET' or 'PUT'.
+            url: The url of the endpoint.
+            params: Optional; The query parameters of the request.
+            json_body: Optional; The json body of the request.
+            headers: Optional; The headers of the request.
+            stream: Whether to return as soon as the headers arrive and
+                leave the body to be read from response.raw.
+        """
+        return self._session.request(http_method,
+                                     url,
+                                     params=params,
+                                     json=json_body,
+                                     headers=headers,
+                                     stream=stream,
+                                     timeout=self.timeout)
+
+    def close(self) -> None:
+        """Close the session and every pooled connection."""
+        self._session.close()
@@ -1,9 +1,33 @@
-﻿import json
-import pickle
-from typing import Callable, List, Tuple
+﻿from hashlib import md5
+import inspect
+import json
+import threading
+from typing import Any, Callable, List, Optional, Sequence, Tuple, \
+    TypeVar, Union
 from dataclasses import dataclass
 from functools import wraps
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+T = TypeVar('T')
+
+
+class SpotifyAPIError(Exception):
+    """Raised by the higher level helpers of SpotifyAPI, which cannot
+    return an ErrorObject in place of their result, when an API call
+    fails.
+
+    Args:
+        error: The ErrorObject returned by the failed API call.
+    """
+
+    def __init__(self, error):
+        super().__init__(str(error))
+        self.error = error
+
 
 def requires(*scopes: str) -> Callable:
     """
@@ -15,51 +39,206 @@ def requires(*scopes: str) -> Callable:
     """
 
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def inner(self, *args, **kwargs):
+        def check_scopes(self):
             if any(scope not in self.scopes for scope in scopes):
                 raise PermissionError(
                     f'{func.__name__} requires the {scopes!r} '
                     'scope. You must have this scope authorized '
                     'to make this API call.')
-            else:
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_inner(self, *args, **kwargs):
+                check_scopes(self)
+                return await func(self, *args, **kwargs)
+
+            return async_inner
+
+        @wraps(func)
+        def inner(self, *args, **kwargs):
+            check_scopes(self)
+            return func(self, *args, **kwargs)
+
+        return inner
+
+    return decorator
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Decode json straight from the response bytes (or a string). Uses
+    orjson when it is installed and the standard library otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(value: Any) -> str:
+    """Encode the value as a json string. Uses orjson when it is
+    installed and the standard library otherwise."""
+    if orjson is not None:
+        return orjson.dumps(value).decode('utf8')
+    return json.dumps(value)
+
+
+def hash_request(url: str, query_params: dict,
+                 json_body: Optional[dict] = None) -> str:
+    """Hash the normalized request so identical requests share one key. The
+    keys match the file names of the mock data built by test_tools."""
+    query_params = json.dumps(query_params, sort_keys=True)
+    json_body = json.dumps(json_body or {}, sort_keys=True)
+    request = url + query_params + json_body
+    return md5(request.encode('utf8')).hexdigest()
+
+
+def cache_entity(entity_type: str) -> Callable:
+    """
+    Adds a lookup in the client's entity cache to single-item getters such
+    as get_an_album. Cached objects are returned without a request and
+    newly requested objects are cached. Does nothing if the client has no
+    entity cache.
+
+    Args:
+        entity_type: The type the objects are cached under, e.g. 'album'.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        def lookup(self, args, kwargs):
+            arguments = signature.bind(self, *args, **kwargs).arguments
+            id_, market = arguments['id_'], arguments.get('market')
+            return id_, market, self.entity_cache.get(entity_type, id_,
+                                                      market)
+
+        def store(self, id_, market, entity):
+            from .object_library import ErrorObject
+            if entity is not None and not isinstance(entity, ErrorObject):
+                self.entity_cache.put(entity_type, id_, entity, market)
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_inner(self, *args, **kwargs):
+                if self.entity_cache is None:
+                    return await func(self, *args, **kwargs)
+                id_, market, entity = lookup(self, args, kwargs)
+                if entity is None:
+                    entity = await func(self, *args, **kwargs)
+                    store(self, id_, market, entity)
+                return entity
+
+            return async_inner
+
+        @wraps(func)
+        def inner(self, *args, **kwargs):
+            if self.entity_cache is None:
                 return func(self, *args, **kwargs)
+            id_, market, entity = lookup(self, args, kwargs)
+            if entity is None:
+                entity = func(self, *args, **kwargs)
+                store(self, id_, market, entity)
+            return entity
 
         return inner
 
     return decorator
 
 
-# TODO: It caches result across all instances.
-def cached_static_property(method):
-    cached_result = None
+def cache_entities(entity_type: str) -> Callable:
+    """
+    Adds lookups in the client's entity cache to bulk getters such as
+    get_multiple_albums. Only the ids missing from the cache are requested
+    and the result is merged back into the order of the ids. Does nothing
+    if the client has no entity cache.
 
-    @wraps(method)
-    def inner(self):
-        nonlocal cached_result
-        if cached_result is None:
-            cached_result = method(self)
-        return cached_result
+    Args:
+        entity_type: The type the objects are cached under, e.g. 'album'.
+    """
 
-    return property(inner)
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        def lookup(self, args, kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            ids, market = bound.arguments['ids'], bound.arguments.get('market')
+            cached = {id_: self.entity_cache.get(entity_type, id_, market)
+                      for id_ in dict.fromkeys(ids)}
+            missing = [id_ for id_, entity in cached.items() if entity is None]
+            # The missing ids are requested with the caller's other
+            # arguments, e.g. market, on getters which take them.
+            bound.arguments['ids'] = missing
+            return ids, market, cached, missing, bound
+
+        def merge(self, ids, market, cached, missing, result):
+            if not isinstance(result, list):
+                return result
+            for id_, entity in zip(missing, result):
+                if entity is not None:
+                    self.entity_cache.put(entity_type, id_, entity, market)
+                cached[id_] = entity
+            return [cached[id_] for id_ in ids]
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_inner(self, *args, **kwargs):
+                if self.entity_cache is None:
+                    return await func(self, *args, **kwargs)
+                ids, market, cached, missing, bound = lookup(self, args,
+                                                             kwargs)
+                result = (await func(*bound.args, **bound.kwargs)
+                          if missing else [])
+                return merge(self, ids, market, cached, missing, result)
+
+            return async_inner
+
+        @wraps(func)
+        def inner(self, *args, **kwargs):
+            if self.entity_cache is None:
+                return func(self, *args, **kwargs)
+            ids, market, cached, missing, bound = lookup(self, args, kwargs)
+            result = func(*bound.args, **bound.kwargs) if missing else []
+            return merge(self, ids, market, cached, missing, result)
+
+        return inner
+
+    return decorator
+
+
+def chunked(items: Sequence[T], size: int) -> List[Sequence[T]]:
+    """Split the items into consecutive chunks of at most size items."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
 
-def cache_get_locally(method):
-    """Cache the results in a local method."""
+
+_MEMO_LOCK = threading.Lock()
+_MISSING = object()
+
+
+def memoized_property(method: Callable) -> property:
+    """
+    A property which wraps its value once per instance and then returns the
+    same object on every access. The values are kept in the instance's _memo
+    dictionary, which is only created once the first value is memoized.
+
+    Thread-safe: threads racing on the first access may each compute the
+    value, but dict.setdefault makes all of them return the one stored.
+    """
+    name = method.__name__
 
     @wraps(method)
-    def inner(url, query_params, json_body):
-        response, error = method(url, query_params, json_body)
-        query_params = json.dumps(query_params, sort_keys=True)
-        json_body = json.dumps(json_body, sort_keys=True)
-        print(url)
-        print(type(query_params))
-        print(type(json_body))
-        data = {(url, query_params, json_body): (response, error)}
-        with open('cache.txt', 'wb') as file:
-            pickle.dump(data, file)
-        return response, error
-    return inner
+    def inner(self):
+        try:
+            memo = self._memo
+        except AttributeError:
+            with _MEMO_LOCK:
+                try:
+                    memo = self._memo
+                except AttributeError:
+                    memo = self._memo = {}
+        value = memo.get(name, _MISSING)
+        if value is _MISSING:
+            value = memo.setdefault(name, method(self))
+        return value
 
+    return property(inner)
 
 
 @dataclass
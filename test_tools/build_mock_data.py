@@ -1,11 +1,11 @@
 ﻿"""Playground for testing the API"""
 import argparse
 from argparse import Namespace
-from hashlib import md5
 import json
 from pathlib import Path
 
 from spotifywrapper.api import SpotifyAPI
+from spotifywrapper.utilities import hash_request
 
 
 def get_args() -> Namespace:
@@ -32,10 +32,7 @@ class MockResponse:
 
 def hash_args(url, query_params, json_body):
     """Hash the tuple of args"""
-    query_params = json.dumps(query_params, sort_keys=True)
-    json_body = json.dumps(json_body, sort_keys=True)
-    request = url + query_params + json_body
-    return md5(request.encode('utf8')).hexdigest()
+    return hash_request(url, query_params, json_body)
 
 
 def cache_get_data(method, directory):
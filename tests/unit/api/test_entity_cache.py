@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from spotifywrapper.cache import EntityCache
+from tests.unit.fakes import FakeResponse
+
+# The bulk getters of each argument shape, the key of their response and
+# the keyword arguments they are called with.
+BULK_GETTERS = [
+    ('get_multiple_albums', 'albums', {'market': 'US'}),
+    ('get_multiple_artists', 'artists', {}),
+    ('get_audio_features_for_several_tracks', 'audio_features', {}),
+]
+
+
+def handle_bulk(key):
+    def handler(http_method, url, params, json_body):
+        return FakeResponse(200, {key: [{'id': id_, 'type': 'x'}
+                                        for id_ in params['ids'].split(',')]})
+
+    return handler
+
+
+@pytest.mark.parametrize('method_name, key, kwargs', BULK_GETTERS)
+def test_bulk_getter_requests_only_missing_ids(make_client, method_name, key,
+                                               kwargs):
+    sp, transport = make_client(handle_bulk(key), entity_cache=EntityCache())
+    method = getattr(sp, method_name)
+
+    first = method(['a', 'b'], **kwargs)
+    second = method(['b', 'c', 'a'], **kwargs)
+
+    assert [obj.id for obj in first] == ['a', 'b']
+    assert [obj.id for obj in second] == ['b', 'c', 'a']
+    assert [params['ids'] for _, _, params, _ in transport.requests] == \
+        ['a,b', 'c']
+    assert all(params.get('market') == kwargs.get('market')
+               for _, _, params, _ in transport.requests)
+
+
+@pytest.mark.parametrize('method_name, key, kwargs', BULK_GETTERS)
+def test_async_bulk_getter_requests_only_missing_ids(make_async_client,
+                                                     method_name, key,
+                                                     kwargs):
+    sp, requests = make_async_client(handle_bulk(key),
+                                     entity_cache=EntityCache())
+    method = getattr(sp, method_name)
+
+    async def run():
+        await method(['a', 'b'], **kwargs)
+        return await method(['b', 'c', 'a'], **kwargs)
+
+    second = asyncio.run(run())
+
+    assert [obj.id for obj in second] == ['b', 'c', 'a']
+    assert [params['ids'] for _, _, params, _ in requests] == ['a,b', 'c']
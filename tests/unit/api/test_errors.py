@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from spotifywrapper.object_library import ErrorObject
+from spotifywrapper.scheduler import RequestScheduler
+from tests.unit.fakes import FakeResponse
+
+ERROR_RESPONSES = [
+    (FakeResponse(503), 503, 'The server responded with status 503.'),
+    (FakeResponse(502, b'<html>Bad Gateway</html>'), 502,
+     'The server responded with status 502.'),
+    (FakeResponse(404, {'error': {'status': 404, 'message': 'Not found'}}),
+     404, 'Not found'),
+    (FakeResponse(400, {'error': 'invalid_grant',
+                        'error_description': 'Invalid refresh token'}),
+     400, 'Invalid refresh token'),
+]
+
+
+def answer(response):
+    return lambda http_method, url, params, json_body: response
+
+
+@pytest.mark.parametrize('response, status, message', ERROR_RESPONSES)
+def test_error_status_returns_error_object(make_client, response, status,
+                                           message):
+    sp, _ = make_client(answer(response),
+                        scheduler=RequestScheduler(max_retries=0))
+
+    saved = sp.save_tracks_for_users(['a'])
+    added = sp.add_items_to_a_playlist('p', uris=['spotify:track:a'])
+
+    for result in (saved, added):
+        assert isinstance(result, ErrorObject)
+        assert result.status == status
+        assert result.message == message
+
+
+@pytest.mark.parametrize('response, status, message', ERROR_RESPONSES)
+def test_async_error_status_returns_error_object(make_async_client, response,
+                                                 status, message):
+    sp, _ = make_async_client(answer(response),
+                              scheduler=RequestScheduler(max_retries=0))
+
+    result = asyncio.run(sp.save_tracks_for_users(['a']))
+
+    assert isinstance(result, ErrorObject)
+    assert (result.status, result.message) == (status, message)
+
+
+def test_success_with_a_body_which_is_not_json(make_client):
+    sp, _ = make_client(answer(FakeResponse(200, b'<html></html>')))
+
+    assert isinstance(sp.get_a_track('a'), ErrorObject)
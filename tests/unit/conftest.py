@@ -0,0 +1,55 @@
+"""
+Clients whose requests are answered by a handler instead of the Web API.
+"""
+import json
+from unittest import mock
+
+import httpx
+import pytest
+
+from spotifywrapper import api, async_api
+from tests.unit.fakes import FakeTransport
+
+SCOPES = ('user-library-read user-library-modify playlist-read-private '
+          'playlist-modify-public playlist-modify-private')
+CREDENTIALS = {'access_token': 'token', 'scope': SCOPES}
+
+
+@pytest.fixture
+def make_client():
+    """Return a function creating a SpotifyAPI and its FakeTransport."""
+
+    def make(handler, **kwargs):
+        transport = FakeTransport(handler)
+        with mock.patch.object(api, 'PKCE') as pkce:
+            pkce.return_value.get_credentials.return_value = CREDENTIALS
+            return api.SpotifyAPI(transport=transport, **kwargs), transport
+
+    return make
+
+
+@pytest.fixture
+def make_async_client():
+    """Return a function creating an AsyncSpotifyAPI and the list of its
+    requests. The handler takes the same arguments as for make_client."""
+
+    def make(handler, **kwargs):
+        requests = []
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            params = dict(request.url.params)
+            body = json.loads(request.content) if request.content else None
+            url = str(request.url.copy_with(query=None))
+            requests.append((request.method, url, params, body))
+            response = handler(request.method, url, params, body)
+            return httpx.Response(response.status_code,
+                                  content=response.content,
+                                  headers=response.headers)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(respond))
+        with mock.patch.object(async_api, 'PKCE') as pkce:
+            pkce.return_value.get_credentials.return_value = CREDENTIALS
+            return async_api.AsyncSpotifyAPI(client=client, **kwargs), \
+                requests
+
+    return make
@@ -0,0 +1,215 @@
+"""
+Fake responses and transports answering the requests of the clients.
+"""
+import json
+from urllib.parse import parse_qsl, urlsplit
+
+
+class FakeResponse:
+    """The parts of a requests.Response the client reads."""
+
+    def __init__(self, status_code: int, body=None, headers=None):
+        self.status_code = status_code
+        if isinstance(body, bytes):
+            self.content = body
+        else:
+            self.content = b'' if body is None else json.dumps(body).encode()
+        self.headers = headers or {}
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeTransport:
+    """Answers every request with handler(method, url, params, json_body)
+    and keeps the requests and their headers."""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+        self.headers = []
+
+    def request(self, http_method, url, params=None, json_body=None,
+                headers=None, **kwargs):
+        self.requests.append((http_method, url, params or {}, json_body))
+        self.headers.append(headers or {})
+        return self.handler(http_method, url, params or {}, json_body)
+
+    def close(self):
+        pass
+
+
+def parse_fields(fields: str) -> dict:
+    """Parse a fields filter such as 'name,tracks(items(track(id)))' into a
+    tree whose leaves are None."""
+    tree, stack, name = {}, [], ''
+    node = tree
+    for char in fields + ',':
+        if char == '(':
+            child = node[name] = {}
+            stack.append(node)
+            node, name = child, ''
+        elif char in ',)':
+            if name:
+                node[name] = None
+            name = ''
+            if char == ')':
+                node = stack.pop()
+        else:
+            name += char
+    return tree
+
+
+def filter_fields(value, tree):
+    """Keep only the fields of the tree in the value, like the fields
+    filter of the Web API."""
+    if tree is None:
+        return value
+    if isinstance(value, list):
+        return [filter_fields(item, tree) for item in value]
+    if isinstance(value, dict):
+        return {key: filter_fields(value[key], subtree)
+                for key, subtree in tree.items() if key in value}
+    return value
+
+
+class FakePlaylist:
+    """A playlist applying the writes of the playlist endpoints like the
+    Web API, with a new snapshot id after every write. A write sent
+    against another snapshot than the latest one fails with 409, so the
+    tests catch writes which are not chained."""
+
+    def __init__(self, uris=()):
+        self.uris = list(uris)
+        self.version = 0
+        self.writes = []
+
+    @property
+    def snapshot_id(self) -> str:
+        return f'snapshot-{self.version}'
+
+    def __call__(self, http_method, url, params, json_body):
+        query = dict(parse_qsl(urlsplit(url).query), **params)
+        if http_method == 'GET':
+            return self._get(urlsplit(url).path, query)
+        snapshot_id = (json_body or {}).get('snapshot_id')
+        if snapshot_id is not None and snapshot_id != self.snapshot_id:
+            return FakeResponse(409, {'error': {
+                'status': 409, 'message': 'Outdated snapshot'}})
+        self.writes.append((http_method, json_body))
+        getattr(self, f'_{http_method.lower()}')(query, json_body)
+        self.version += 1
+        return FakeResponse(200, {'snapshot_id': self.snapshot_id})
+
+    def _get(self, path, query):
+        if not path.endswith('/tracks'):
+            return FakeResponse(200, {'snapshot_id': self.snapshot_id})
+        offset, limit = int(query.get('offset', 0)), int(query['limit'])
+        page = {'href': path, 'limit': limit, 'offset': offset,
+                'previous': None, 'total': len(self.uris), 'next': None,
+                'items': [{'track': {'uri': uri, 'type': 'track'}}
+                          for uri in self.uris[offset:offset + limit]]}
+        if offset + limit < len(self.uris):
+            page['next'] = (f'https://api.spotify.com{path}?'
+                            f'offset={offset + limit}&limit={limit}')
+        return FakeResponse(200, page)
+
+    def _post(self, query, json_body):
+        position = json_body.get('position', query.get('position'))
+        position = len(self.uris) if position is None else int(position)
+        self.uris[position:position] = json_body['uris']
+
+    def _put(self, query, json_body):
+        if 'uris' in json_body:
+            self.uris = list(json_body['uris'])
+            return
+        start, length = json_body['range_start'], json_body['range_length']
+        insert_before = json_body['insert_before']
+        block = self.uris[start:start + length]
+        del self.uris[start:start + length]
+        if insert_before > start:
+            insert_before -= length
+        self.uris[insert_before:insert_before] = block
+
+    def _delete(self, query, json_body):
+        positions = []
+        for track in json_body['tracks']:
+            if 'positions' in track:
+                for position in track['positions']:
+                    assert self.uris[position] == track['uri']
+                    positions.append(position)
+            else:
+                positions.extend(i for i, uri in enumerate(self.uris)
+                                 if uri == track['uri'])
+        for position in sorted(positions, reverse=True):
+            del self.uris[position]
+
+
+class FakeLibrary:
+    """The user's library, applying the writes of the library endpoints and
+    listing the saved items newest first like the Web API. Every save is
+    stamped with a later added_at. Writes fail with error_status if set."""
+
+    def __init__(self, **saved):
+        self.saved = {item_type: [] for item_type in
+                      ('tracks', 'albums', 'episodes', 'shows')}
+        self.clock = 0
+        self.writes = []
+        self.error_status = None
+        for item_type, ids in saved.items():
+            self.save(item_type, ids)
+
+    def save(self, item_type, ids):
+        """Save the ids not saved yet, as another device would."""
+        saved_ids = {id_ for id_, _ in self.saved[item_type]}
+        for id_ in ids:
+            if id_ not in saved_ids:
+                saved_ids.add(id_)
+                self.clock += 1
+                added_at = f'2024-01-01T00:{self.clock:05d}Z'
+                self.saved[item_type].insert(0, (id_, added_at))
+
+    def remove(self, item_type, ids):
+        """Remove the ids, as another device would."""
+        ids = set(ids)
+        self.saved[item_type] = [(id_, added_at) for id_, added_at
+                                 in self.saved[item_type] if id_ not in ids]
+
+    def ids(self, item_type):
+        return {id_ for id_, _ in self.saved[item_type]}
+
+    def __call__(self, http_method, url, params, json_body):
+        path = urlsplit(url).path.split('/')
+        query = dict(parse_qsl(urlsplit(url).query), **params)
+        item_type = path[3]
+        ids = query['ids'].split(',') if query.get('ids') else []
+        if http_method == 'GET' and path[-1] == 'contains':
+            saved = self.ids(item_type)
+            return FakeResponse(200, [id_ in saved for id_ in ids])
+        if http_method == 'GET':
+            return self._get(item_type, query)
+        self.writes.append((http_method, item_type, ids))
+        if self.error_status is not None:
+            return FakeResponse(self.error_status, {'error': {
+                'status': self.error_status, 'message': 'Write failed'}})
+        if http_method == 'PUT':
+            self.save(item_type, ids)
+        else:
+            self.remove(item_type, ids)
+        return FakeResponse(200)
+
+    def _get(self, item_type, query):
+        offset, limit = int(query.get('offset', 0)), int(query['limit'])
+        saved = self.saved[item_type]
+        path = f'/v1/me/{item_type}'
+        page = {'href': path, 'limit': limit, 'offset': offset,
+                'previous': None, 'total': len(saved), 'next': None,
+                'items': [{'added_at': added_at,
+                           item_type[:-1]: {'id': id_,
+                                            'type': item_type[:-1]}}
+                          for id_, added_at in saved[offset:offset + limit]]}
+        if offset + limit < len(saved):
+            page['next'] = (f'https://api.spotify.com{path}?'
+                            f'offset={offset + limit}&limit={limit}')
+        return FakeResponse(200, page)
@@ -0,0 +1,84 @@
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from spotifywrapper.adaptive import AdaptiveProjector
+from tests.unit.fakes import FakeResponse, filter_fields, parse_fields
+
+TRACKS_URL = 'https://api.spotify.com/v1/playlists/p/tracks'
+
+PLAYLIST = {
+    'name': 'Mix',
+    'description': 'Songs',
+    'tracks': {
+        'href': 'https://api.spotify.com/v1/playlists/p/tracks',
+        'items': [{'added_at': '2021-01-01T00:00:00Z',
+                   'track': {'id': '1', 'type': 'track', 'name': 'One'}},
+                  {'added_at': '2021-01-02T00:00:00Z',
+                   'track': {'id': '2', 'type': 'track', 'name': 'Two'}}],
+        'limit': 100, 'next': None, 'offset': 0, 'previous': None,
+        'total': 2,
+    },
+}
+
+
+def handle_playlist(http_method, url, params, json_body):
+    if 'fields' not in params:
+        return FakeResponse(200, PLAYLIST)
+    return FakeResponse(200, filter_fields(PLAYLIST,
+                                           parse_fields(params['fields'])))
+
+
+def read_playlist(playlist):
+    return playlist.name, [item.track.id for item in playlist.tracks]
+
+
+def test_projected_playlist_walks_its_tracks_after_warmup(make_client):
+    sp, transport = make_client(handle_playlist,
+                                projector=AdaptiveProjector(warmup=1))
+
+    warmup = read_playlist(sp.get_a_playlist('p'))
+    projected = read_playlist(sp.get_a_playlist('p'))
+
+    assert warmup == projected == ('Mix', ['1', '2'])
+    fields = transport.requests[1][2]['fields']
+    assert 'description' not in fields
+    assert 'total' in fields
+    assert len(transport.requests) == 2
+
+
+ITEMS = [{'added_at': '2021-01-01T00:00:00Z',
+          'track': {'id': str(i), 'type': 'track', 'name': f'Song {i}'}}
+         for i in range(7)]
+
+
+def handle_items(http_method, url, params, json_body):
+    query = dict(parse_qsl(urlsplit(url).query), **params)
+    offset, limit = int(query.get('offset', 0)), int(query['limit'])
+    page = {'href': url, 'items': ITEMS[offset:offset + limit],
+            'limit': limit, 'offset': offset, 'previous': None,
+            'total': len(ITEMS), 'next': None}
+    if offset + limit < len(ITEMS):
+        next_query = {'offset': offset + limit, 'limit': limit}
+        if 'fields' in query:
+            next_query['fields'] = query['fields']
+        page['next'] = f'{TRACKS_URL}?{urlencode(next_query)}'
+    if 'fields' in query:
+        page = filter_fields(page, parse_fields(query['fields']))
+    return FakeResponse(200, page)
+
+
+def test_followed_pages_keep_the_filter_of_their_url(make_client):
+    sp, transport = make_client(handle_items,
+                                projector=AdaptiveProjector(warmup=1))
+
+    ids = [item.track.id
+           for item in sp.iter_items('get_a_playlists_items', 'p', limit=3)]
+    projected = [item.track.id for item in
+                 sp.iter_items('get_a_playlists_items', 'p', limit=3)]
+    names = [item.track.name for item in
+             sp.iter_items('get_a_playlists_items', 'p', limit=3)]
+
+    assert ids == projected == [str(i) for i in range(7)]
+    assert names == [f'Song {i}' for i in range(7)]
+    for _, url, params, _ in transport.requests:
+        url_fields = dict(parse_qsl(urlsplit(url).query)).get('fields')
+        assert url_fields is None or 'fields' not in params
@@ -0,0 +1,113 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+import pytest
+
+from spotifywrapper.object_library import ErrorObject
+from tests.unit.fakes import FakeResponse
+
+IDS = [f'track{i}' for i in range(120)]
+
+
+def handle_tracks(http_method, url, params, json_body):
+    """Answer get_several_tracks, the first chunks last, with None for the
+    unknown ids and 404 for a chunk holding 'missing'."""
+    ids = params['ids'].split(',')
+    time.sleep(0.02 if ids[0] == IDS[0] else 0)
+    if 'missing' in ids:
+        return FakeResponse(404, {'error': {'status': 404,
+                                            'message': 'Not found'}})
+    return FakeResponse(200, {'tracks': [
+        None if id_ == 'unknown' else {'id': id_, 'type': 'track'}
+        for id_ in ids]})
+
+
+def test_ids_are_split_into_chunks_and_merged_in_order(make_client):
+    sp, transport = make_client(handle_tracks)
+    ids = IDS[:60] + ['unknown'] + IDS[60:]
+
+    tracks = sp.get_in_batches('get_several_tracks', ids)
+
+    assert [track and track.id for track in tracks] == \
+        IDS[:60] + [None] + IDS[60:]
+    assert sorted(len(params['ids'].split(','))
+                  for _, _, params, _ in transport.requests) == [21, 50, 50]
+
+
+def test_failed_chunk_fills_its_ids_with_none(make_client):
+    sp, _ = make_client(handle_tracks)
+    ids = IDS[:50] + ['missing'] + IDS[50:60]
+
+    tracks = sp.get_in_batches('get_several_tracks', ids)
+
+    assert [track and track.id for track in tracks] == \
+        IDS[:50] + [None] * 11
+
+
+def test_async_ids_are_merged_in_order(make_async_client):
+    sp, requests = make_async_client(handle_tracks)
+
+    tracks = asyncio.run(sp.get_in_batches('get_several_tracks', IDS,
+                                           max_concurrency=2))
+
+    assert [track.id for track in tracks] == IDS
+    assert len(requests) == 3
+
+
+def test_not_a_bulk_method(make_client):
+    sp, _ = make_client(handle_tracks)
+
+    with pytest.raises(ValueError):
+        sp.get_in_batches('get_a_track', IDS)
+
+
+def test_concurrent_gets_are_merged_into_bulk_requests(make_client):
+    sp, transport = make_client(handle_tracks)
+    batcher = sp.item_batcher('get_a_track', max_delay=0.2)
+
+    with ThreadPoolExecutor(60) as executor:
+        tracks = list(executor.map(batcher.get, IDS[:60]))
+
+    assert [track.id for track in tracks] == IDS[:60]
+    assert sorted(len(params['ids'].split(','))
+                  for _, _, params, _ in transport.requests) == [10, 50]
+
+
+def test_failed_batch_returns_its_error(make_client):
+    sp, _ = make_client(handle_tracks)
+    batcher = sp.item_batcher('get_a_track')
+
+    futures = [batcher.submit(id_) for id_ in ('track0', 'missing')]
+    batcher.flush()
+
+    assert all(isinstance(future.result(), ErrorObject)
+               for future in futures)
+
+
+def test_raised_exception_reaches_every_caller(make_client):
+    def fail(*_):
+        raise RuntimeError('boom')
+
+    sp, _ = make_client(fail)
+    batcher = sp.item_batcher('get_a_track')
+
+    futures = [batcher.submit(id_) for id_ in IDS[:3]]
+    batcher.flush()
+
+    for future in futures:
+        with pytest.raises(RuntimeError):
+            future.result()
+
+
+def test_async_concurrent_gets_are_merged(make_async_client):
+    sp, requests = make_async_client(handle_tracks)
+
+    async def get_all():
+        batcher = sp.item_batcher('get_a_track', max_delay=0.01)
+        return await asyncio.gather(*map(batcher.get, IDS[:60]))
+
+    tracks = asyncio.run(get_all())
+
+    assert [track.id for track in tracks] == IDS[:60]
+    assert len(requests) == 2
@@ -0,0 +1,131 @@
+from unittest import mock
+
+import pytest
+
+from spotifywrapper.cache import ResponseCache
+from tests.unit.fakes import FakeResponse
+
+
+@pytest.fixture
+def clock():
+    """Patch the clock of the cache, returning a list holding the time."""
+    now = [1000.0]
+    with mock.patch('spotifywrapper.cache.time') as time:
+        time.time.side_effect = lambda: now[0]
+        yield now
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResponseCache(str(tmp_path / 'cache.sqlite'),
+                          ttls={'albums': 60})
+    yield cache
+    cache.close()
+
+
+class Server:
+    """Answers with a versioned body and its ETag, or 304 when the
+    request's If-None-Match is the current ETag."""
+
+    def __init__(self):
+        self.version = 0
+        self.transport = None
+
+    def __call__(self, http_method, url, params, json_body):
+        etag = f'"v{self.version}"'
+        if self.transport.headers[-1].get('If-None-Match') == etag:
+            return FakeResponse(304)
+        return FakeResponse(200, {'id': f'v{self.version}', 'type': 'album'},
+                            {'ETag': etag})
+
+
+def make_cached_client(make_client, cache):
+    server = Server()
+    sp, server.transport = make_client(server, cache=cache)
+    return sp, server.transport, server
+
+
+def test_fresh_entry_is_answered_without_a_request(make_client, cache,
+                                                   clock):
+    sp, transport, server = make_cached_client(make_client, cache)
+
+    assert sp.get_an_album('a').id == 'v0'
+    server.version = 1
+    clock[0] += 59
+    assert sp.get_an_album('a').id == 'v0'
+    assert len(transport.requests) == 1
+
+
+def test_expired_entry_is_revalidated_with_its_etag(make_client, cache,
+                                                    clock):
+    sp, transport, server = make_cached_client(make_client, cache)
+    sp.get_an_album('a')
+
+    clock[0] += 61
+    assert sp.get_an_album('a').id == 'v0'
+    assert transport.headers[-1]['If-None-Match'] == '"v0"'
+    assert sp.get_an_album('a').id == 'v0'
+    assert len(transport.requests) == 2
+
+
+def test_changed_entry_is_replaced(make_client, cache, clock):
+    sp, transport, server = make_cached_client(make_client, cache)
+    sp.get_an_album('a')
+    server.version = 1
+
+    clock[0] += 61
+    assert sp.get_an_album('a').id == 'v1'
+    assert sp.get_an_album('a').id == 'v1'
+    assert len(transport.requests) == 2
+
+
+def test_entry_without_etag_expires(make_client, cache, clock):
+    sp, transport = make_client(
+        lambda *_: FakeResponse(200, {'id': 'a', 'type': 'album'}),
+        cache=cache)
+    sp.get_an_album('a')
+
+    clock[0] += 61
+    sp.get_an_album('a')
+    assert len(transport.requests) == 2
+    assert 'If-None-Match' not in transport.headers[-1]
+
+
+def test_endpoint_without_ttl_is_only_stored_with_an_etag(cache, clock):
+    key, _ = cache.lookup('https://api.spotify.com/v1/me', {})
+
+    cache.store(key, 'https://api.spotify.com/v1/me', b'{}')
+    assert cache.lookup('https://api.spotify.com/v1/me', {})[1] is None
+
+    cache.store(key, 'https://api.spotify.com/v1/me', b'{}', '"e"')
+    _, entry = cache.lookup('https://api.spotify.com/v1/me', {})
+    assert entry.etag == '"e"' and not entry.fresh
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, clock):
+    cache = ResponseCache(str(tmp_path / 'cache.sqlite'), max_size=20)
+    urls = [f'https://api.spotify.com/v1/albums/{i}' for i in range(3)]
+    for url in urls[:2]:
+        clock[0] += 1
+        cache.store(cache.lookup(url, {})[0], url, b'x' * 10)
+    clock[0] += 1
+    cache.lookup(urls[0], {})
+
+    clock[0] += 1
+    cache.store(cache.lookup(urls[2], {})[0], urls[2], b'x' * 10)
+
+    assert [cache.lookup(url, {})[1] is not None for url in urls] == \
+        [True, False, True]
+    assert cache.size == 20
+    cache.close()
+
+
+def test_errors_are_not_stored(make_client, cache, clock):
+    sp, transport = make_client(lambda *_: FakeResponse(404, {'error': {
+        'status': 404, 'message': 'Not found'}}), cache=cache)
+
+    sp.get_an_album('a')
+    sp.get_an_album('a')
+
+    assert len(transport.requests) == 2
+    assert len(cache) == 0
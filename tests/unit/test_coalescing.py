@@ -0,0 +1,105 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+import pytest
+from requests.exceptions import ConnectionError
+
+from spotifywrapper.coalescing import SingleFlight
+from spotifywrapper.object_library import ErrorObject
+from tests.unit.fakes import FakeResponse
+
+CALLERS = 8
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def test_concurrent_gets_share_one_request(make_client):
+    def handler(http_method, url, params, json_body):
+        wait_for(lambda: sp.single_flight.coalesced == CALLERS - 1)
+        return FakeResponse(200, {'id': 'a', 'type': 'track'})
+
+    sp, transport = make_client(handler)
+
+    with ThreadPoolExecutor(CALLERS) as executor:
+        tracks = list(executor.map(lambda _: sp.get_a_track('a'),
+                                   range(CALLERS)))
+
+    assert len(transport.requests) == 1
+    assert [track.id for track in tracks] == ['a'] * CALLERS
+
+
+def test_failed_leader_fails_its_followers(make_client):
+    def handler(http_method, url, params, json_body):
+        wait_for(lambda: sp.single_flight.coalesced == CALLERS - 1)
+        raise ConnectionError('connection reset')
+
+    sp, transport = make_client(handler)
+
+    with ThreadPoolExecutor(CALLERS) as executor:
+        results = list(executor.map(lambda _: sp.get_a_track('a'),
+                                    range(CALLERS)))
+
+    assert len(transport.requests) == 1
+    assert all(isinstance(result, ErrorObject) and
+               result.message == 'connection reset' for result in results)
+
+
+def test_leader_exception_is_raised_in_every_caller():
+    single_flight = SingleFlight()
+    started = threading.Event()
+
+    def fail():
+        started.set()
+        wait_for(lambda: single_flight.coalesced == 1)
+        raise ValueError('boom')
+
+    with ThreadPoolExecutor(2) as executor:
+        leader = executor.submit(single_flight.do, 'key', fail)
+        started.wait()
+        follower = executor.submit(single_flight.do, 'key', fail)
+        for future in (leader, follower):
+            with pytest.raises(ValueError, match='boom'):
+                future.result()
+
+    assert single_flight.do('key', lambda: 'again') == 'again'
+
+
+def test_writes_are_not_coalesced(make_client):
+    barrier = threading.Barrier(CALLERS, timeout=2)
+
+    def handler(http_method, url, params, json_body):
+        barrier.wait()
+        return FakeResponse(200)
+
+    sp, transport = make_client(handler)
+
+    with ThreadPoolExecutor(CALLERS) as executor:
+        results = list(executor.map(
+            lambda _: sp.save_tracks_for_users(['a']), range(CALLERS)))
+
+    assert results == [None] * CALLERS
+    assert len(transport.requests) == CALLERS
+    assert sp.single_flight.coalesced == 0
+
+
+def test_concurrent_async_gets_share_one_request(make_async_client):
+    def handler(http_method, url, params, json_body):
+        return FakeResponse(200, {'id': 'a', 'type': 'track'})
+
+    sp, requests = make_async_client(handler)
+
+    async def run():
+        return await asyncio.gather(*(sp.get_a_track('a')
+                                      for _ in range(CALLERS)))
+
+    tracks = asyncio.run(run())
+
+    assert len(requests) == 1
+    assert sp.single_flight.coalesced == CALLERS - 1
+    assert [track.id for track in tracks] == ['a'] * CALLERS
@@ -0,0 +1,67 @@
+import time
+
+import pytest
+
+from spotifywrapper.utilities import SpotifyAPIError
+from tests.unit.fakes import FakeLibrary
+
+IDS = [f'track{i}' for i in range(120)]
+
+
+def test_saves_are_sent_in_chunks_of_50(make_client):
+    library = FakeLibrary()
+    sp, _ = make_client(library)
+
+    with sp.library_queue('tracks', max_delay=60) as queue:
+        queue.save(IDS[100:])
+        queue.save(IDS[100:110])
+        queue.save(IDS[:100])
+
+    assert sorted(len(ids) for _, _, ids in library.writes) == [20, 50, 50]
+    assert library.ids('tracks') == set(IDS)
+    assert queue.requests == 3 and queue.pending == 0
+
+
+def test_toggling_an_id_sends_nothing(make_client):
+    library = FakeLibrary(tracks=IDS[:2])
+    sp, _ = make_client(library)
+
+    with sp.library_queue('tracks', max_delay=60) as queue:
+        queue.save(IDS[2:4])
+        queue.remove(IDS[:3])
+        queue.save(IDS[:1])
+        assert queue.pending == 2
+
+    assert sorted(library.writes) == [('DELETE', 'tracks', IDS[1:2]),
+                                      ('PUT', 'tracks', IDS[3:4])]
+    assert library.ids('tracks') == {IDS[0], IDS[3]}
+
+
+def test_partial_chunks_are_sent_after_max_delay(make_client):
+    library = FakeLibrary()
+    sp, _ = make_client(library)
+
+    with sp.library_queue('albums', max_delay=0.01) as queue:
+        queue.save(['album'])
+        deadline = time.monotonic() + 5
+        while not library.writes and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert library.writes == [('PUT', 'albums', ['album'])]
+
+
+def test_failed_request_raises_on_flush(make_client):
+    library = FakeLibrary()
+    library.error_status = 403
+    sp, _ = make_client(library)
+    queue = sp.library_queue('shows', max_delay=60)
+
+    queue.save(['show'])
+    with pytest.raises(SpotifyAPIError):
+        queue.close()
+
+
+def test_unknown_item_type(make_client):
+    sp, _ = make_client(FakeLibrary())
+
+    with pytest.raises(ValueError):
+        sp.library_queue('artists')
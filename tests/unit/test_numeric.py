@@ -0,0 +1,65 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from spotifywrapper.numeric import AUDIO_FEATURE_COLUMNS, \
+    audio_features_matrix  # noqa: E402
+from spotifywrapper.object_library import AudioAnalysisObject, \
+    AudioFeaturesObject  # noqa: E402
+
+
+def make_features(id_, tempo):
+    return dict(dict.fromkeys(AUDIO_FEATURE_COLUMNS, 1), id=id_, tempo=tempo,
+                duration_ms=200000)
+
+
+def test_empty_analysis():
+    analysis = AudioAnalysisObject({'segments': [], 'sections': []})
+
+    assert analysis.segments.shape == (0,)
+    assert analysis.segments['pitches'].shape == (0, 12)
+    assert analysis.sections.shape == (0,)
+    assert analysis.bars.shape == (0,)
+
+
+def test_null_and_missing_analysis_values():
+    analysis = AudioAnalysisObject({
+        'sections': [{'start': 0.5, 'duration': 2.0, 'confidence': None,
+                      'key': None, 'mode': 1}],
+        'segments': [{'start': 0.0, 'duration': 1.0,
+                      'pitches': [0.5] * 12, 'timbre': None}],
+    })
+
+    section = analysis.sections[0]
+    assert section['start'] == 0.5
+    assert np.isnan(section['confidence'])
+    assert section['key'] == -1
+    assert section['mode'] == 1
+    assert section['time_signature'] == -1
+    segment = analysis.segments[0]
+    assert segment['pitches'].tolist() == [0.5] * 12
+    assert np.isnan(segment['timbre']).all()
+
+
+def test_feature_matrix_layout():
+    features = [make_features('a', 120.0), None,
+                AudioFeaturesObject(make_features('b', 90.5))]
+
+    matrix = audio_features_matrix(features)
+
+    assert matrix.data.shape == (2, len(AUDIO_FEATURE_COLUMNS))
+    assert matrix.data.flags['C_CONTIGUOUS']
+    assert matrix.columns == AUDIO_FEATURE_COLUMNS
+    assert matrix.ids == ['a', 'b']
+    assert matrix.column('tempo').tolist() == [120.0, 90.5]
+    assert matrix.row('b')[AUDIO_FEATURE_COLUMNS.index('tempo')] == 90.5
+    assert len(audio_features_matrix([], columns=('tempo',))) == 0
+
+
+def test_float64_matrix_keeps_durations_exact():
+    features = [dict(make_features('a', 120.0), duration_ms=2 ** 24 + 1)]
+
+    assert audio_features_matrix(features).column('duration_ms')[0] \
+        == 2 ** 24
+    assert audio_features_matrix(features, dtype='float64').column(
+        'duration_ms')[0] == 2 ** 24 + 1
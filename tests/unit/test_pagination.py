@@ -0,0 +1,168 @@
+import asyncio
+import threading
+import time
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+
+from spotifywrapper.utilities import SpotifyAPIError
+from tests.unit.fakes import FakePlaylist, FakeResponse
+
+URIS = [f'spotify:track:{i}' for i in range(100)]
+
+
+class Pages:
+    """Answers the pages of a playlist of the URIS, keeping the offset of
+    each answered request. The page at fail_at fails and each page waits
+    delays[offset] seconds before it is answered."""
+
+    def __init__(self, fail_at=None, delays=None):
+        self.playlist = FakePlaylist(URIS)
+        self.fail_at = fail_at
+        self.delays = delays or {}
+        self.offsets = []
+
+    def __call__(self, http_method, url, params, json_body):
+        query = dict(parse_qsl(urlsplit(url).query), **params)
+        offset = int(query.get('offset', 0))
+        time.sleep(self.delays.get(offset, 0))
+        self.offsets.append(offset)
+        if offset == self.fail_at:
+            return FakeResponse(404, {'error': {'status': 404,
+                                                'message': 'Not found'}})
+        return self.playlist(http_method, url, params, json_body)
+
+
+def get_uris(pages):
+    return [item.track.uri for page in pages for item in page]
+
+
+def wait_for_producers(threads, timeout=5):
+    """Wait until only the given threads are left, returning whether they
+    were."""
+    deadline = time.monotonic() + timeout
+    while set(threading.enumerate()) - threads:
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.mark.parametrize('prefetch', [0, 3])
+def test_every_page_is_yielded_in_order(make_client, prefetch):
+    pages = Pages()
+    sp, _ = make_client(pages)
+
+    result = list(sp.iter_pages('get_a_playlists_items', 'p', limit=10,
+                                prefetch=prefetch))
+
+    assert get_uris(result) == URIS
+    assert pages.offsets == list(range(0, 100, 10))
+
+
+def test_pages_are_requested_on_demand(make_client):
+    pages = Pages()
+    sp, _ = make_client(pages)
+
+    iterator = sp.iter_pages('get_a_playlists_items', 'p', limit=10)
+    next(iterator)
+    next(iterator)
+
+    assert pages.offsets == [0, 10]
+
+
+@pytest.mark.parametrize('prefetch', [0, 2])
+def test_pages_stop_at_max_items(make_client, prefetch):
+    pages = Pages()
+    sp, _ = make_client(pages)
+
+    result = list(sp.iter_pages('get_a_playlists_items', 'p', limit=10,
+                                prefetch=prefetch, max_items=25))
+
+    assert get_uris(result) == URIS[:30]
+    assert pages.offsets == [0, 10, 20]
+
+
+def test_items_stop_at_max_items(make_client):
+    sp, _ = make_client(Pages())
+
+    items = list(sp.iter_items('get_a_playlists_items', 'p', limit=10,
+                               prefetch=2, max_items=25))
+
+    assert [item.track.uri for item in items] == URIS[:25]
+
+
+def test_producer_exits_when_the_consumer_stops(make_client):
+    threads = set(threading.enumerate())
+    pages = Pages()
+    sp, _ = make_client(pages)
+
+    iterator = sp.iter_pages('get_a_playlists_items', 'p', limit=1,
+                             prefetch=2)
+    next(iterator)
+    iterator.close()
+
+    assert wait_for_producers(threads)
+    assert len(pages.offsets) < len(URIS)
+
+
+@pytest.mark.parametrize('prefetch', [0, 2])
+def test_failed_page_raises_after_the_previous_pages(make_client, prefetch):
+    sp, _ = make_client(Pages(fail_at=20))
+    result = []
+
+    with pytest.raises(SpotifyAPIError):
+        for page in sp.iter_pages('get_a_playlists_items', 'p', limit=10,
+                                  prefetch=prefetch):
+            result.append(page)
+
+    assert get_uris(result) == URIS[:20]
+
+
+def test_async_pages_stop_at_max_items(make_async_client):
+    pages = Pages()
+    sp, _ = make_async_client(pages)
+
+    async def collect():
+        return [page async for page in sp.iter_pages(
+            'get_a_playlists_items', 'p', limit=10, prefetch=2,
+            max_items=25)]
+
+    assert get_uris(asyncio.run(collect())) == URIS[:30]
+    assert pages.offsets == [0, 10, 20]
+
+
+def test_fetch_all_keeps_the_order_of_the_pages(make_client):
+    pages = Pages(delays={10: 0.05, 20: 0.03, 30: 0.01})
+    sp, _ = make_client(pages)
+
+    items = sp.fetch_all('get_a_playlists_items', 'p', limit=10,
+                         max_workers=4)
+
+    assert [item.track.uri for item in items] == URIS
+    assert sorted(pages.offsets) == list(range(0, 100, 10))
+    assert pages.offsets != sorted(pages.offsets)
+
+
+def test_fetch_all_raises_a_failed_page(make_client):
+    sp, _ = make_client(Pages(fail_at=50))
+
+    with pytest.raises(SpotifyAPIError):
+        sp.fetch_all('get_a_playlists_items', 'p', limit=10, max_workers=4)
+
+
+def test_fetch_all_needs_an_offset(make_client):
+    sp, _ = make_client(Pages())
+
+    with pytest.raises(ValueError):
+        sp.fetch_all('get_a_playlist', 'p')
+
+
+def test_async_fetch_all_keeps_the_order_of_the_pages(make_async_client):
+    pages = Pages(delays={10: 0.02})
+    sp, _ = make_async_client(pages)
+
+    items = asyncio.run(sp.fetch_all('get_a_playlists_items', 'p', limit=10,
+                                     max_concurrency=4))
+
+    assert [item.track.uri for item in items] == URIS
@@ -0,0 +1,61 @@
+import pytest
+
+from spotifywrapper.playlist import plan_additions, \
+    plan_positional_removals, plan_removals
+from spotifywrapper.utilities import SpotifyAPIError
+from tests.unit.fakes import FakePlaylist
+
+URIS = [f'spotify:track:{i}' for i in range(250)]
+
+
+def test_additions_are_chunked_in_order():
+    chunks = plan_additions(URIS, position=10)
+
+    assert [len(chunk) for chunk, _ in chunks] == [100, 100, 50]
+    assert [position for _, position in chunks] == [10, 110, 210]
+    assert [uri for chunk, _ in chunks for uri in chunk] == URIS
+    assert [position for _, position in plan_additions(URIS)] == [None] * 3
+
+
+def test_removals_send_each_uri_once():
+    bodies = plan_removals(URIS[:150] + URIS[:10])
+
+    assert [len(body) for body in bodies] == [100, 50]
+
+
+def test_positional_removals_start_from_the_end():
+    bodies = plan_positional_removals([('a', 1), ('b', 150), ('a', 3)])
+
+    assert bodies == [[{'uri': 'b', 'positions': [150]},
+                       {'uri': 'a', 'positions': [3, 1]}]]
+
+
+def test_writes_chain_the_snapshot_id(make_client):
+    playlist = FakePlaylist(URIS[:5])
+    sp, _ = make_client(playlist)
+
+    with sp.playlist_writer('p', playlist.snapshot_id) as writer:
+        writer.add(URIS[5:250])
+        writer.reorder(0, 3, 2)
+        writer.remove(URIS[100:120])
+        writer.remove_at([(URIS[2], 0)])
+        snapshot_id = writer.flush()
+
+    expected = URIS[2:3] + URIS[0:2] + URIS[3:100] + URIS[120:250]
+    assert playlist.uris == expected[1:]
+    assert snapshot_id == writer.snapshot_id == playlist.snapshot_id
+    assert writer.requests == len(playlist.writes) == 6
+
+
+def test_failed_write_skips_the_following_ones(make_client):
+    playlist = FakePlaylist(URIS[:5])
+    sp, _ = make_client(playlist)
+    writer = sp.playlist_writer('p', 'outdated')
+
+    writer.reorder(0, 3)
+    writer.add(URIS[5:10])
+    with pytest.raises(SpotifyAPIError):
+        writer.close()
+
+    assert playlist.uris == URIS[:5]
+    assert playlist.writes == []
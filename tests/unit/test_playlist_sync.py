@@ -0,0 +1,125 @@
+import asyncio
+import random
+
+import pytest
+
+from spotifywrapper.playlist import plan_positional_removals
+from spotifywrapper.playlist_sync import diff_playlist, \
+    longest_increasing_subsequence
+from tests.unit.fakes import FakePlaylist
+
+
+def apply(current, diff):
+    """Return the items after the writes of the diff, positions as the Web
+    API reads them."""
+    items = list(current)
+    for body in plan_positional_removals(diff.removals):
+        positions = []
+        for track in body:
+            assert all(items[p] == track['uri'] for p in track['positions'])
+            positions.extend(track['positions'])
+        for position in sorted(positions, reverse=True):
+            del items[position]
+    for range_start, insert_before, range_length in diff.moves:
+        assert not range_start <= insert_before <= range_start + range_length
+        moved = items[range_start:range_start + range_length]
+        del items[range_start:range_start + range_length]
+        if insert_before > range_start:
+            insert_before -= range_length
+        items[insert_before:insert_before] = moved
+    for position, uris in diff.insertions:
+        items[position:position] = uris
+    return items
+
+
+def shuffle_a_few(items, rng):
+    """Return the items with a few of them moved elsewhere."""
+    items = list(items)
+    for _ in range(rng.randint(0, 3)):
+        if items:
+            item = items.pop(rng.randrange(len(items)))
+            items.insert(rng.randrange(len(items) + 1), item)
+    return items
+
+
+def random_orderings(count, seed=0):
+    """Return (current, target) pairs of random uris with duplicates."""
+    rng = random.Random(seed)
+    orderings = []
+    for _ in range(count):
+        pool = [f'spotify:track:{i}' for i in range(rng.randint(1, 30))]
+        current = [rng.choice(pool) for _ in range(rng.randint(0, 40))]
+        if rng.random() < 0.5:
+            target = shuffle_a_few(current, rng)
+        else:
+            target = [rng.choice(pool) for _ in range(rng.randint(0, 40))]
+        orderings.append((current, target))
+    return orderings
+
+
+@pytest.mark.parametrize('current,target', random_orderings(300))
+def test_diff_turns_current_into_target(current, target):
+    assert apply(current, diff_playlist(current, target)) == target
+
+
+def test_diff_of_equal_playlists_is_empty():
+    items = [f'spotify:track:{i}' for i in range(300)]
+
+    assert not diff_playlist(items, items)
+    assert diff_playlist(items, items).requests == 0
+
+
+def test_diff_moves_a_rotation_in_one_request():
+    items = [f'spotify:track:{i}' for i in range(5000)]
+
+    diff = diff_playlist(items, items[2500:] + items[:2500])
+
+    assert diff.requests == 1
+    assert not diff.removals and not diff.insertions
+
+
+def test_longest_increasing_subsequence():
+    values = [3, 1, 4, 1, 5, 9, 2, 6]
+
+    indices = longest_increasing_subsequence(values)
+
+    assert len(indices) == 4
+    assert all(values[i] < values[j] for i, j in zip(indices, indices[1:]))
+    assert longest_increasing_subsequence([]) == []
+
+
+@pytest.mark.parametrize('current,target', random_orderings(20, seed=1))
+def test_sync_playlist_reaches_the_target(make_client, current, target):
+    playlist = FakePlaylist(current)
+    sp, _ = make_client(playlist)
+
+    diff, snapshot_id = sp.sync_playlist('p', target)
+
+    assert playlist.uris == target
+    assert snapshot_id == playlist.snapshot_id
+    assert len(playlist.writes) == diff.requests
+    diff, second_snapshot_id = sp.sync_playlist('p', target)
+    assert not diff and second_snapshot_id == snapshot_id
+
+
+def test_sync_playlist_pages_and_chunks(make_client):
+    current = [f'spotify:track:{i}' for i in range(450)]
+    target = [f'spotify:track:{i}' for i in range(200, 700)]
+    playlist = FakePlaylist(current)
+    sp, _ = make_client(playlist)
+
+    _, snapshot_id = sp.sync_playlist('p', target)
+
+    assert playlist.uris == target
+    assert snapshot_id == playlist.snapshot_id
+
+
+def test_async_sync_playlist_reaches_the_target(make_async_client):
+    [(current, target)] = random_orderings(1, seed=2)
+    playlist = FakePlaylist(current)
+    sp, _ = make_async_client(playlist)
+
+    _, snapshot_id = asyncio.run(sp.sync_playlist('p', target))
+
+    assert playlist.uris == target
+    assert snapshot_id == playlist.snapshot_id
@@ -0,0 +1,45 @@
+import pytest
+
+from spotifywrapper.object_library import PlaylistObject, \
+    PlaylistTrackObject
+from spotifywrapper.projection import NotProjectedError, PAGING_KEYS, \
+    Projection
+from tests.unit.fakes import FakeResponse, filter_fields, parse_fields
+
+PAGE = {'href': 'https://api.spotify.com/v1/playlists/p/tracks',
+        'limit': 100, 'next': None, 'offset': 0, 'previous': None,
+        'total': 2}
+
+
+def handle_playlist(http_method, url, params, json_body):
+    tracks = dict(PAGE, items=[{'track': {'id': '1', 'name': 'One'}},
+                               {'track': {'id': '2', 'name': 'Two'}}])
+    playlist = {'name': 'Mix', 'description': 'Songs', 'tracks': tracks}
+    return FakeResponse(200, filter_fields(playlist,
+                                           parse_fields(params['fields'])))
+
+
+def test_nested_page_requests_paging_keys():
+    fields = Projection(PlaylistObject, 'name', 'tracks.items.track.id')
+
+    assert fields == ('name,tracks(items(track(id,type)),'
+                      + ','.join(PAGING_KEYS) + ')')
+
+
+def test_items_projection_requests_paging_keys():
+    fields = Projection.items(PlaylistTrackObject, 'track.id')
+
+    assert fields == ','.join(PAGING_KEYS) + ',items(track(id,type))'
+
+
+def test_projected_playlist_walks_its_tracks(make_client):
+    sp, _ = make_client(handle_playlist)
+    fields = Projection(PlaylistObject, 'name', 'tracks.items.track.id')
+
+    playlist = sp.get_a_playlist('p', fields=fields)
+
+    assert playlist.name == 'Mix'
+    assert playlist.tracks.total == 2
+    assert [item.track.id for item in playlist.tracks] == ['1', '2']
+    with pytest.raises(NotProjectedError):
+        playlist.description
@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+from spotifywrapper.saved_items import SavedItemsIndex
+from tests.unit.fakes import FakeLibrary
+
+IDS = [f'track{i}' for i in range(200)]
+
+
+def gets(transport):
+    return [params for method, _, params, _ in transport.requests
+            if method == 'GET']
+
+
+def test_loaded_type_answers_checks_without_a_request(make_client):
+    library = FakeLibrary(tracks=IDS)
+    sp, transport = make_client(library, saved_index=SavedItemsIndex())
+
+    sp.refresh_saved_items(['tracks'])
+    sent = len(transport.requests)
+
+    assert sp.check_users_saved_tracks(['track0', 'track199', 'other']) \
+        == [True, True, False]
+    assert len(transport.requests) == sent
+    assert sp.saved_index.is_loaded('tracks')
+    assert len(sp.saved_index) == 200
+    assert sp.saved_index.get_newest('tracks') == library.saved['tracks'][0][1]
+
+
+def test_unloaded_type_is_checked_with_a_request(make_client):
+    library = FakeLibrary(albums=['album'])
+    sp, transport = make_client(library, saved_index=SavedItemsIndex())
+
+    assert sp.check_users_saved_albums(['album']) == [True]
+    assert len(transport.requests) == 1
+    with pytest.raises(ValueError):
+        sp.saved_index.contains('albums', ['album'])
+
+
+def test_saves_and_removals_are_recorded(make_client):
+    sp, _ = make_client(FakeLibrary(tracks=IDS[:10]),
+                        saved_index=SavedItemsIndex())
+    sp.refresh_saved_items(['tracks'])
+
+    sp.save_tracks_for_users(['new'])
+    sp.remove_users_saved_tracks(['track0'])
+
+    assert sp.saved_index.contains('tracks', ['new', 'track0', 'track1']) \
+        == [True, False, True]
+
+
+def test_failed_write_is_not_recorded(make_client):
+    library = FakeLibrary(tracks=IDS[:10])
+    sp, _ = make_client(library, saved_index=SavedItemsIndex())
+    sp.refresh_saved_items(['tracks'])
+    library.error_status = 403
+
+    sp.save_tracks_for_users(['new'])
+
+    assert sp.saved_index.contains('tracks', ['new']) == [False]
+
+
+def test_incremental_refresh_stops_at_the_newest_item(make_client):
+    library = FakeLibrary(tracks=IDS)
+    sp, transport = make_client(library, saved_index=SavedItemsIndex())
+    sp.refresh_saved_items(['tracks'])
+    library.save('tracks', ['new0', 'new1', 'new2'])
+    transport.requests.clear()
+
+    sp.refresh_saved_items(['tracks'])
+
+    assert len(gets(transport)) == 1
+    assert sp.saved_index.contains('tracks', ['new0', 'new2', 'track0']) \
+        == [True, True, True]
+    assert sp.saved_index.get_newest('tracks') == library.saved['tracks'][0][1]
+
+
+def test_refresh_replaces_the_type_when_items_were_removed(make_client):
+    library = FakeLibrary(tracks=IDS)
+    sp, transport = make_client(library, saved_index=SavedItemsIndex())
+    sp.refresh_saved_items(['tracks'])
+    library.remove('tracks', ['track5'])
+    library.save('tracks', ['new'])
+    transport.requests.clear()
+
+    sp.refresh_saved_items(['tracks'])
+
+    assert len(gets(transport)) > 1
+    assert sp.saved_index.contains('tracks', ['new', 'track5', 'track6']) \
+        == [True, False, True]
+    assert len(sp.saved_index) == 200
+
+
+def test_refresh_needs_an_index(make_client):
+    sp, _ = make_client(FakeLibrary())
+
+    with pytest.raises(ValueError):
+        sp.refresh_saved_items(['tracks'])
+
+
+def test_async_refresh(make_async_client):
+    library = FakeLibrary(shows=IDS[:60])
+    sp, requests = make_async_client(library, saved_index=SavedItemsIndex())
+
+    async def refresh_twice():
+        await sp.refresh_saved_items(['shows'])
+        library.save('shows', ['new'])
+        await sp.refresh_saved_items(['shows'])
+        return await sp.check_users_saved_shows(['new', 'track59', 'other'])
+
+    assert asyncio.run(refresh_twice()) == [True, True, False]
+    assert len(requests) == 3
@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+
+from spotifywrapper.scheduler import RequestScheduler
+from tests.unit.fakes import FakeResponse
+
+
+def make_scheduler(**kwargs) -> RequestScheduler:
+    return RequestScheduler(rate=1e9, burst=10 ** 9, backoff_factor=0,
+                            **kwargs)
+
+
+def test_async_waiters_get_slots_in_order():
+    scheduler = make_scheduler(max_in_flight=2)
+    sent, in_flight, peak = [], [0], [0]
+
+    async def request(i):
+        async def send():
+            sent.append(i)
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+            return FakeResponse(200)
+
+        return await scheduler.async_send(send)
+
+    async def run():
+        await asyncio.gather(*(request(i) for i in range(20)))
+
+    asyncio.run(run())
+
+    assert sent == list(range(20))
+    assert peak[0] == 2
+    assert scheduler._in_flight == 0
+
+
+def test_cancelled_async_waiter_does_not_keep_a_slot():
+    scheduler = make_scheduler(max_in_flight=1)
+
+    async def send():
+        await asyncio.sleep(0.01)
+        return FakeResponse(200)
+
+    async def run():
+        first = asyncio.ensure_future(scheduler.async_send(send))
+        waiting = asyncio.ensure_future(scheduler.async_send(send))
+        await asyncio.sleep(0)
+        waiting.cancel()
+        await first
+        return await asyncio.wait_for(scheduler.async_send(send), 1)
+
+    assert asyncio.run(run()).status_code == 200
+    assert scheduler._in_flight == 0
+
+
+def test_retried_responses_are_closed():
+    scheduler = make_scheduler(max_retries=2)
+    responses = [FakeResponse(503), FakeResponse(429), FakeResponse(200)]
+    sent = iter(responses)
+
+    response = scheduler.send(lambda: next(sent))
+
+    assert response is responses[2]
+    assert [r.closed for r in responses] == [True, True, False]
+
+
+@pytest.mark.parametrize('http_method, sent', [('GET', 2), ('PUT', 2),
+                                               ('DELETE', 2), ('POST', 1)])
+def test_5xx_is_only_retried_for_idempotent_methods(http_method, sent):
+    scheduler = make_scheduler()
+    responses = iter([FakeResponse(502), FakeResponse(200)])
+    calls = []
+
+    def send():
+        calls.append(http_method)
+        return next(responses)
+
+    scheduler.send(send, http_method)
+
+    assert len(calls) == sent
+
+
+def test_429_is_retried_for_every_method():
+    scheduler = make_scheduler()
+    responses = iter([FakeResponse(429, headers={'Retry-After': '0'}),
+                      FakeResponse(201)])
+
+    assert scheduler.send(lambda: next(responses), 'POST').status_code == 201
+    assert scheduler.rate_limited == 1
+
+
+def test_default_scheduler_does_not_pace_or_cap_requests():
+    scheduler = RequestScheduler()
+
+    async def send():
+        await asyncio.sleep(0.05)
+        return FakeResponse(200)
+
+    async def run():
+        await asyncio.gather(*(scheduler.async_send(send)
+                               for _ in range(200)))
+
+    asyncio.run(run())
+
+    assert scheduler.throttled_seconds == 0
+    assert scheduler.requests == 200
@@ -0,0 +1,79 @@
+from unittest import mock
+
+import pytest
+
+from spotifywrapper import serialization
+from spotifywrapper.object_library import PlaylistTrackObject, TrackObject
+from spotifywrapper.projection import NotProjectedError, PartialDict, \
+    Projection
+from spotifywrapper.serialization import dumps, dumps_many, loads, \
+    loads_many
+from tests.unit.fakes import FakeResponse, filter_fields, parse_fields
+
+TRACK = {'id': 't', 'uri': 'spotify:track:t', 'name': 'Song',
+         'type': 'track'}
+PAGE = {'href': 'h', 'limit': 2, 'next': None, 'offset': 0,
+        'previous': None, 'total': 2,
+        'items': [{'added_at': '2024-01-01T00:00:00.000Z', 'track': TRACK},
+                  {'added_at': '2024-01-02T00:00:00.000Z', 'track': None}]}
+
+
+@pytest.fixture(params=['msgpack', 'json'])
+def codec(request):
+    """Serialize with msgpack, or with json as if it was not installed."""
+    if request.param == 'msgpack':
+        pytest.importorskip('msgpack')
+        yield
+    else:
+        with mock.patch.object(serialization, 'msgpack', None):
+            yield
+
+
+def handle_page(http_method, url, params, json_body):
+    return FakeResponse(200, filter_fields(PAGE,
+                                           parse_fields(params['fields'])))
+
+
+def test_object_round_trip(codec):
+    track = loads(dumps(TrackObject(TRACK)))
+
+    assert type(track) is TrackObject
+    assert track._json_dict == TRACK
+    assert type(track._json_dict) is dict
+
+
+def test_projected_page_stays_partial(make_client, codec):
+    sp, _ = make_client(handle_page)
+    fields = Projection.items(PlaylistTrackObject, 'track.id')
+    page = sp.get_a_playlists_items('p', fields=fields)
+
+    loaded = loads(dumps(page))
+
+    assert loaded._json_dict == page._json_dict
+    assert isinstance(loaded._json_dict, PartialDict)
+    assert loaded._json_dict.tree == fields.tree
+    assert loaded.total == 2
+    assert loaded[0].track.id == 't'
+    assert loaded[1].track is None
+    with pytest.raises(NotProjectedError):
+        loaded[0].added_at
+    with pytest.raises(NotProjectedError):
+        loaded[0].track.name
+
+
+def test_many_objects_round_trip(make_client, codec):
+    sp, _ = make_client(handle_page)
+    page = sp.get_a_playlists_items(
+        'p', fields=Projection.items(PlaylistTrackObject, 'added_at'))
+
+    track, item = loads_many(dumps_many([TrackObject(TRACK), page[0]]))
+
+    assert track.name == 'Song'
+    assert item.added_at.day == 1
+    with pytest.raises(NotProjectedError):
+        item.track
+
+
+def test_unknown_data():
+    with pytest.raises(ValueError):
+        loads(b'x')
@@ -0,0 +1,44 @@
+from spotifywrapper.object_library import EpisodeObject, \
+    PlaylistTrackObject, SpotifyObject, TrackObject, get_union_parser
+from spotifywrapper.projection import Projection
+from tests.unit.fakes import FakeResponse, filter_fields, parse_fields
+
+PARSER = get_union_parser(TrackObject, EpisodeObject)
+
+
+def test_union_dispatches_on_type():
+    assert type(PARSER({'type': 'track', 'id': 't'})) is TrackObject
+    assert type(PARSER({'type': 'episode', 'id': 'e'})) is EpisodeObject
+    assert PARSER(None) is None
+
+
+def test_union_fallback():
+    assert type(PARSER({'id': 't'})) is TrackObject
+    assert type(PARSER({'type': 'chapter', 'id': 'c'})) is SpotifyObject
+
+
+def test_projection_requests_the_type_of_a_union():
+    fields = Projection.items(PlaylistTrackObject, 'track.id')
+
+    assert 'track(id,type)' in fields
+
+
+def test_projected_episode_is_an_episode(make_client):
+    page = {'href': 'h', 'limit': 2, 'next': None, 'offset': 0,
+            'previous': None, 'total': 2,
+            'items': [{'track': {'type': 'track', 'id': 't', 'name': 'T'}},
+                      {'track': {'type': 'episode', 'id': 'e',
+                                 'name': 'E'}}]}
+
+    def handler(http_method, url, params, json_body):
+        return FakeResponse(200, filter_fields(
+            page, parse_fields(params['fields'])))
+
+    sp, _ = make_client(handler)
+    fields = Projection.items(PlaylistTrackObject, 'track.id')
+
+    items = sp.get_a_playlists_items('p', fields=fields)
+
+    assert [type(item.track) for item in items] == [TrackObject,
+                                                    EpisodeObject]
+    assert [item.track.id for item in items] == ['t', 'e']